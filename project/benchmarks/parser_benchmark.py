@@ -0,0 +1,95 @@
+"""Benchmark of the query parsers.
+
+Measures the throughput of parsing and compiling the queries under queries/
+into execution plans, once with the parsimonious grammar and the ASTVisitor
+(parser.parse_query and compiler.compile_with_parameters) and once with the
+recursive-descent parser (parser.compile_query), which is used by the
+query executor.
+
+Usage (from the project directory):
+    PYTHONPATH=src python benchmarks/parser_benchmark.py [--repetitions N]
+"""
+
+import argparse
+from glob import glob
+import os
+from time import perf_counter
+
+from mosaic import parser
+from mosaic import table_service
+from mosaic.compiler import compiler
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUERY_DIRECTORY = os.path.join(PROJECT_DIRECTORY, "queries")
+TABLE_DIRECTORY = os.path.join(PROJECT_DIRECTORY, "data", "kemper")
+
+
+def load_queries(query_directory):
+    """Returns the queries of all .mql files in the given directory."""
+    queries = []
+
+    for file_path in sorted(glob(os.path.join(query_directory, "**", "*.mql"), recursive=True)):
+        with open(file_path, 'r') as query_file:
+            queries += [query.strip() for query in query_file.read().split(";") if query.strip()]
+
+    return queries
+
+
+def build_nested_query(depth):
+    """Returns a query of nested selections and parens over a join, e.g. for depth 1:
+    sigma (hoeren.MatrNr > 0 and (hoeren.VorlNr < 1 or hoeren.VorlNr > 0)) (hoeren natural join vorlesungen)
+    """
+    query = "hoeren natural join vorlesungen"
+    for i in range(depth):
+        query = f"sigma (hoeren.MatrNr > {i} and (hoeren.VorlNr < {i + 1} or hoeren.VorlNr > {i})) ({query})"
+
+    return query
+
+
+def compile_with_grammar(query):
+    parsing_result = parser.parse_query(query)
+    if parsing_result.has_error():
+        raise ValueError(parsing_result.error)
+
+    return compiler.compile_with_parameters(parsing_result.ast)
+
+
+def measure(compile_function, queries, repetitions):
+    """Returns the number of queries that are compiled per second with the given function."""
+    start = perf_counter()
+
+    for _ in range(repetitions):
+        for query in queries:
+            compile_function(query)
+
+    return repetitions * len(queries) / (perf_counter() - start)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    argument_parser.add_argument("--repetitions", type=int, default=200,
+                                 help="number of times every query is compiled")
+    argument_parser.add_argument("--depth", type=int, default=20,
+                                 help="nesting depth of the generated nested query")
+    arguments = argument_parser.parse_args()
+
+    table_service.load_tables_from_directory(TABLE_DIRECTORY)
+
+    nested_query = build_nested_query(arguments.depth)
+    workloads = [
+        (f"queries/ ({len(load_queries(QUERY_DIRECTORY))} queries)", load_queries(QUERY_DIRECTORY)),
+        (f"nested query ({len(nested_query)} characters)", [nested_query]),
+    ]
+
+    for name, queries in workloads:
+        grammar_throughput = measure(compile_with_grammar, queries, arguments.repetitions)
+        parser_throughput = measure(parser.compile_query, queries, arguments.repetitions)
+
+        print(name)
+        print(f"  parsimonious grammar:     {grammar_throughput:10.1f} queries/s")
+        print(f"  recursive-descent parser: {parser_throughput:10.1f} queries/s "
+              f"({parser_throughput / grammar_throughput:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -130,12 +130,16 @@ def _main_loop():
             click.secho(tb, fg='red')
 
 
-def _load_initial_data(data_directory):
+def _load_initial_data(data_directory, columnar=False, lazy=False, memory_limit=None, cache_directory=None,
+                       rebuild_cache=False):
     """
     Function that loads the initial data at cli startup based on the provided data directory.
     """
     try:
-        not_loaded = table_service.load_tables_from_directory(data_directory)
+        not_loaded = table_service.load_tables_from_directory(data_directory, columnar, lazy=lazy,
+                                                              memory_limit=memory_limit,
+                                                              cache_directory=cache_directory,
+                                                              rebuild_cache=rebuild_cache)
         if len(not_loaded) > 0:
             click.secho("Error: Following files could not be loaded: ", fg="red")
             for file in not_loaded:
@@ -163,11 +167,19 @@ def _execute_initial_query_file(query_file_path):
 @click.option("--query-file", default=None, type=click.Path(exists=True),
               help="Path to an optional query file to execute")
 @click.option("--optimize", is_flag=True, help="Enables the optimizer")
-def main(data_directory, query_file, optimize):
+@click.option("--columnar", is_flag=True, help="Stores the loaded tables column by column to reduce memory usage")
+@click.option("--lazy", is_flag=True, help="Loads the data of the tables when they are used for the first time")
+@click.option("--memory-limit", default=None, type=click.IntRange(min=0),
+              help="Memory limit (in MB) for lazily loaded tables, the least recently used tables are unloaded")
+@click.option("--cache-directory", default=None, type=click.Path(file_okay=False),
+              help="Optional directory for the snapshots of the parsed tables, which are loaded at the next startup")
+@click.option("--rebuild-cache", is_flag=True, help="Parses all tables again instead of loading their snapshots")
+def main(data_directory, query_file, optimize, columnar, lazy, memory_limit, cache_directory, rebuild_cache):
     """
     Function that executes on program startup. Loads initial data and optionally executes a query file.
     """
-    _load_initial_data(data_directory)
+    _load_initial_data(data_directory, columnar, lazy, None if memory_limit is None else memory_limit * 1024 * 1024,
+                       cache_directory, rebuild_cache)
 
     global _optimizer_enabled
     _optimizer_enabled = optimize
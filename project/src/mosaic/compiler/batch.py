@@ -0,0 +1,53 @@
+BATCH_SIZE = 4096
+
+
+class Batch:
+    """
+    Class that represents a batch of records in columnar form, used for vectorized execution.
+    Instead of removing records, filters only update the selection vector of the batch.
+    This class has the following properties:
+    columns: [[float | int | str]] - the values of the batch, column by column
+    num_records: int - the number of records in the columns
+    selection: [int] - selection vector, that contains the positions of the records which are still selected
+    """
+
+    def __init__(self, columns, num_records, selection=None):
+        self.columns = columns
+        self.num_records = num_records
+        self.selection = range(num_records) if selection is None else selection
+
+    @staticmethod
+    def from_records(records):
+        """
+        Builds a batch from the given list of records by transposing them into columns
+        """
+        return Batch([list(column) for column in zip(*records)], len(records))
+
+    def select(self, selection):
+        """
+        Returns a batch sharing the columns with this batch, but with the given selection vector
+        """
+        return Batch(self.columns, self.num_records, selection)
+
+    def get_column(self, column_index):
+        """
+        Returns the values of the selected records for the column with the given index
+        """
+        column = self.columns[column_index]
+
+        if len(self.selection) == self.num_records:
+            return column
+
+        return list(map(column.__getitem__, self.selection))
+
+    def get_records(self):
+        """
+        Generator that returns the selected records of the batch as lists of values
+        """
+        columns = [self.get_column(i) for i in range(len(self.columns))]
+
+        for values in zip(*columns):
+            yield list(values)
+
+    def __len__(self):
+        return len(self.selection)
@@ -15,6 +15,8 @@ from mosaic.compiler.expressions.conjunctive_expression import ConjunctiveExpres
 from mosaic.compiler.expressions.disjunctive_expression import DisjunctiveExpression
 from mosaic.compiler.operators.explain import Explain
 from mosaic.compiler.expressions.literal_expression import LiteralExpression
+from mosaic.compiler.expressions.parameter_expression import ParameterExpression, QueryParameters, \
+    check_no_parameters
 from mosaic.compiler.operators.hash_distinct import HashDistinct
 from mosaic.compiler.operators.nested_loops_join import NestedLoopsJoin
 from mosaic.compiler.operators.abstract_join import JoinType
@@ -24,7 +26,7 @@ from mosaic.compiler.operators.selection import Selection
 from mosaic.compiler.operators.set_operators import SetOperationType, Union, Intersect, Except
 from mosaic.compiler.operators.table_scan import TableScan
 from mosaic.compiler.operators.hash_aggregate import AggregateFunction
-from mosaic.compiler.operators.hash_aggregate import HashAggregate
+from mosaic.compiler.operators.hash_aggregate import HashAggregate, extract
 
 
 ###########################################################
@@ -38,6 +40,10 @@ class ASTVisitor(NodeVisitor):
     # so that parsimonious does not wrap it inside a VisitationError.
     unwrapped_exceptions = (CompilerException,)
 
+    def __init__(self):
+        # the parameters of the query that is currently compiled
+        self.parameters = QueryParameters()
+
     ####################
     # Literals
     ####################
@@ -56,6 +62,18 @@ class ASTVisitor(NodeVisitor):
     def visit_literal(self, node, visited_children):
         return visited_children[0]
 
+    ####################
+    # Parameters
+    ####################
+    def visit_positional_parameter(self, node, visited_children):
+        return ParameterExpression(self.parameters.add_positional(), self.parameters)
+
+    def visit_named_parameter(self, node, visited_children):
+        return ParameterExpression(self.parameters.add_named(node.text.strip()[1:]), self.parameters)
+
+    def visit_parameter(self, node, visited_children):
+        return visited_children[0]
+
     ####################
     # Operators
     ####################
@@ -96,12 +114,10 @@ class ASTVisitor(NodeVisitor):
                     left = ArithmeticExpression(left,
                                                 ArithmeticOperator.TIMES,
                                                 right)
-                    break
                 elif operator == '/':
                     left = ArithmeticExpression(left,
                                                 ArithmeticOperator.DIVIDE,
                                                 right)
-                    break
 
             return left
         else:
@@ -123,12 +139,10 @@ class ASTVisitor(NodeVisitor):
                     left = ArithmeticExpression(left,
                                                 ArithmeticOperator.ADD,
                                                 right)
-                    break
                 elif operator == '-':
                     left = ArithmeticExpression(left,
                                                 ArithmeticOperator.SUBTRACT,
                                                 right)
-                    break
 
             return left
         else:
@@ -150,32 +164,26 @@ class ASTVisitor(NodeVisitor):
                     left = ComparativeExpression(left,
                                                  ComparativeOperator.EQUAL,
                                                  right)
-                    break
                 elif operator == '!=':
                     left = ComparativeExpression(left,
                                                  ComparativeOperator.NOT_EQUAL,
                                                  right)
-                    break
                 elif operator == '<':
                     left = ComparativeExpression(left,
                                                  ComparativeOperator.SMALLER,
                                                  right)
-                    break
                 elif operator == '<=':
                     left = ComparativeExpression(left,
                                                  ComparativeOperator.SMALLER_EQUAL,
                                                  right)
-                    break
                 elif operator == '>':
                     left = ComparativeExpression(left,
                                                  ComparativeOperator.GREATER,
                                                  right)
-                    break
                 elif operator == '>=':
                     left = ComparativeExpression(left,
                                                  ComparativeOperator.GREATER_EQUAL,
                                                  right)
-                    break
 
             return left
         else:
@@ -267,11 +275,13 @@ class ASTVisitor(NodeVisitor):
         if len(visited_children[0]) == 6:
             table_reference = visited_children[0][5]
             column_expressions = visited_children[0][4]
+            check_no_parameters(column_expressions, "projected columns")
 
             return HashDistinct(Projection(table_reference, column_expressions))
         else:
             table_reference = visited_children[0][3]
             column_expressions = visited_children[0][2]
+            check_no_parameters(column_expressions, "projected columns")
 
             return Projection(table_reference, column_expressions)
 
@@ -302,16 +312,23 @@ class ASTVisitor(NodeVisitor):
             group_columns = children[2]
             aggregate_columns = children[5]
             input_node = children[6]
+            check_no_parameters(group_columns, "group columns")
+            check_no_parameters([(name, expression) for name, _, expression in extract(aggregate_columns)],
+                                 "aggregates")
 
             return HashAggregate(input_node, group_columns, aggregate_columns)
         # Otherwise, we want to compute aggregates over the super group.
         else:
             aggregate_columns = children[4]
             input_node = children[5]
+            check_no_parameters([(name, expression) for name, _, expression in extract(aggregate_columns)],
+                                 "aggregates")
 
             return HashAggregate(input_node, [], aggregate_columns)
 
     def visit_ordering(self, node, visited_children):
+        check_no_parameters([(None, expression) for expression in visited_children[2]], "ordering columns")
+
         return Ordering(visited_children[3], visited_children[2])
 
     def visit_relation_reference(self, node, visited_children):
@@ -329,7 +346,7 @@ class ASTVisitor(NodeVisitor):
         return visited_children[0]
 
     def visit_set_operator(self, node, visited_children):
-        operator = node.text.strip()
+        operator = node.text.strip().lower()
         if operator == "union":
             return SetOperationType.UNION
         elif operator == "intersect":
@@ -338,13 +355,13 @@ class ASTVisitor(NodeVisitor):
             return SetOperationType.EXCEPT
 
     def visit_join_operator(self, node, visited_children):
-        if node.text == "join":
+        if node.text.lower() == "join":
             return JoinType.INNER
         else:
             return JoinType.LEFT_OUTER
 
     def visit_natural_join_operator(self, node, visited_children):
-        if node.text == "natural join":
+        if node.text.lower() == "natural join":
             return JoinType.INNER
         else:
             return JoinType.LEFT_OUTER
@@ -421,4 +438,15 @@ _visitor = ASTVisitor()
 
 
 def compile(ast):
-    return _visitor.visit(ast)
+    return compile_with_parameters(ast)[0]
+
+
+def compile_with_parameters(ast):
+    """
+    Compiles the given AST into an execution plan, whose parameter placeholders are bound with the returned
+    QueryParameters before every execution.
+    Returns a tuple (execution_plan, parameters)
+    """
+    _visitor.parameters = QueryParameters()
+
+    return _visitor.visit(ast), _visitor.parameters
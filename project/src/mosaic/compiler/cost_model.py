@@ -0,0 +1,227 @@
+from mosaic.table_service import AmbiguousColumnException, TableIndexException, retrieve_statistics
+from .expressions.column_expression import ColumnExpression
+from .expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from .expressions.conjunctive_expression import ConjunctiveExpression
+from .expressions.disjunctive_expression import DisjunctiveExpression
+from .expressions.literal_expression import LiteralExpression
+from .expressions.parameter_expression import ParameterExpression
+from .operators.abstract_join import AbstractJoin, JoinType
+from .operators.abstract_operator import AbstractOperator
+from .operators.hash_aggregate import HashAggregate
+from .operators.hash_join import HashJoin
+from .operators.index_nested_loops_join import IndexNestedLoopsJoin
+from .operators.index_range_seek import IndexRangeSeek
+from .operators.index_seek import IndexSeek
+from .operators.merge_join import MergeJoin
+from .operators.selection import Selection
+from .operators.set_operators import Union, Intersect, Except
+from .operators.table_scan import TableScan
+
+# selectivity of conditions that can not be estimated with the statistics of the tables
+DEFAULT_SELECTIVITY = 1 / 3
+
+# costs of the basic operations of the join algorithms, relative to building a result record
+HASH_BUILD_COST = 2.0
+HASH_PROBE_COST = 1.0
+# probing an existing index, whose records additionally need to be materialized for columnar tables
+INDEX_PROBE_COST = 1.5
+# evaluating the join condition for a pair of records
+NESTED_LOOPS_COST = 2.0
+# advancing in one of the sorted inputs of a merge join
+MERGE_COST = 1.0
+OUTPUT_COST = 1.0
+
+
+def estimate_num_records(node: AbstractOperator):
+    """
+    Estimates the number of records of the given node without executing it.
+    The estimation is based on the statistics of the tables (see table_service.retrieve_statistics) and assumes
+    that the values of different columns are independent of each other.
+    """
+    if isinstance(node, IndexSeek) and node.has_parameters():
+        return _estimate_parameterized_index_seek_num_records(node)
+    elif isinstance(node, (IndexSeek, IndexRangeSeek)):
+        return node.get_num_records()
+    elif isinstance(node, TableScan):
+        return retrieve_statistics(node.table_name).num_records
+    elif isinstance(node, Selection):
+        return estimate_num_records(node.node) * estimate_selectivity(node.condition, [node.node])
+    elif isinstance(node, AbstractJoin):
+        return _estimate_join_num_records(node)
+    elif isinstance(node, HashAggregate) and not node.group_names:
+        return 1
+    elif isinstance(node, Union):
+        return estimate_num_records(node.left_node) + estimate_num_records(node.right_node)
+    elif isinstance(node, Intersect):
+        return min(estimate_num_records(node.left_node), estimate_num_records(node.right_node))
+    elif isinstance(node, Except):
+        return estimate_num_records(node.left_node)
+
+    # projections, orderings, distincts and aggregations return at most as many records as their input
+    child_nodes = node.get_child_nodes()
+    return estimate_num_records(child_nodes[0]) if child_nodes else 1
+
+
+def _estimate_parameterized_index_seek_num_records(index_seek: IndexSeek):
+    """
+    Estimates the number of records of an index seek that compares (some of) the index columns with parameters,
+    whose values are not known until the seek is executed
+    """
+    statistics = retrieve_statistics(index_seek.table_name)
+    if statistics.num_records == 0:
+        return 0
+
+    num_records = statistics.num_records
+    for index_column, expression in zip(index_seek.index_columns, index_seek.comparison_expressions):
+        column_statistics = statistics.get_column_statistics(index_column)
+        if isinstance(expression, ParameterExpression):
+            equal_count = column_statistics.estimate_average_equal_count()
+        else:
+            equal_count = column_statistics.estimate_equal_count(expression.get_result())
+        num_records *= equal_count / statistics.num_records
+
+    return num_records
+
+
+def _estimate_join_num_records(join: AbstractJoin):
+    left_num_records = estimate_num_records(join.left_node)
+    right_num_records = estimate_num_records(join.right_node)
+
+    if join.join_type == JoinType.CROSS or join.condition is None:
+        return left_num_records * right_num_records
+
+    num_records = left_num_records * right_num_records * estimate_selectivity(
+        join.condition, [join.left_node, join.right_node])
+
+    if join.join_type == JoinType.LEFT_OUTER:
+        # every record of the left relation is part of the result at least once
+        return max(num_records, left_num_records)
+
+    return num_records
+
+
+def estimate_selectivity(condition, nodes):
+    """
+    Estimates the fraction of the records that fulfill the given condition.
+    The statistics of the referenced columns are searched in the given nodes (the inputs of the condition).
+    """
+    if isinstance(condition, LiteralExpression):
+        return 1.0 if condition.get_result() else 0.0
+    elif isinstance(condition, ConjunctiveExpression):
+        selectivity = 1.0
+        for sub_condition in condition.conditions:
+            selectivity *= estimate_selectivity(sub_condition, nodes)
+        return selectivity
+    elif isinstance(condition, DisjunctiveExpression):
+        non_selectivity = 1.0
+        for sub_condition in condition.conditions:
+            non_selectivity *= 1.0 - estimate_selectivity(sub_condition, nodes)
+        return 1.0 - non_selectivity
+    elif isinstance(condition, ComparativeExpression):
+        selectivity = _estimate_comparative_selectivity(condition, nodes)
+        if selectivity is not None:
+            return min(max(selectivity, 0.0), 1.0)
+
+    return DEFAULT_SELECTIVITY
+
+
+def _estimate_comparative_selectivity(condition: ComparativeExpression, nodes):
+    """
+    Estimates the selectivity of comparisons between a column and a literal and of equalities between two columns.
+    Equalities between a column and a parameter are estimated with the average number of records per value.
+    Returns None if it can not be estimated with the statistics
+    """
+    if isinstance(condition.left, ColumnExpression) and isinstance(condition.right, ColumnExpression):
+        if condition.operator != ComparativeOperator.EQUAL:
+            return None
+
+        # every value of the column with less distinct values is assumed to find a partner in the other column
+        num_distinct = [column_statistics.num_distinct for column_statistics in
+                        (_find_column_statistics(nodes, column.get_result())
+                         for column in (condition.left, condition.right))
+                        if column_statistics is not None]
+        return 1 / max(max(num_distinct), 1) if num_distinct else None
+
+    if condition.operator in (ComparativeOperator.EQUAL, ComparativeOperator.NOT_EQUAL) and (
+            isinstance(condition.left, ColumnExpression) and isinstance(condition.right, ParameterExpression) or
+            isinstance(condition.left, ParameterExpression) and isinstance(condition.right, ColumnExpression)):
+        column = condition.left if isinstance(condition.left, ColumnExpression) else condition.right
+        column_statistics = _find_column_statistics(nodes, column.get_result())
+        if column_statistics is None or column_statistics.num_records == 0:
+            return None
+
+        selectivity = column_statistics.estimate_average_equal_count() / column_statistics.num_records
+        return selectivity if condition.operator == ComparativeOperator.EQUAL else 1.0 - selectivity
+
+    if isinstance(condition.left, ColumnExpression) and isinstance(condition.right, LiteralExpression):
+        column, operator, value = condition.left, condition.operator, condition.right.get_result()
+    elif isinstance(condition.left, LiteralExpression) and isinstance(condition.right, ColumnExpression):
+        column, operator, value = condition.right, _MIRRORED_OPERATORS[condition.operator], \
+            condition.left.get_result()
+    else:
+        return None
+
+    column_statistics = _find_column_statistics(nodes, column.get_result())
+    if column_statistics is None or column_statistics.num_records == 0:
+        return None
+
+    if operator in (ComparativeOperator.EQUAL, ComparativeOperator.NOT_EQUAL):
+        selectivity = column_statistics.estimate_equal_count(value) / column_statistics.num_records
+        return selectivity if operator == ComparativeOperator.EQUAL else 1.0 - selectivity
+
+    if operator in (ComparativeOperator.SMALLER, ComparativeOperator.SMALLER_EQUAL):
+        num_records = column_statistics.estimate_range_count(upper=value)
+    else:
+        num_records = column_statistics.estimate_range_count(lower=value)
+
+    return None if num_records is None else num_records / column_statistics.num_records
+
+
+# operators that are used if the literal is on the left side of a comparison ("1 < x" is the same as "x > 1")
+_MIRRORED_OPERATORS = {
+    ComparativeOperator.EQUAL: ComparativeOperator.EQUAL,
+    ComparativeOperator.NOT_EQUAL: ComparativeOperator.NOT_EQUAL,
+    ComparativeOperator.SMALLER: ComparativeOperator.GREATER,
+    ComparativeOperator.SMALLER_EQUAL: ComparativeOperator.GREATER_EQUAL,
+    ComparativeOperator.GREATER: ComparativeOperator.SMALLER,
+    ComparativeOperator.GREATER_EQUAL: ComparativeOperator.SMALLER_EQUAL,
+}
+
+
+def _find_column_statistics(nodes, column_name):
+    """
+    Searches the table column that the column with the given name in the result of one of the given nodes stems
+    from. Returns its statistics, or None if it is not found (e.g. because it is computed by a projection)
+    """
+    for node in nodes:
+        try:
+            node.get_schema().get_column_index(column_name)
+        except (TableIndexException, AmbiguousColumnException):
+            continue
+
+        if isinstance(node, (TableScan, IndexSeek, IndexRangeSeek)):
+            return retrieve_statistics(node.table_name).get_column_statistics(column_name)
+        elif not isinstance(node, HashAggregate):
+            return _find_column_statistics(node.get_child_nodes(), column_name)
+
+    return None
+
+
+def estimate_join_cost(join: AbstractJoin, left_num_records, right_num_records, num_records):
+    """
+    Estimates the cost of executing the given join (without the costs of its inputs), given the estimated number of
+    records of its inputs and of its result
+    """
+    if isinstance(join, IndexNestedLoopsJoin):
+        outer_num_records = left_num_records if join.is_right_indexed else right_num_records
+        cost = outer_num_records * INDEX_PROBE_COST
+    elif isinstance(join, MergeJoin):
+        cost = (left_num_records + right_num_records) * MERGE_COST
+    elif isinstance(join, HashJoin):
+        build_num_records, probe_num_records = (right_num_records, left_num_records) if join.build_right \
+            else (left_num_records, right_num_records)
+        cost = build_num_records * HASH_BUILD_COST + probe_num_records * HASH_PROBE_COST
+    else:
+        cost = left_num_records * right_num_records * NESTED_LOOPS_COST
+
+    return cost + num_records * OUTPUT_COST
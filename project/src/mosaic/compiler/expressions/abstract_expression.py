@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from itertools import compress
 
 from mosaic.compiler.abstract_compile_node import AbstractCompileNode
 from mosaic.table_service import Schema
@@ -16,6 +17,34 @@ class AbstractExpression(AbstractCompileNode):
         """
         pass
 
+    @abstractmethod
+    def compile(self, schema: Schema):  # pragma: no cover
+        """
+        Compiles this expression for records of the given schema.
+        Column references are resolved to their positions and the operators are fixed once,
+        so the expression tree does not need to be walked for every record.
+        Returns a callable that takes a record and returns the result of the expression for it
+        """
+        pass
+
+    @abstractmethod
+    def compile_vectorized(self, schema: Schema):  # pragma: no cover
+        """
+        Compiles this expression for batches of records of the given schema (vectorized execution).
+        Returns a callable that takes a batch and returns the list of results for the selected records of the batch
+        """
+        pass
+
+    def compile_vectorized_filter(self, schema: Schema):
+        """
+        Compiles this expression as filter for batches of records of the given schema.
+        Returns a callable that takes a batch and returns the selection vector of the selected records,
+        for which the expression is fulfilled
+        """
+        evaluate = self.compile_vectorized(schema)
+
+        return lambda batch: list(compress(batch.selection, evaluate(batch)))
+
     @abstractmethod
     def get_string_representation(self, schema: Schema = None):  # pragma: no cover
         """
@@ -1,4 +1,5 @@
 from enum import Enum
+from operator import mul, sub
 
 from mosaic.compiler.get_string_representation import get_string_representation
 from mosaic.table_service import SchemaType, get_schema_type, Schema
@@ -18,6 +19,26 @@ class IncompatibleOperationException(Exception):
     pass
 
 
+def _divide(left_operand, right_operand):
+    return float(left_operand / right_operand)
+
+
+def _add(left_operand, right_operand):
+    if isinstance(left_operand, str) or isinstance(right_operand, str):
+        left_operand = str(left_operand)
+        right_operand = str(right_operand)
+
+    return left_operand + right_operand
+
+
+_ARITHMETIC_FUNCTIONS = {
+    ArithmeticOperator.TIMES: mul,
+    ArithmeticOperator.DIVIDE: _divide,
+    ArithmeticOperator.ADD: _add,
+    ArithmeticOperator.SUBTRACT: sub,
+}
+
+
 class ArithmeticExpression(AbstractComputationExpression):
     """
     Class that represents a binary arithmetic operation.
@@ -48,18 +69,42 @@ class ArithmeticExpression(AbstractComputationExpression):
         if left_operand is None or right_operand is None:
             return None
 
-        if self.operator == ArithmeticOperator.TIMES:
-            return left_operand * right_operand
-        elif self.operator == ArithmeticOperator.DIVIDE:
-            return float(left_operand / right_operand)
-        elif self.operator == ArithmeticOperator.ADD:
-            if isinstance(left_operand, str) or isinstance(right_operand, str):
-                left_operand = str(left_operand)
-                right_operand = str(right_operand)
-
-            return left_operand + right_operand
-        elif self.operator == ArithmeticOperator.SUBTRACT:
-            return left_operand - right_operand
+        return _ARITHMETIC_FUNCTIONS[self.operator](left_operand, right_operand)
+
+    def compile(self, schema: Schema):
+        left = self.left.compile(schema)
+        right = self.right.compile(schema)
+        compute = _ARITHMETIC_FUNCTIONS[self.operator]
+
+        def evaluate(record):
+            left_operand = left(record)
+            right_operand = right(record)
+
+            if left_operand is None or right_operand is None:
+                return None
+
+            return compute(left_operand, right_operand)
+
+        return evaluate
+
+    def compile_vectorized(self, schema: Schema):
+        left = self.left.compile_vectorized(schema)
+        right = self.right.compile_vectorized(schema)
+        compute = _ARITHMETIC_FUNCTIONS[self.operator]
+
+        def evaluate(batch):
+            left_values = left(batch)
+            right_values = right(batch)
+
+            if None in left_values or None in right_values:
+                # NULL operands propagate NULL
+                return [None if left_operand is None or right_operand is None
+                        else compute(left_operand, right_operand)
+                        for left_operand, right_operand in zip(left_values, right_values)]
+
+            return list(map(compute, left_values, right_values))
+
+        return evaluate
 
     def get_schema_type(self, schema):
         """
@@ -1,3 +1,5 @@
+from operator import itemgetter
+
 from mosaic.table_service import Schema
 from .abstract_expression import AbstractExpression
 
@@ -15,6 +17,14 @@ class ColumnExpression(AbstractExpression):
     def get_result(self):
         return self.value
 
+    def compile(self, schema: Schema):
+        return itemgetter(schema.get_column_index(self.value))
+
+    def compile_vectorized(self, schema: Schema):
+        column_index = schema.get_column_index(self.value)
+
+        return lambda batch: batch.get_column(column_index)
+
     def get_string_representation(self, schema: Schema = None):
         if schema is None:
             return self.value
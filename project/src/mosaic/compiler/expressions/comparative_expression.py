@@ -1,4 +1,5 @@
 from enum import Enum
+from operator import eq, ne, lt, le, gt, ge
 
 from mosaic.compiler.get_string_representation import get_string_representation
 from mosaic.table_service import Schema
@@ -20,6 +21,16 @@ class IncompatibleOperandTypesException(Exception):
     pass
 
 
+_COMPARISON_FUNCTIONS = {
+    ComparativeOperator.EQUAL: eq,
+    ComparativeOperator.NOT_EQUAL: ne,
+    ComparativeOperator.SMALLER: lt,
+    ComparativeOperator.SMALLER_EQUAL: le,
+    ComparativeOperator.GREATER: gt,
+    ComparativeOperator.GREATER_EQUAL: ge,
+}
+
+
 class ComparativeExpression(AbstractComputationExpression):
     """
     Class that represents a comparison operation.
@@ -50,21 +61,53 @@ class ComparativeExpression(AbstractComputationExpression):
             return 0
 
         try:
-            if self.operator == ComparativeOperator.EQUAL:
-                return int(left_operand == right_operand)
-            elif self.operator == ComparativeOperator.NOT_EQUAL:
-                return int(left_operand != right_operand)
-            elif self.operator == ComparativeOperator.SMALLER:
-                return int(left_operand < right_operand)
-            elif self.operator == ComparativeOperator.SMALLER_EQUAL:
-                return int(left_operand <= right_operand)
-            elif self.operator == ComparativeOperator.GREATER:
-                return int(left_operand > right_operand)
-            elif self.operator == ComparativeOperator.GREATER_EQUAL:
-                return int(left_operand >= right_operand)
+            return int(_COMPARISON_FUNCTIONS[self.operator](left_operand, right_operand))
         except TypeError:
             raise IncompatibleOperandTypesException("Operands of a comparison operation must be compatible")
 
+    def compile(self, schema: Schema):
+        left = self.left.compile(schema)
+        right = self.right.compile(schema)
+        compare = _COMPARISON_FUNCTIONS[self.operator]
+        null_is_comparable = self.operator in [ComparativeOperator.EQUAL, ComparativeOperator.NOT_EQUAL]
+
+        def evaluate(record):
+            left_operand = left(record)
+            right_operand = right(record)
+
+            if not null_is_comparable and (left_operand is None or right_operand is None):
+                return 0
+
+            try:
+                return int(compare(left_operand, right_operand))
+            except TypeError:
+                raise IncompatibleOperandTypesException("Operands of a comparison operation must be compatible")
+
+        return evaluate
+
+    def compile_vectorized(self, schema: Schema):
+        left = self.left.compile_vectorized(schema)
+        right = self.right.compile_vectorized(schema)
+        compare = _COMPARISON_FUNCTIONS[self.operator]
+        null_is_comparable = self.operator in [ComparativeOperator.EQUAL, ComparativeOperator.NOT_EQUAL]
+
+        def evaluate(batch):
+            left_values = left(batch)
+            right_values = right(batch)
+
+            try:
+                if not null_is_comparable and (None in left_values or None in right_values):
+                    # comparisons with NULL operands yield 0
+                    return [0 if left_operand is None or right_operand is None
+                            else int(compare(left_operand, right_operand))
+                            for left_operand, right_operand in zip(left_values, right_values)]
+
+                return list(map(int, map(compare, left_values, right_values)))
+            except TypeError:
+                raise IncompatibleOperandTypesException("Operands of a comparison operation must be compatible")
+
+        return evaluate
+
     def _get_operand(self, table, row_index, expression):
         """
         Returns the actual operand for the given expression
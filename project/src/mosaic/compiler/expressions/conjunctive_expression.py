@@ -26,6 +26,43 @@ class ConjunctiveExpression(AbstractComputationExpression):
 
         return 1
 
+    def compile(self, schema: Schema):
+        conditions = [condition.compile(schema) for condition in self.conditions]
+
+        def evaluate(record):
+            for condition in conditions:
+                if not condition(record):
+                    return 0
+
+            return 1
+
+        return evaluate
+
+    def compile_vectorized(self, schema: Schema):
+        evaluate_filter = self.compile_vectorized_filter(schema)
+
+        def evaluate(batch):
+            selection = set(evaluate_filter(batch))
+
+            return [int(position in selection) for position in batch.selection]
+
+        return evaluate
+
+    def compile_vectorized_filter(self, schema: Schema):
+        condition_filters = [condition.compile_vectorized_filter(schema) for condition in self.conditions]
+
+        def evaluate(batch):
+            # every condition only gets evaluated for the records that fulfilled the previous ones
+            for condition_filter in condition_filters:
+                if len(batch) == 0:
+                    break
+
+                batch = batch.select(condition_filter(batch))
+
+            return batch.selection
+
+        return evaluate
+
     def simplify(self):
         self.conditions = [condition.simplify() for condition in self.conditions]
 
@@ -26,6 +26,48 @@ class DisjunctiveExpression(AbstractComputationExpression):
 
         return 0
 
+    def compile(self, schema: Schema):
+        conditions = [condition.compile(schema) for condition in self.conditions]
+
+        def evaluate(record):
+            for condition in conditions:
+                if condition(record):
+                    return 1
+
+            return 0
+
+        return evaluate
+
+    def compile_vectorized(self, schema: Schema):
+        evaluate_filter = self.compile_vectorized_filter(schema)
+
+        def evaluate(batch):
+            selection = set(evaluate_filter(batch))
+
+            return [int(position in selection) for position in batch.selection]
+
+        return evaluate
+
+    def compile_vectorized_filter(self, schema: Schema):
+        condition_filters = [condition.compile_vectorized_filter(schema) for condition in self.conditions]
+
+        def evaluate(batch):
+            selection = set()
+            remaining_batch = batch
+
+            # every condition only gets evaluated for the records that did not fulfill one of the previous ones
+            for condition_filter in condition_filters:
+                if len(remaining_batch) == 0:
+                    break
+
+                selection.update(condition_filter(remaining_batch))
+                remaining_batch = remaining_batch.select(
+                    [position for position in remaining_batch.selection if position not in selection])
+
+            return [position for position in batch.selection if position in selection]
+
+        return evaluate
+
     def simplify(self):
         self.conditions = [condition.simplify() for condition in self.conditions]
 
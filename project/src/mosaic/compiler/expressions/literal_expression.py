@@ -16,6 +16,16 @@ class LiteralExpression(AbstractExpression):
     def get_result(self):
         return self.value
 
+    def compile(self, schema: Schema):
+        value = self.value
+
+        return lambda record: value
+
+    def compile_vectorized(self, schema: Schema):
+        value = self.value
+
+        return lambda batch: [value] * len(batch)
+
     def get_string_representation(self, schema: Schema = None):
         if isinstance(self.value, str):
             return f"\"{self.value}\""
@@ -0,0 +1,146 @@
+from mosaic.compiler.compiler_exception import CompilerException
+from mosaic.table_service import Schema
+from .abstract_expression import AbstractExpression
+from .arithmetic_expression import ArithmeticExpression
+from .comparative_expression import ComparativeExpression
+from .conjunctive_expression import ConjunctiveExpression
+from .disjunctive_expression import DisjunctiveExpression
+
+
+class UnboundParameterException(CompilerException):
+    pass
+
+
+class ParameterBindingException(CompilerException):
+    pass
+
+
+class QueryParameters:
+    """
+    Class that holds the values bound to the parameter placeholders of a query.
+    All parameter expressions of a query share one instance, so that binding new values changes the values of the
+    whole execution plan without compiling it again.
+    This class has the following properties:
+    num_positional: the number of positional parameters ("?"), which are numbered in the order of the query
+    names: the names of the named parameters (":name")
+    values: the bound values of the parameters: {number or name: value}
+    """
+
+    def __init__(self):
+        self.num_positional = 0
+        self.names = []
+        self.values = dict()
+
+    def add_positional(self):
+        """
+        Registers the next positional parameter and returns its number
+        """
+        self.num_positional += 1
+        return self.num_positional - 1
+
+    def add_named(self, name):
+        if name not in self.names:
+            self.names.append(name)
+        return name
+
+    def bind(self, positional_values=(), named_values=None):
+        """
+        Binds the given values to the parameters, replacing the values of a previous binding.
+        Every parameter needs to be given a value
+        """
+        named_values = dict() if named_values is None else named_values
+
+        if len(positional_values) != self.num_positional:
+            raise ParameterBindingException(f"Query has {self.num_positional} positional parameters, but "
+                                            f"{len(positional_values)} values were given")
+
+        missing_names = [name for name in self.names if name not in named_values]
+        if missing_names:
+            raise ParameterBindingException(f"No value given for parameter :{missing_names[0]}")
+
+        unknown_names = [name for name in named_values if name not in self.names]
+        if unknown_names:
+            raise ParameterBindingException(f"Query has no parameter :{unknown_names[0]}")
+
+        self.values = dict(enumerate(positional_values))
+        self.values.update(named_values)
+
+    def copy(self):
+        """
+        Returns a copy of the parameters without bound values
+        """
+        parameters = QueryParameters()
+        parameters.num_positional = self.num_positional
+        parameters.names = list(self.names)
+
+        return parameters
+
+    def is_empty(self):
+        return self.num_positional == 0 and not self.names
+
+    def __deepcopy__(self, memo):
+        # copies of the expressions of a query (e.g. made by the optimizer) still belong to the same query
+        return self
+
+
+class ParameterExpression(AbstractExpression):
+    """
+    Class that represents a parameter placeholder ("?" or ":name"), which is used like a literal whose value is
+    bound before every execution (see QueryParameters).
+    This class has the following properties:
+    name: the number of a positional parameter or the name of a named parameter
+    parameters: the QueryParameters of the query that hold the bound value
+    """
+
+    def __init__(self, name, parameters: QueryParameters):
+        super().__init__()
+
+        self.name = name
+        self.parameters = parameters
+
+    def get_result(self):
+        try:
+            return self.parameters.values[self.name]
+        except KeyError:
+            raise UnboundParameterException(f"No value is bound to parameter {self.get_string_representation()}")
+
+    def compile(self, schema: Schema):
+        # the operators compile their expressions for every execution, so the currently bound value is used
+        value = self.get_result()
+
+        return lambda record: value
+
+    def compile_vectorized(self, schema: Schema):
+        value = self.get_result()
+
+        return lambda batch: [value] * len(batch)
+
+    def get_string_representation(self, schema: Schema = None):
+        if isinstance(self.name, int):
+            return "?"
+
+        return f":{self.name}"
+
+
+def contains_parameter(expression):
+    """
+    Checks whether the given expression contains a parameter placeholder (recursively)
+    """
+    if isinstance(expression, ParameterExpression):
+        return True
+    elif isinstance(expression, (ArithmeticExpression, ComparativeExpression)):
+        return contains_parameter(expression.left) or contains_parameter(expression.right)
+    elif isinstance(expression, (ConjunctiveExpression, DisjunctiveExpression)):
+        return any(contains_parameter(condition) for condition in expression.conditions)
+
+    return False
+
+
+def check_no_parameters(column_expressions, description):
+    """
+    Parameters are not supported in the columns of projections, aggregations and orderings, since the result
+    columns and the sort columns are determined when the query is compiled, before values are bound to the parameters.
+    column_expressions contains tuples (alias, expression), description names the columns in the error message
+    """
+    if any(contains_parameter(expression) for _, expression in column_expressions):
+        raise CompilerException(f"Parameters are not supported in {description}")
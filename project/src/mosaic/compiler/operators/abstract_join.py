@@ -1,6 +1,6 @@
 from enum import Enum
 from abc import abstractmethod
-from mosaic.table_service import Table, Schema, TableIndexException
+from mosaic.table_service import Schema, TableIndexException
 from .abstract_operator import AbstractOperator
 from ..expressions.column_expression import ColumnExpression
 from ..expressions.comparative_expression import ComparativeExpression, ComparativeOperator
@@ -25,30 +25,35 @@ class AbstractJoin(AbstractOperator):
 
         self.left_node = left_node
         self.right_node = right_node
-        self.left_schema = self.left_node.get_schema()
-        self.right_schema = self.right_node.get_schema()
         self.join_type = join_type
         self.is_natural = is_natural
+        # estimations of the optimizer, which are shown by explain (see _get_cost_string)
+        self.estimated_num_records = None
+        self.estimated_cost = None
         self.check_join_type()
+        self._update_child_schemas()
         if self.is_natural and self.join_type != JoinType.CROSS:
-            self._pad_natural_join_schema()
             self.condition = self._build_natural_join_condition()
         else:
             self.condition = condition
-        self.schema = self._build_schema()
+        # builds (and thereby checks) the schema of the join
+        self.get_schema()
 
     @abstractmethod
-    def _get_result(self):  # pragma: no cover
+    def _get_records(self):  # pragma: no cover
         """
-        Calculates the effective result of a join operator but keeps natural join padding.
+        Generator that calculates the effective records of a join operator but keeps natural join padding.
         """
         pass
 
-    def get_result(self):
-        result = self._get_result()
-        if self.is_natural and self.join_type != JoinType.CROSS:
-            self._unpad_natural_join_schema()
-        return result
+    def get_records(self):
+        # makes sure that the (padded) schemas of the child-nodes are up to date
+        self.get_schema()
+
+        yield from self._get_records()
+
+    def get_child_nodes(self):
+        return [self.left_node, self.right_node]
 
     @abstractmethod
     def check_condition(self, schema1, schema2, condition):  # pragma: no cover
@@ -66,10 +71,8 @@ class AbstractJoin(AbstractOperator):
             raise SelfJoinWithoutRenamingException(f"Table \"{schema1.table_name}\" can't be joined with itself "
                                                    f"without renaming one of the occurrences")
 
-    def get_schema(self):
-        return self.schema
-
     def _build_schema(self):
+        self._update_child_schemas()
         self.check_table_names(self.left_schema, self.right_schema)
         self.check_condition(self.left_schema, self.right_schema, self.condition)
         if self.is_natural and self.join_type != JoinType.CROSS:
@@ -206,6 +209,31 @@ class AbstractJoin(AbstractOperator):
         self.left_node.explain(rows, indent + 2)
         self.right_node.explain(rows, indent + 2)
 
+    def _get_cost_string(self):
+        """
+        Returns the estimated number of records and cost of the join, if it has been chosen by the optimizer,
+        formatted for the string representation
+        """
+        if self.estimated_cost is None:
+            return ""
+
+        return f", estimated_records={round(self.estimated_num_records)}, cost={round(self.estimated_cost)}"
+
+    def _update_child_schemas(self):
+        """
+        Stores copies of the schemas of the child-nodes, which get padded in case of a natural join.
+        The schemas are copied, so that the padding does not affect the schemas of the child-nodes.
+        """
+        left_schema = self.left_node.get_schema()
+        right_schema = self.right_node.get_schema()
+        self.left_schema = Schema(left_schema.table_name, list(left_schema.column_names),
+                                  list(left_schema.column_types))
+        self.right_schema = Schema(right_schema.table_name, list(right_schema.column_names),
+                                   list(right_schema.column_types))
+
+        if self.is_natural and self.join_type != JoinType.CROSS:
+            self._pad_natural_join_schema()
+
     def _pad_natural_join_schema(self):
         """
         Pads alias column names from both schemas with a constant to distinguish them in case of a natural join.
@@ -215,13 +243,6 @@ class AbstractJoin(AbstractOperator):
         self.right_schema.column_names = [RIGHT_NATURAL_PADDING + name if "." not in name else name for name in
                                           self.right_schema.column_names]
 
-    def _unpad_natural_join_schema(self):
-        """
-        Removes padding from both schemas column names introduced with natural joins.
-        """
-        self.left_schema.column_names = self._unpad_column_names(self.left_schema.column_names, LEFT_NATURAL_PADDING)
-        self.right_schema.column_names = self._unpad_column_names(self.right_schema.column_names, RIGHT_NATURAL_PADDING)
-
     def _unpad_column_names(self, column_names, prefix):
         """
         Removes the specified prefix from the given list of column names
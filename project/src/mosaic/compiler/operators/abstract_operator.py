@@ -1,24 +1,86 @@
 from abc import abstractmethod
+from itertools import islice
 
 from mosaic.compiler.abstract_compile_node import AbstractCompileNode
+from mosaic.compiler.batch import Batch, BATCH_SIZE
+from mosaic.table_service import Table
 
 
 class AbstractOperator(AbstractCompileNode):
     def __init__(self):
-        pass
+        self._schema = None
+        self._schema_child_schemas = None
+
+    def get_schema(self):
+        """
+        Returns the schema of the result of this operator.
+        The schema is derived from the schemas of the child-nodes only (see _build_schema), so the operator
+        never gets executed for it. It is cached on the node and rebuilt as soon as the schema of a child-node
+        changes, e.g. because the optimizer rewired the child-nodes.
+        Returns a Schema-Object
+        """
+        child_schemas = [child_node.get_schema() for child_node in self.get_child_nodes()]
+
+        if self._schema is None or any(child_schema is not cached_child_schema for child_schema, cached_child_schema
+                                       in zip(child_schemas, self._schema_child_schemas)):
+            self._schema = self._build_schema()
+            self._schema_child_schemas = child_schemas
+
+        return self._schema
 
     @abstractmethod
-    def get_schema(self):  # pragma: no cover
+    def _build_schema(self):  # pragma: no cover
+        """
+        Builds the schema of the result of this operator out of the schemas of the child-nodes.
+        Returns a Schema-Object
+        """
         pass
 
+    def get_child_nodes(self):
+        """
+        Returns the list of child-operators of this operator.
+        Needs to be overridden by operators that have child-nodes
+        """
+        return []
+
     @abstractmethod
-    def get_result(self):  # pragma: no cover
+    def get_records(self):  # pragma: no cover
+        """
+        Generator that computes the records of this operator one at a time (pull-based execution).
+        For that it pulls the records of the child-nodes lazily, so that only operators which need
+        their whole input (pipeline breakers like orderings and aggregations) buffer records.
+        Yields the records as lists of values
+        """
+        pass
+
+    def supports_batches(self):
+        """
+        Returns whether this operator can produce its records in columnar batches natively,
+        so that the parent operators can use vectorized execution.
+        """
+        return False
+
+    def get_batches(self):
+        """
+        Generator that computes the records of this operator in batches (see Batch) for vectorized execution.
+        By default the records returned by get_records are collected into batches.
+        """
+        records = self.get_records()
+
+        while True:
+            records_batch = list(islice(records, BATCH_SIZE))
+            if not records_batch:
+                return
+
+            yield Batch.from_records(records_batch)
+
+    def get_result(self):
         """
         Computes the result for this expression-node and returns it.
-        For that it calls the compute nodes of the child-nodes recursively.
+        For that it materializes the records returned by get_records.
         Returns a Table-Object
         """
-        pass
+        return Table(self.get_schema(), list(self.get_records()))
 
     def explain(self, rows, indent):
         """
@@ -14,14 +14,19 @@ class Explain(AbstractOperator, ABC):
         super().__init__()
         self.node = node
 
-    def get_schema(self):
-        pass
+    def _build_schema(self):
+        return Schema("Execution_plan", ["Operator"], [SchemaType.VARCHAR])
+
+    def get_child_nodes(self):
+        return [self.node]
 
     def get_result(self):
+        return Table(self.get_schema(), list(self.get_records()))
+
+    def get_records(self):
         rows = []
         self.explain(rows, 0)
-        schema = Schema("Execution_plan", ["Operator"], [SchemaType.VARCHAR])
-        return Table(schema, rows)
+        yield from rows
 
     def simplify(self):
         self.node = self.node.simplify()
@@ -1,10 +1,8 @@
 from abc import ABC
 from enum import Enum
-from mosaic.compiler.expressions.abstract_computation_expression import AbstractComputationExpression
-from mosaic.compiler.expressions.literal_expression import LiteralExpression
 from mosaic.compiler.operators.abstract_operator import AbstractOperator
 from mosaic.compiler.alias_schema_builder import build_schema
-from mosaic.table_service import Schema, SchemaType, Table
+from mosaic.table_service import Schema, SchemaType
 
 
 class VarcharAggregateException(Exception):
@@ -42,25 +40,49 @@ def aggregate_schema_type(aggregation_function, current_schema):
         return current_schema
 
 
-def aggregate(aggregation_function, to_aggregate):
+class AggregateState:
     """
-    This function receives a list and an aggregation function.
-    Depending on the aggregation function it applies different
-    operations to the list.
-    Returns aggregated list.
+    Class that holds the running state of an aggregation for a group, so that the aggregation can be computed
+    incrementally in a single pass over the records instead of collecting the values of every group.
+    Depending on the aggregation function it keeps a running count, sum, min or max.
     """
-    if aggregation_function == AggregateFunction.AVG:
-        result = sum(to_aggregate) / len(to_aggregate)
-    elif aggregation_function == AggregateFunction.COUNT:
-        result = len(to_aggregate)
-    elif aggregation_function == AggregateFunction.MAX:
-        result = max(to_aggregate)
-    elif aggregation_function == AggregateFunction.MIN:
-        result = min(to_aggregate)
-    elif aggregation_function == AggregateFunction.SUM:
-        result = sum(to_aggregate)
 
-    return result
+    def __init__(self, aggregation_function):
+        self.aggregation_function = aggregation_function
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """
+        Adds the given value to the running state of the aggregation
+        """
+        self.count += 1
+
+        if self.aggregation_function == AggregateFunction.SUM or self.aggregation_function == AggregateFunction.AVG:
+            self.sum += value
+        elif self.aggregation_function == AggregateFunction.MIN:
+            if self.count == 1 or value < self.min:
+                self.min = value
+        elif self.aggregation_function == AggregateFunction.MAX:
+            if self.count == 1 or value > self.max:
+                self.max = value
+
+    def get_result(self):
+        """
+        Returns the aggregated value for all values added so far.
+        """
+        if self.aggregation_function == AggregateFunction.AVG:
+            return self.sum / self.count
+        elif self.aggregation_function == AggregateFunction.COUNT:
+            return self.count
+        elif self.aggregation_function == AggregateFunction.MAX:
+            return self.max
+        elif self.aggregation_function == AggregateFunction.MIN:
+            return self.min
+        elif self.aggregation_function == AggregateFunction.SUM:
+            return self.sum
 
 
 def extract(aggregations):
@@ -94,86 +116,52 @@ class HashAggregate(AbstractOperator, ABC):
         self.group_names = group_names
         self.aggregations = extract(aggregations)
 
-    def get_schema(self):
-        return self._build_schema()
-
-    def _get_key(self, grouping_columns, row, table, index):
-        key_list = []
-        for group_column in grouping_columns:
-            if isinstance(group_column, AbstractComputationExpression):
-                key_list.append(group_column.get_result(table, index))
-            elif isinstance(group_column, LiteralExpression):
-                key_list.append(group_column.get_result())
-            else:
-                key_list.append(row[group_column])
+    def get_child_nodes(self):
+        return [self.node]
 
-        return tuple(key_list)
-
-    def _group_columns(self):
+    def _group_columns(self, records, schema):
         """
-        First the function fetches all the indexes of the grouping columns of the aggregation.
-        If there are no grouping columns it returns a dictionary with an empty key and the records of the table as value.
-        If there are grouping columns it loops through all the columns and adds matching rows to the group column tuple keys.
-        Returns Dictionary with group column tuples as key and matching rows as value.
+        First the function compiles the grouping columns of the aggregation into callables computing the key values.
+        Then it loops once through the given records and adds the values of every record to the aggregate states
+        of the group with the matching group column tuple key, so only the states of the groups are kept in memory.
+        If there are no grouping columns all records belong to the group with the empty key, which also exists
+        if there are no records.
+        Returns Dictionary with group column tuples as key and the list of aggregate states as value.
         """
-        table = self.node.get_result()
+        grouping_functions = [group_name.compile(schema) for (_, group_name) in self.group_names]
+        aggregated_column_indices = [schema.get_column_index(aggregation[2].value)
+                                     for aggregation in self.aggregations]
 
-        group_table = {}
+        groups = {}
 
-        # if no group names return hashmap
         if not self.group_names:
-            return {"": table.records}
+            groups[()] = self._create_aggregate_states()
 
-        grouping_columns = []
+        for row in records:
+            key = tuple([grouping_function(row) for grouping_function in grouping_functions])
 
-        for (_, group_name) in self.group_names:
-            if isinstance(group_name, AbstractComputationExpression) or isinstance(group_name, LiteralExpression):
-                grouping_columns.append(group_name)
-            else:
-                grouping_columns.append(
-                    table.get_column_index(group_name.value))
+            aggregate_states = groups.get(key)
+            if aggregate_states is None:
+                aggregate_states = groups[key] = self._create_aggregate_states()
 
-        # generate dictionary
-        for (index, row) in enumerate(table.records):
-            # get indexes of all group columns
-            key = self._get_key(grouping_columns, row, table, index)
+            for aggregate_state, aggregated_column_index in zip(aggregate_states, aggregated_column_indices):
+                aggregate_state.add(row[aggregated_column_index])
 
-            if key not in group_table:
-                group_table[key] = [row]
-            else:
-                group_table[key] += [row]
+        return groups
 
-        return group_table
+    def _create_aggregate_states(self):
+        return [AggregateState(aggregation[1]) for aggregation in self.aggregations]
 
     def _calculate_aggregations(self, groups):
         """
-        Receives a dictionary where the keys are a tuple of the group columns and the values the matching rows.
+        Receives a dictionary where the keys are a tuple of the group columns and the values the aggregate states.
         For each group first the grouped tuple gets converted to a list to add the group column values.
         If the group values are empty grouped_keys is empty and a empty list gets created.
-        Afterwards all aggregations get applied to the current group by calling the aggregate function.
-        The results for each aggregation get added and at the end the list with group columns and then
-        aggregation results gets appended to the table records.
-        Returns computed records.
+        Afterwards the results of the aggregate states of the group are appended.
+        Yields computed records.
         """
-        table = self.node.get_result()
-        records = []
-        for grouped_keys, group in groups.items():
-            row = list(grouped_keys)
-            for aggregation in self.aggregations:
-                aggregation_function = aggregation[1]
-                aggregated_column_index = table.get_column_index(
-                    aggregation[2].value)
-
-                to_aggregate = [group_row[aggregated_column_index]
-                                for group_row in group]
-
-                result = aggregate(aggregation_function, to_aggregate)
-
-                row.append(result)
-
-            records.append(row)
-
-        return records
+        for grouped_keys, aggregate_states in groups.items():
+            yield list(grouped_keys) + [aggregate_state.get_result() for aggregate_state in aggregate_states]
 
     def _build_schema(self):
         """
@@ -182,7 +170,6 @@ class HashAggregate(AbstractOperator, ABC):
         for the aggregated columns.
         Returns the built schema.
         """
-        old_table = self.node.get_result()
         old_schema = self.node.get_schema()
 
         column_names, column_types, _ = build_schema(
@@ -191,22 +178,20 @@ class HashAggregate(AbstractOperator, ABC):
         column_names += [aggregation[0]
                          for aggregation in self.aggregations]
         column_types += [aggregate_schema_type(aggregation[1], old_schema.column_types[
-            old_table.get_column_index(aggregation[2].value)])
+            old_schema.get_column_index(aggregation[2].value)])
                          for aggregation in self.aggregations]
 
         return Schema(old_schema.table_name, column_names, column_types)
 
-    def get_result(self):
+    def get_records(self):
         """
-        Calculates the records and the schema for the aggregations using private class functions.
-        Returns table with calculated records and schema.
+        Calculates the records for the aggregations using private class functions.
+        As a pipeline breaker, it consumes all records of the child (which is executed once)
+        before the first record is returned.
         """
+        groups = self._group_columns(self.node.get_records(), self.node.get_schema())
 
-        schema = self._build_schema()
-        groups = self._group_columns()
-        records = self._calculate_aggregations(groups)
-
-        return Table(schema, records)
+        yield from self._calculate_aggregations(groups)
 
     def __str__(self):
         table_schema = self.node.get_schema()
@@ -1,4 +1,3 @@
-from mosaic.table_service import Table, Schema
 from .abstract_operator import AbstractOperator
 
 
@@ -6,6 +5,8 @@ class HashDistinct(AbstractOperator):
     """
     Class that represents a "distinct" operation.
     It is used for duplicate elimination and here is implemented in a hash-based way.
+    The records are keyed by their values as tuples, so that distinct records can never collide.
+    It streams its result by emitting every record the first time it is seen.
     """
 
     def __init__(self, node):
@@ -13,25 +14,34 @@ class HashDistinct(AbstractOperator):
 
         self.node = node
 
-    def get_result(self):
-        table = self.node.get_result()
+    def get_records(self):
+        seen_keys = set()
 
-        hashes = set()
-        records = []
+        if self.node.supports_batches():
+            # columnar input: the keys are built directly from the columns of the batches
+            for batch in self.node.get_batches():
+                columns = [batch.get_column(i) for i in range(len(batch.columns))]
 
-        for record in table.records:
-            record_hash = hash(str(record))
+                for key in zip(*columns):
+                    if key not in seen_keys:
+                        seen_keys.add(key)
+                        yield list(key)
 
-            if record_hash not in hashes:
-                hashes.add(record_hash)
-                records.append(record)
+            return
 
-        schema = Schema(table.table_name, table.schema.column_names, table.schema.column_types)
-        return Table(schema, records)
+        for record in self.node.get_records():
+            key = tuple(record)
 
-    def get_schema(self):
+            if key not in seen_keys:
+                seen_keys.add(key)
+                yield record
+
+    def _build_schema(self):
         return self.node.get_schema()
 
+    def get_child_nodes(self):
+        return [self.node]
+
     def simplify(self):
         self.node = self.node.simplify()
 
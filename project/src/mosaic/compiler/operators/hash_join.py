@@ -5,63 +5,87 @@ from ..expressions.comparative_expression import ComparativeExpression, Comparat
 
 
 class HashJoin(AbstractJoin):
+    """
+    Class that represents a hash join, which builds a hash table over the join columns of one relation (the build
+    side) and probes it with the records of the other relation, which are streamed.
+    The left relation is the build side, unless build_right is set (e.g. because the right relation is smaller).
+    """
 
-    def _get_result(self):
-        table1 = self.left_node.get_result()
-        table2 = self.right_node.get_result()
+    def __init__(self, left_node, right_node, join_type, condition, is_natural, build_right=False):
+        super().__init__(left_node, right_node, join_type, condition, is_natural)
+        self.build_right = build_right
 
-        result_records = []
+    def _get_records(self):
+        if self.build_right:
+            yield from self._get_records_building_right()
+            return
 
-        table1_hash = self._build_hash(table1, self.left_schema, self.condition)
+        # build side: the left relation gets buffered in the hash table
+        left_hash = self._build_hash(self.left_node.get_records(), self.left_schema, self.condition)
         used_keys = set()
 
-        self._build_matching_records(
-            table2, table1_hash, used_keys, result_records)
+        # probe side: the right relation is streamed
+        yield from self._build_matching_records(self.right_node.get_records(), left_hash, used_keys)
 
         if self.join_type == JoinType.LEFT_OUTER:
-            self._build_not_matching_records(
-                table2, table1_hash, used_keys, result_records)
-
-        return Table(self.schema, result_records)
+            yield from self._build_not_matching_records(left_hash, used_keys)
 
-    def _build_matching_records(self, table2, table1_hash, used_keys, result_records):
+    def _get_records_building_right(self):
+        """
+        Builds the hash table over the right relation and probes it with the streamed left relation.
+        Left records without a join partner are completed with nulls immediately in case of a left outer join.
+        """
+        right_hash = self._build_hash(self.right_node.get_records(), self.right_schema, self.condition)
+        left_hash_reference = self._get_join_column_indices(self.left_schema, self.condition)
+        index_to_exclude = self._get_join_column_indices(self.right_schema, self.condition) \
+            if self.is_natural else None
+        null_record = self._build_null_record(len(self.right_schema.column_names))
+
+        for left_record in self.left_node.get_records():
+            left_key = self._get_referenced_column_values(left_hash_reference, left_record)
+            if left_key in right_hash:
+                for right_record in right_hash[left_key]:
+                    yield self._build_record(left_record, right_record, index_to_exclude)
+            elif self.join_type == JoinType.LEFT_OUTER:
+                yield self._build_record(left_record, null_record, index_to_exclude)
+
+    def _build_matching_records(self, right_records, left_hash, used_keys):
         """
-        Builds the result records that have a join partner in table1 according to table1_hash.
-        Adds resulting tuples in result_records.
-        Used_keys gets filled with all the keys out of table1_hash that got used to build a tuple.
+        Builds the result records that have a join partner in the left relation according to left_hash.
+        Used_keys gets filled with all the keys out of left_hash that got used to build a tuple.
+        Yields the resulting tuples.
         """
-        table2_hash_reference = self._get_join_column_indices(
-            table2, self.condition)
-        for tab2_record in table2.records:
-            tab2_key = self._get_referenced_column_values(
-                table2_hash_reference, tab2_record)
-            if tab2_key in table1_hash:
-                used_keys.add(tab2_key)
-                for tab1_record in table1_hash[tab2_key]:
-                    result_records.append(self._build_record(
-                        tab1_record, tab2_record, table2))
-
-    def _build_not_matching_records(self, table2, table1_hash, used_keys, result_records):
+        right_hash_reference = self._get_join_column_indices(self.right_schema, self.condition)
+        index_to_exclude = right_hash_reference if self.is_natural else None
+
+        for right_record in right_records:
+            right_key = self._get_referenced_column_values(right_hash_reference, right_record)
+            if right_key in left_hash:
+                used_keys.add(right_key)
+                for left_record in left_hash[right_key]:
+                    yield self._build_record(left_record, right_record, index_to_exclude)
+
+    def _build_not_matching_records(self, left_hash, used_keys):
         """
-        Builds null tuples for all unused keys in table1_hash and add them to result_records.
+        Builds null tuples for all unused keys in left_hash and yields them.
         """
-        for tab1_key in table1_hash.keys():
-            if tab1_key not in used_keys:
-                for tab1_record in table1_hash[tab1_key]:
-                    result_records.append(
-                        self._build_record(tab1_record, self._build_null_record(len(table2.schema.column_names)),
-                                           table2))
-
-    def _build_record(self, left_record, right_record, right_table):
+        null_record = self._build_null_record(len(self.right_schema.column_names))
+        index_to_exclude = self._get_join_column_indices(self.right_schema, self.condition) \
+            if self.is_natural else None
+
+        for left_key in left_hash.keys():
+            if left_key not in used_keys:
+                for left_record in left_hash[left_key]:
+                    yield self._build_record(left_record, null_record, index_to_exclude)
+
+    def _build_record(self, left_record, right_record, index_to_exclude):
         """
         Method that builds a record if a match is found.
-        In case of a natural join, the right table is needed to eliminate join columns.
+        In case of a natural join, the join columns of the right record (index_to_exclude) are eliminated.
         """
         if not self.is_natural:
             return left_record + right_record
         else:
-            index_to_exclude = self._get_join_column_indices(
-                right_table, self.condition)
             new_record = []
             for i, target in enumerate(right_record):
                 if i not in index_to_exclude:
@@ -89,14 +113,14 @@ class HashJoin(AbstractJoin):
             raise JoinConditionNotSupportedException("HashJoin only supports conjunctions of equalities or "
                                                      "simple equalities that only contain column references")
 
-    def _build_hash(self, relation, schema, condition):
+    def _build_hash(self, records, schema, condition):
         """
-        Builds a hash table of all rows of the given relation based on the join condition.
+        Builds a hash table of all given records based on the join condition.
         Results in a dictionary with (column_val1, ...) as key and a list of records as value.
         """
         hash_reference_index = self._get_join_column_indices(schema, condition)
         result = dict()
-        for record in relation.records:
+        for record in records:
             key = self._get_referenced_column_values(
                 hash_reference_index, record)
             if key not in result:
@@ -114,7 +138,9 @@ class HashJoin(AbstractJoin):
     def __str__(self):
         schema = self.get_schema()
 
-        return f"HashJoin({self.join_type.value}, natural={self.is_natural}, condition={get_string_representation(self.condition, schema)})"
+        build_side = ", build=right" if self.build_right else ""
+
+        return f"HashJoin({self.join_type.value}, natural={self.is_natural}, condition={get_string_representation(self.condition, schema)}{build_side}{self._get_cost_string()})"
 
 
 def is_comparative_condition_supported(condition):
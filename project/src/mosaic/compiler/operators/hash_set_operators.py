@@ -0,0 +1,66 @@
+from collections import Counter
+from itertools import repeat
+
+from .set_operators import Intersect, Except, _check_schemas
+
+
+class HashIntersect(Intersect):
+    """
+    Represents a hash-based intersect operation.
+    The records of the right relation are counted in a multiset once, which is then probed with the records of
+    the left relation.
+    With bag semantics every left record is returned as often as it appears in the right relation (same result
+    as Intersect), with set semantics every matching record is only returned once.
+    """
+
+    def __init__(self, left_node, right_node, is_set_semantics=False):
+        super().__init__(left_node, right_node)
+        self.is_set_semantics = is_set_semantics
+
+    def get_records(self):
+        _check_schemas(self.left_node.get_schema(), self.right_node.get_schema())
+
+        right_counts = Counter(map(tuple, self.right_node.get_records()))
+
+        for record in self.left_node.get_records():
+            key = tuple(record)
+
+            if key in right_counts:
+                if self.is_set_semantics:
+                    del right_counts[key]
+                    yield record
+                else:
+                    yield from repeat(record, right_counts[key])
+
+    def __str__(self):
+        return f"HashIntersect(set_semantics={self.is_set_semantics})"
+
+
+class HashExcept(Except):
+    """
+    Represents a hash-based difference operation.
+    The records of the right relation are collected in a hash set once, which is then probed with the records of
+    the left relation.
+    With bag semantics every left record without a partner is returned (same result as Except), with set semantics
+    duplicates of the left relation are only returned once.
+    """
+
+    def __init__(self, left_node, right_node, is_set_semantics=False):
+        super().__init__(left_node, right_node)
+        self.is_set_semantics = is_set_semantics
+
+    def get_records(self):
+        _check_schemas(self.left_node.get_schema(), self.right_node.get_schema())
+
+        right_keys = set(map(tuple, self.right_node.get_records()))
+
+        for record in self.left_node.get_records():
+            key = tuple(record)
+
+            if key not in right_keys:
+                if self.is_set_semantics:
+                    right_keys.add(key)
+                yield record
+
+    def __str__(self):
+        return f"HashExcept(set_semantics={self.is_set_semantics})"
@@ -0,0 +1,85 @@
+from operator import itemgetter
+
+from mosaic import table_service
+from mosaic.compiler.get_string_representation import get_string_representation
+from .hash_join import *
+from .table_scan import TableScan
+
+
+class IndexNestedLoopsJoin(HashJoin):
+    """
+    Represents a join, that probes an existing index of one of the joined tables for every record of the other
+    (outer) relation, instead of building a hash table over the whole table.
+    The probed relation needs to be a table scan whose table has an index over its join columns (a composite index
+    may declare them in any order). The right relation is probed if possible, the left relation is only probed
+    for inner joins.
+    """
+
+    def __init__(self, left_node, right_node, join_type, condition, is_natural):
+        super().__init__(left_node, right_node, join_type, condition, is_natural)
+
+        self.is_right_indexed = True
+        self.index_column, self.key_order = self._find_index(self.right_node, self.right_schema)
+
+        if self.index_column is None and self.join_type == JoinType.INNER:
+            self.is_right_indexed = False
+            self.index_column, self.key_order = self._find_index(self.left_node, self.left_schema)
+
+        if self.index_column is None:
+            raise JoinConditionNotSupportedException("IndexNestedLoopsJoin requires a table scan with an index over "
+                                                     "the join columns")
+
+    def get_indexed_node(self):
+        return self.right_node if self.is_right_indexed else self.left_node
+
+    def get_outer_node(self):
+        return self.left_node if self.is_right_indexed else self.right_node
+
+    def _get_records(self):
+        index = table_service.retrieve_index(self.get_indexed_node().table_name, self.index_column)
+
+        outer_schema = self.left_schema if self.is_right_indexed else self.right_schema
+        outer_join_columns = self._get_join_column_indices(outer_schema, self.condition)
+        # the key is built in the order of the index columns
+        get_key = itemgetter(*[outer_join_columns[i] for i in self.key_order])
+
+        index_to_exclude = self._get_join_column_indices(self.right_schema, self.condition) \
+            if self.is_natural else None
+        null_record = self._build_null_record(len(self.right_schema.column_names))
+
+        for outer_record in self.get_outer_node().get_records():
+            key = get_key(outer_record)
+
+            if key in index:
+                for indexed_record in index[key]:
+                    if self.is_right_indexed:
+                        yield self._build_record(outer_record, indexed_record, index_to_exclude)
+                    else:
+                        yield self._build_record(indexed_record, outer_record, index_to_exclude)
+            elif self.join_type == JoinType.LEFT_OUTER:
+                yield self._build_record(outer_record, null_record, index_to_exclude)
+
+    def _find_index(self, node, schema):
+        """
+        Searches an index over the join columns of the given node, which needs to be a table scan.
+        Returns a tuple (index_column, key_order), where key_order contains the position of each index column
+        in the join condition, or (None, None) if there is no such index
+        """
+        if not isinstance(node, TableScan):
+            return None, None
+
+        join_columns = [schema.get_simple_column_name(schema.column_names[column_index])
+                        for column_index in self._get_join_column_indices(schema, self.condition)]
+
+        for index_column in table_service.retrieve_table_indices(node.table_name):
+            index_columns = table_service.get_index_columns(index_column)
+            if sorted(index_columns) == sorted(join_columns):
+                return index_column, [join_columns.index(column) for column in index_columns]
+
+        return None, None
+
+    def __str__(self):
+        schema = self.get_schema()
+        index_name = table_service._get_index_name(self.get_indexed_node().table_name, self.index_column)
+
+        return f"IndexNestedLoopsJoin({self.join_type.value}, natural={self.is_natural}, index={index_name}, condition={get_string_representation(self.condition, schema)}{self._get_cost_string()})"
@@ -0,0 +1,140 @@
+from copy import deepcopy
+from mosaic import table_service
+from .abstract_operator import AbstractOperator
+from .index_seek import ErrorInIndexSeekConditionException, IndexSeekConditionNotSupportedException
+from ..expressions.column_expression import ColumnExpression
+from ..expressions.comparative_expression import ComparativeExpression, ComparativeOperator, \
+    IncompatibleOperandTypesException
+from ..expressions.conjunctive_expression import ConjunctiveExpression
+from ..expressions.literal_expression import LiteralExpression
+from ..get_string_representation import get_string_representation
+from ...table_service import _get_index_name
+
+# operators that are used if the literal is on the left side of a condition ("1 < x" is the same as "x > 1")
+_MIRRORED_OPERATORS = {
+    ComparativeOperator.EQUAL: ComparativeOperator.EQUAL,
+    ComparativeOperator.SMALLER: ComparativeOperator.GREATER,
+    ComparativeOperator.SMALLER_EQUAL: ComparativeOperator.GREATER_EQUAL,
+    ComparativeOperator.GREATER: ComparativeOperator.SMALLER,
+    ComparativeOperator.GREATER_EQUAL: ComparativeOperator.SMALLER_EQUAL,
+}
+
+
+class IndexRangeSeek(AbstractOperator):
+    """
+    Class that represents an index range seek, which uses an ordered index to return the records whose value
+    in the index column lies in a range. The records are returned in the order of the index column.
+    Supports conditions which compare the index column and a literal with <, <=, >, >= or =. All of the given
+    conditions are combined into one range (e.g. "x >= 1" and "x < 5").
+    """
+
+    def __init__(self, table_name, index_column, conditions, alias=None):
+        super().__init__()
+        self.table_name = table_name
+        self.alias = alias
+        self.conditions = conditions
+        self.schema = self._build_schema()
+        self.index_column = self.schema.get_simple_column_name(index_column)
+        # checks that the index exists
+        table_service.retrieve_index(self.table_name, self.index_column)
+
+        if not table_service.ordered_index_exists(self.table_name, self.index_column):
+            raise IndexSeekConditionNotSupportedException(
+                f'Index with name "{_get_index_name(self.table_name, self.index_column)}" does not support range seeks')
+
+        self.lower = None
+        self.lower_inclusive = True
+        self.upper = None
+        self.upper_inclusive = True
+        self.is_empty = False
+        self._consume_conditions()
+
+    def get_records(self):
+        if self.is_empty:
+            return
+
+        try:
+            yield from self.index.get_range(self.lower, self.lower_inclusive, self.upper, self.upper_inclusive)
+        except TypeError:
+            raise IncompatibleOperandTypesException("Operands of a comparison operation must be compatible")
+
+    def get_schema(self):
+        return self.schema
+
+    @property
+    def index(self):
+        # the index is retrieved for every execution, so that a reused plan sees the current index of the table
+        return table_service.retrieve_index(self.table_name, self.index_column)
+
+    def _build_schema(self):
+        schema = deepcopy(table_service.retrieve_schema(self.table_name))
+        if self.alias is not None:
+            schema.rename(self.alias)
+        return schema
+
+    def get_num_records(self):
+        if self.is_empty:
+            return 0
+
+        try:
+            return self.index.count_range(self.lower, self.lower_inclusive, self.upper, self.upper_inclusive)
+        except TypeError:
+            raise IncompatibleOperandTypesException("Operands of a comparison operation must be compatible")
+
+    def __str__(self):
+        schema = self.get_schema()
+        condition = self.conditions[0] if len(self.conditions) == 1 else ConjunctiveExpression(self.conditions)
+        if self.alias is None:
+            return f"IndexRangeSeek({_get_index_name(self.table_name, self.index_column)}, condition={get_string_representation(condition, schema)})"
+        return f"IndexRangeSeek({_get_index_name(self.table_name, self.index_column)}, table_alias={self.alias}, condition={get_string_representation(condition, schema)})"
+
+    def _consume_conditions(self):
+        for condition in self.conditions:
+            if not isinstance(condition, ComparativeExpression) or condition.operator not in _MIRRORED_OPERATORS:
+                raise IndexSeekConditionNotSupportedException("IndexRangeSeek only supports conditions which are "
+                                                              "comparisons with <, <=, >, >= or =")
+
+            if isinstance(condition.left, ColumnExpression) and isinstance(condition.right, LiteralExpression):
+                column_name = condition.left.get_result()
+                operator = condition.operator
+                value = condition.right.get_result()
+            elif isinstance(condition.right, ColumnExpression) and isinstance(condition.left, LiteralExpression):
+                column_name = condition.right.get_result()
+                operator = _MIRRORED_OPERATORS[condition.operator]
+                value = condition.left.get_result()
+            else:
+                raise ErrorInIndexSeekConditionException("IndexRangeSeek conditions need to compare a column "
+                                                         "and a literal")
+
+            if not self._column_name_is_supported(column_name):
+                raise ErrorInIndexSeekConditionException(
+                    "Referenced column in IndexRangeSeek condition doesn't match the actual index column")
+
+            if value is None:
+                # comparisons with NULL are never fulfilled
+                self.is_empty = True
+                continue
+
+            try:
+                if operator in (ComparativeOperator.GREATER, ComparativeOperator.GREATER_EQUAL,
+                                ComparativeOperator.EQUAL):
+                    self._restrict_lower_bound(value, operator != ComparativeOperator.GREATER)
+                if operator in (ComparativeOperator.SMALLER, ComparativeOperator.SMALLER_EQUAL,
+                                ComparativeOperator.EQUAL):
+                    self._restrict_upper_bound(value, operator != ComparativeOperator.SMALLER)
+            except TypeError:
+                raise IncompatibleOperandTypesException("Operands of a comparison operation must be compatible")
+
+    def _restrict_lower_bound(self, value, inclusive):
+        if self.lower is None or value > self.lower or (value == self.lower and not inclusive):
+            self.lower = value
+            self.lower_inclusive = inclusive
+
+    def _restrict_upper_bound(self, value, inclusive):
+        if self.upper is None or value < self.upper or (value == self.upper and not inclusive):
+            self.upper = value
+            self.upper_inclusive = inclusive
+
+    def _column_name_is_supported(self, column_name):
+        return (column_name in self.schema.column_names or column_name in self.schema.get_simple_column_name_list()) and \
+               self.schema.get_simple_column_name(column_name) == self.schema.get_simple_column_name(self.index_column)
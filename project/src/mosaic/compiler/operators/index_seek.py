@@ -4,7 +4,9 @@ from .abstract_operator import AbstractOperator
 from ..compiler_exception import CompilerException
 from ..expressions.column_expression import ColumnExpression
 from ..expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from ..expressions.conjunctive_expression import ConjunctiveExpression
 from ..expressions.literal_expression import LiteralExpression
+from ..expressions.parameter_expression import ParameterExpression
 from ..get_string_representation import get_string_representation
 from ...table_service import Table, _get_index_name
 
@@ -13,6 +15,10 @@ class IndexSeek(AbstractOperator):
     """
     Class that represents an index seek.
     Only supports conditions which are simple equalities.
+    For composite indices (e.g. index_column "MatrNr,VorlNr") the condition is a conjunction of simple equalities
+    on the index columns in the order of the index. They either cover all index columns or, if the index is ordered,
+    a prefix of them.
+    The compared values are either literals or parameters, whose bound values are looked up for every execution.
     """
 
     def __init__(self, table_name, index_column, condition, alias=None):
@@ -20,27 +26,58 @@ class IndexSeek(AbstractOperator):
         self.table_name = table_name
         self.alias = alias
         self.condition = condition
-        self.schema = deepcopy(table_service.retrieve_table(self.table_name, makeCopy=False).schema)
-        if self.alias is not None:
-            self.schema.rename(self.alias)
-        self.index_column = self.schema.get_simple_column_name(index_column)
-        self.index = table_service.retrieve_index(self.table_name, self.index_column)
-        self.comparison_value = self._consume_condition()
+        self.schema = self._build_schema()
+        self.index_columns = [self.schema.get_simple_column_name(column)
+                              for column in table_service.get_index_columns(index_column)]
+        self.index_column = ",".join(self.index_columns)
+        # checks that the index exists
+        table_service.retrieve_index(self.table_name, self.index_column)
+
+        if len(self.index_columns) == 1:
+            self.comparison_expressions = [self._consume_condition(self.condition, self.index_column)]
+        else:
+            self.comparison_expressions = self._consume_composite_condition()
+
+    @property
+    def comparison_value(self):
+        values = tuple(expression.get_result() for expression in self.comparison_expressions)
+        return values if len(self.index_columns) > 1 else values[0]
+
+    def has_parameters(self):
+        return any(isinstance(expression, ParameterExpression) for expression in self.comparison_expressions)
 
     def get_result(self):
         result = self._get_index_records()
         return Table(self.schema, result)
 
+    def get_records(self):
+        yield from self._get_index_records()
+
     def get_schema(self):
         return self.schema
 
+    @property
+    def index(self):
+        # the index is retrieved for every execution, so that a reused plan sees the current index of the table
+        return table_service.retrieve_index(self.table_name, self.index_column)
+
+    def _build_schema(self):
+        schema = deepcopy(table_service.retrieve_schema(self.table_name))
+        if self.alias is not None:
+            schema.rename(self.alias)
+        return schema
+
     def get_num_records(self):
         return len(self._get_index_records())
 
     def _get_index_records(self):
         key = self.comparison_value
-        if key in self.index:
-            result = self.index[key]
+        index = self.index
+        if len(self.index_columns) > 1 and len(key) < len(self.index_columns):
+            return [record for prefix_key in index.get_prefix_keys(key) for record in index[prefix_key]]
+
+        if key in index:
+            result = index[key]
         else:
             result = []
         return result
@@ -54,37 +91,53 @@ class IndexSeek(AbstractOperator):
     def explain(self, rows, indent):
         super().explain(rows, indent)
 
-    def _consume_condition(self):
-        if isinstance(self.condition, ComparativeExpression) and \
-                self.condition.operator == ComparativeOperator.EQUAL:
-            left = self.condition.left
-            right = self.condition.right
+    def _consume_composite_condition(self):
+        conditions = self.condition.conditions if isinstance(self.condition, ConjunctiveExpression) \
+            else [self.condition]
+        if len(conditions) > len(self.index_columns):
+            raise IndexSeekConditionNotSupportedException("IndexSeek condition has more equalities than the index "
+                                                          "has columns")
+
+        expressions = [self._consume_condition(condition, index_column)
+                       for condition, index_column in zip(conditions, self.index_columns)]
+
+        if len(expressions) < len(self.index_columns) and \
+                not table_service.ordered_index_exists(self.table_name, self.index_column):
+            raise IndexSeekConditionNotSupportedException("IndexSeek on a prefix of the columns of a composite index "
+                                                          "requires an ordered index")
+        return expressions
+
+    def _consume_condition(self, condition, index_column):
+        if isinstance(condition, ComparativeExpression) and \
+                condition.operator == ComparativeOperator.EQUAL:
+            left = condition.left
+            right = condition.right
             if isinstance(left, ColumnExpression):
                 column_name = left.get_result()
-                if isinstance(right, LiteralExpression):
-                    value = right.get_result()
+                if isinstance(right, (LiteralExpression, ParameterExpression)):
+                    value_expression = right
                 else:
-                    raise ErrorInIndexSeekConditionException("No literal found in IndexSeek condition")
+                    raise ErrorInIndexSeekConditionException("No literal or parameter found in IndexSeek condition")
             elif isinstance(right, ColumnExpression):
                 column_name = right.get_result()
-                if isinstance(left, LiteralExpression):
-                    value = left.get_result()
+                if isinstance(left, (LiteralExpression, ParameterExpression)):
+                    value_expression = left
                 else:
-                    raise ErrorInIndexSeekConditionException("No literal found in IndexSeek condition")
+                    raise ErrorInIndexSeekConditionException("No literal or parameter found in IndexSeek condition")
             else:
                 raise ErrorInIndexSeekConditionException("No column reference found in IndexSeek condition")
         else:
             raise IndexSeekConditionNotSupportedException("IndexSeek only supports conditions which are simple "
                                                           "equalities")
-        if self._column_name_is_supported(column_name):
-            return value
+        if self._column_name_is_supported(column_name, index_column):
+            return value_expression
         else:
             raise ErrorInIndexSeekConditionException(
                 "Referenced column in IndexSeek condition doesn't match the actual index column")
 
-    def _column_name_is_supported(self, column_name):
+    def _column_name_is_supported(self, column_name, index_column):
         return (column_name in self.schema.column_names or column_name in self.schema.get_simple_column_name_list()) and \
-               self.schema.get_simple_column_name(column_name) == self.schema.get_simple_column_name(self.index_column)
+               self.schema.get_simple_column_name(column_name) == self.schema.get_simple_column_name(index_column)
 
 
 class IndexSeekConditionNotSupportedException(CompilerException):
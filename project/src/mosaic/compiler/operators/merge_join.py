@@ -14,15 +14,18 @@ class MergeJoin(AbstractJoin):
         super().__init__(left_node, right_node, join_type, condition, is_natural)
         self._check_tables_sorting()
         self.right_table_finished = False
+
+    def _get_records(self):
+        # the join columns are looked up for every execution, as the optimizer may have narrowed the inputs
         self.left_table_referenced_column_indices = self._get_join_column_indices(self.left_schema, self.condition)
         self.right_table_referenced_column_indices = self._get_join_column_indices(self.right_schema, self.condition)
 
-    def _get_result(self):
+        # the merge works on the sorted (and therefore materialized) results of both orderings
         left_table = self.left_node.get_result()
         right_table = self.right_node.get_result()
-        result_records = self._build_records(left_table, right_table)
+        self.right_table_finished = False
 
-        return Table(self.schema, result_records)
+        yield from self._build_records(left_table, right_table)
 
     def _build_records(self, left_table, right_table):
         """
@@ -37,6 +40,11 @@ class MergeJoin(AbstractJoin):
             left_record_index, right_record_index = self._merge_records(left_table, right_table, left_record_index,
                                                                         right_record_index, records)
 
+        if self.join_type == JoinType.LEFT_OUTER and len(right_table) == 0:
+            # without right records, none of the left records has a join partner
+            records.extend(left_record + self._build_null_record(self._get_num_right_result_columns())
+                           for left_record in left_table.records)
+
         return records
 
     def _merge_records(self, left_table, right_table, left_record_index, right_record_index, records):
@@ -55,7 +63,7 @@ class MergeJoin(AbstractJoin):
         elif merge_condition == "right is bigger" or self.right_table_finished:
             if self.join_type == JoinType.LEFT_OUTER:
                 records.append(left_table[left_record_index] +
-                               self._build_null_record(len(right_table[right_record_index])))
+                               self._build_null_record(self._get_num_right_result_columns()))
 
             left_record_index += 1
 
@@ -67,6 +75,13 @@ class MergeJoin(AbstractJoin):
 
         return left_record_index, right_record_index
 
+    def _get_num_right_result_columns(self):
+        """
+        Returns the number of columns of the right relation in the result, which excludes the join columns in case of
+        a natural join.
+        """
+        return len(self.get_schema().column_names) - len(self.left_schema.column_names)
+
     def _build_matching_records(self, records, left_table, right_table, left_record_index, right_record_index):
         """
         Builds the record for matching records.
@@ -96,11 +111,11 @@ class MergeJoin(AbstractJoin):
         """
         left_records, left_record_end_index = \
             self._get_matching_records(left_table, self.left_table_referenced_column_indices,
-                                       left_sub_record_start_index, right_table)
+                                       left_sub_record_start_index)
 
         right_records, right_record_end_index = \
             self._get_matching_records(right_table, self.right_table_referenced_column_indices,
-                                       right_sub_record_start_index, right_table)
+                                       right_sub_record_start_index)
 
         cross_product_record = self._build_cross_product_of_records_aux(left_records, right_records)
 
@@ -128,16 +143,16 @@ class MergeJoin(AbstractJoin):
 
         return cross_product_record
 
-    def _get_matching_records(self, table, table_referenced_column_indices, sub_record_start_index, right_table):
+    def _get_matching_records(self, table, table_referenced_column_indices, sub_record_start_index):
         """
         Returns a list of matching records to be merged with records from the other table.
         The list consists of the records from sub_record_start_index to sub_record_end_index.
         Checks for each record if it is still matching the reference
         """
         reference = self._get_referenced_values(table, sub_record_start_index, table_referenced_column_indices)
-        sub_record_end_index = sub_record_start_index + 1
+        sub_record_end_index = len(table)
 
-        for record_index in range(sub_record_start_index, len(right_table)):
+        for record_index in range(sub_record_start_index, len(table)):
             if not self._records_are_matching(table, record_index, table_referenced_column_indices, reference):
                 sub_record_end_index = record_index
                 break
@@ -290,7 +305,7 @@ class MergeJoin(AbstractJoin):
 
         return f"MergeJoin({self.join_type.value}, " \
                f"natural={self.is_natural}, " \
-               f"condition={get_string_representation(self.condition, schema)})"
+               f"condition={get_string_representation(self.condition, schema)}{self._get_cost_string()})"
 
 
 class TableNotSortedException(CompilerException):
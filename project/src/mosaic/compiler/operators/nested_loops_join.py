@@ -14,42 +14,41 @@ class NestedLoopsJoin(AbstractJoin):
     is_natural: boolean expressing if a join is natural
     """
 
-    def _get_result(self):
-        table1 = self.left_node.get_result()
-        table2 = self.right_node.get_result()
+    def _get_records(self):
+        # the inner relation is scanned once for every outer record, so it gets buffered
+        right_records = list(self.right_node.get_records())
 
         remaining_column_indices = []
         if self.is_natural:
             remaining_column_indices = self.get_remaining_column_indices(self.right_schema)
 
-        joined_table_records = []
-        aux_schema = Schema(f"{self.left_schema.table_name}_join_{self.right_schema.table_name}",
-                            self.left_schema.column_names + self.right_schema.column_names,
-                            self.left_schema.column_types + self.right_schema.column_types)
-        aux_table = Table(aux_schema, [])
+        condition = None
+        if self.join_type != JoinType.CROSS:
+            aux_schema = Schema(f"{self.left_schema.table_name}_join_{self.right_schema.table_name}",
+                                self.left_schema.column_names + self.right_schema.column_names,
+                                self.left_schema.column_types + self.right_schema.column_types)
+            condition = self.condition.compile(aux_schema)
 
-        for record1 in table1.records:
+        for record1 in self.left_node.get_records():
             found_match = False
-            for record2 in table2.records:
+            for record2 in right_records:
                 if self.is_natural and self.join_type is not JoinType.CROSS:
                     record2_reduced = [record2[i] for i in remaining_column_indices]
                     new_record = record1 + record2_reduced
-                    aux_table.records = [record1 + record2]
+                    condition_record = record1 + record2
                 else:
                     new_record = record1 + record2
-                    aux_table.records = [new_record]
+                    condition_record = new_record
 
-                if self.join_type == JoinType.CROSS or self.condition.get_result(aux_table, 0):
+                if condition is None or condition(condition_record):
                     found_match = True
-                    joined_table_records.append(new_record)
+                    yield new_record
 
             if self.join_type == JoinType.LEFT_OUTER and not found_match:
                 if self.is_natural:
-                    joined_table_records.append(record1 + self._build_null_record(len(remaining_column_indices)))
+                    yield record1 + self._build_null_record(len(remaining_column_indices))
                 else:
-                    joined_table_records.append(record1 + self._build_null_record(len(table2.schema.column_names)))
-
-        return Table(self.schema, joined_table_records)
+                    yield record1 + self._build_null_record(len(self.right_schema.column_names))
 
     def get_remaining_column_indices(self, schema2):
         """
@@ -58,14 +57,14 @@ class NestedLoopsJoin(AbstractJoin):
         """
         remaining_indices = []
         for i, column_name in enumerate(schema2.column_names):
-            if column_name in self.schema.column_names:
+            if column_name in self.get_schema().column_names:
                 remaining_indices.append(i)
         return remaining_indices
 
     def __str__(self):
         schema = self.get_schema()
 
-        return f"NestedLoopsJoin({self.join_type.value}, natural={self.is_natural}, condition={get_string_representation(self.condition, schema)})"
+        return f"NestedLoopsJoin({self.join_type.value}, natural={self.is_natural}, condition={get_string_representation(self.condition, schema)}{self._get_cost_string()})"
 
     def check_condition(self, schema1, schema2, condition):
         pass
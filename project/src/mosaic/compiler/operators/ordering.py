@@ -1,4 +1,3 @@
-from mosaic.table_service import Table, Schema
 from .abstract_operator import AbstractOperator
 
 
@@ -13,18 +12,18 @@ class Ordering(AbstractOperator):
         self.node = node
         self.column_list = column_list
 
-    def get_result(self):
-        table = self.node.get_result()
-        column_indices = _get_column_indices(self.column_list, table)
+    def get_records(self):
+        column_indices = _get_column_indices(self.column_list, self.node.get_schema())
 
-        ordered_records = sorted(table.records, key=lambda record: _get_sort_key(record, column_indices))
-        schema = Schema(table.table_name, table.schema.column_names, table.schema.column_types)
+        # pipeline breaker: sorting needs all records of the child
+        yield from sorted(self.node.get_records(), key=lambda record: _get_sort_key(record, column_indices))
 
-        return Table(schema, ordered_records)
-
-    def get_schema(self):
+    def _build_schema(self):
         return self.node.get_schema()
 
+    def get_child_nodes(self):
+        return [self.node]
+
     def simplify(self):
         self.node = self.node.simplify()
 
@@ -40,10 +39,10 @@ class Ordering(AbstractOperator):
         self.node.explain(rows, indent + 2)
 
 
-def _get_column_indices(column_list, table):
+def _get_column_indices(column_list, schema):
     column_indices = []
     for column_name in column_list:
-        column_indices.append(table.get_column_index(column_name.get_result()))
+        column_indices.append(schema.get_column_index(column_name.get_result()))
         # (non-)existence of columns is already handled in the get_column_index method
     return column_indices
 
@@ -1,8 +1,9 @@
+from operator import itemgetter
+
 from mosaic.compiler.get_string_representation import get_string_representation
-from mosaic.compiler.expressions.abstract_computation_expression import AbstractComputationExpression
-from mosaic.compiler.expressions.literal_expression import LiteralExpression
 from mosaic.compiler.alias_schema_builder import build_schema
-from mosaic.table_service import Table, Schema
+from mosaic.compiler.batch import Batch
+from mosaic.table_service import Schema
 from .abstract_operator import AbstractOperator
 
 
@@ -10,49 +11,66 @@ class Projection(AbstractOperator):
     """
     Class that represents a projection operation.
     It returns a table which only contains columns which match the given attributes list.
+    The result keeps the table name of the input, unless another table name is given.
     """
 
-    def __init__(self, node, column_references):
+    def __init__(self, node, column_references, table_name=None):
         super().__init__()
 
         self.node = node
         self.column_references = column_references
+        self.table_name = table_name
+
+    def get_records(self):
+        if self.node.supports_batches():
+            for batch in self.get_batches():
+                yield from batch.get_records()
+
+            return
+
+        child_schema = self.node.get_schema()
+        _, _, columns = self._build_schema_columns(child_schema)
+
+        yield from self._build_data(self.node.get_records(), child_schema, columns)
+
+    def supports_batches(self):
+        return self.node.supports_batches()
 
-    def get_result(self):
-        table: Table = self.node.get_result()
+    def get_batches(self):
+        child_schema = self.node.get_schema()
+        _, _, columns = self._build_schema_columns(child_schema)
 
-        schema_names, schema_types, columns = self._build_schema(table.schema)
-        data = self._build_data(table, columns)
-        schema = Schema(table.table_name, schema_names, schema_types)
-        return Table(schema, data)
+        column_functions = [_get_column_function(column_value) if isinstance(column_value, int)
+                            else column_value.compile_vectorized(child_schema)
+                            for column_value in columns]
 
-    def get_schema(self):
+        for batch in self.node.get_batches():
+            yield Batch([column_function(batch) for column_function in column_functions], len(batch))
+
+    def _build_schema(self):
         old_schema = self.node.get_schema()
-        column_names, column_types, columns = self._build_schema(old_schema)
-        return Schema(old_schema.table_name, column_names, column_types)
+        column_names, column_types, columns = self._build_schema_columns(old_schema)
+        table_name = old_schema.table_name if self.table_name is None else self.table_name
+        return Schema(table_name, column_names, column_types)
 
-    def _build_schema(self, old_schema):
+    def _build_schema_columns(self, old_schema):
         return build_schema(self.column_references, old_schema)
 
-    def _build_data(self, table, columns):
+    def get_child_nodes(self):
+        return [self.node]
+
+    def _build_data(self, records, child_schema, columns):
         """
-        Builds the data (rows/records) for the projection-result.
-        For this it uses the columns returned by the _build_schema method
+        Builds the data (rows/records) for the projection-result one record at a time.
+        For this it uses the columns returned by the _build_schema_columns method, which are compiled once
+        into callables that compute the value of the column for a record
         """
-        data = []
-
-        for (index, record) in enumerate(table.records):
-            row = []
-            for column_value in columns:
-                if isinstance(column_value, AbstractComputationExpression):
-                    row.append(column_value.get_result(table, index))
-                elif isinstance(column_value, LiteralExpression):
-                    row.append(column_value.get_result())
-                else:
-                    row.append(record[column_value])
-            data.append(row)
+        column_functions = [itemgetter(column_value) if isinstance(column_value, int)
+                            else column_value.compile(child_schema)
+                            for column_value in columns]
 
-        return data
+        for record in records:
+            yield [column_function(record) for column_function in column_functions]
 
     def simplify(self):
         self.column_references = [(alias, column_ref.simplify()) for alias, column_ref in self.column_references]
@@ -73,3 +91,7 @@ class Projection(AbstractOperator):
     def explain(self, rows, indent):
         super().explain(rows, indent)
         self.node.explain(rows, indent + 2)
+
+
+def _get_column_function(column_index):
+    return lambda batch: batch.get_column(column_index)
@@ -1,8 +1,5 @@
 from mosaic.compiler.get_string_representation import get_string_representation
-from mosaic.table_service import Table, Schema
 from .abstract_operator import AbstractOperator
-from ..expressions.abstract_computation_expression import AbstractComputationExpression
-from ..expressions.column_expression import ColumnExpression
 from ..expressions.literal_expression import LiteralExpression
 
 
@@ -17,35 +14,46 @@ class Selection(AbstractOperator):
         self.node = node
         self.condition = condition
 
-    def get_result(self):
-        table = self.node.get_result()
-        result = []
+    def get_records(self):
+        if isinstance(self.condition, LiteralExpression):
+            if self.condition.get_result():
+                yield from self.node.get_records()
+
+            return
+
+        if self.node.supports_batches():
+            for batch in self.get_batches():
+                yield from batch.get_records()
+
+            return
+
+        condition = self.condition.compile(self.node.get_schema())
+
+        for record in self.node.get_records():
+            if condition(record):
+                yield record
 
-        schema = Schema(table.table_name, table.schema.column_names, table.schema.column_types)
+    def supports_batches(self):
+        return self.node.supports_batches()
 
+    def get_batches(self):
         if isinstance(self.condition, LiteralExpression):
-            result = self.condition.get_result()
+            if self.condition.get_result():
+                yield from self.node.get_batches()
 
-            if result:
-                return table
-            else:
-                return Table(schema, [])
-
-        for i, record in enumerate(table.records):
-            if isinstance(self.condition, AbstractComputationExpression):
-                condition_result = self.condition.get_result(table, i)
-            elif isinstance(self.condition, ColumnExpression):
-                condition_result = table[i, self.condition.get_result()]
-            else:
-                condition_result = self.condition.get_result()
-            if condition_result:
-                result.append(record)
-
-        return Table(schema, result)
-
-    def get_schema(self):
+            return
+
+        condition_filter = self.condition.compile_vectorized_filter(self.node.get_schema())
+
+        for batch in self.node.get_batches():
+            yield batch.select(condition_filter(batch))
+
+    def _build_schema(self):
         return self.node.get_schema()
 
+    def get_child_nodes(self):
+        return [self.node]
+
     def simplify(self):
         self.node = self.node.simplify()
         self.condition = self.condition.simplify()
@@ -1,7 +1,7 @@
 from abc import ABC
 from enum import Enum
 
-from mosaic.table_service import Table, Schema
+from mosaic.table_service import Schema
 from .abstract_operator import AbstractOperator
 
 
@@ -22,6 +22,9 @@ class AbstractSetOperator(AbstractOperator, ABC):
         self.left_node = left_node
         self.right_node = right_node
 
+    def get_child_nodes(self):
+        return [self.left_node, self.right_node]
+
     def explain(self, rows, indent):
         super().explain(rows, indent)
         self.left_node.explain(rows, indent + 2)
@@ -42,19 +45,13 @@ class Union(AbstractSetOperator):
     an explanation of the operation is created in the explain method
     """
 
-    def get_result(self):
-        table1 = self.left_node.get_result()
-        table2 = self.right_node.get_result()
-
-        _check_schemas(table1.schema, table2.schema)
+    def get_records(self):
+        _check_schemas(self.left_node.get_schema(), self.right_node.get_schema())
 
-        table_union_records = table1.records + table2.records
-        table_union_name = f"{table1.table_name}_union_{table2.table_name}"
-        schema = Schema(table_union_name, table1.schema.column_names, table1.schema.column_types)
+        yield from self.left_node.get_records()
+        yield from self.right_node.get_records()
 
-        return Table(schema, table_union_records)
-
-    def get_schema(self):
+    def _build_schema(self):
         schema1 = self.left_node.get_schema()
         schema2 = self.right_node.get_schema()
         _check_schemas(schema1, schema2)
@@ -73,19 +70,17 @@ class Intersect(AbstractSetOperator):
     an explanation of the operation is created in the explain method
     """
 
-    def get_result(self):
-        table1 = self.left_node.get_result()
-        table2 = self.right_node.get_result()
-
-        _check_schemas(table1.schema, table2.schema)
+    def get_records(self):
+        _check_schemas(self.left_node.get_schema(), self.right_node.get_schema())
 
-        table_intersect_records = [x for y in table1.records for x in table2.records if x == y]
-        table_intersect_name = f"{table1.table_name}_intersect_{table2.table_name}"
-        schema = Schema(table_intersect_name, table1.schema.column_names, table1.schema.column_types)
+        right_records = list(self.right_node.get_records())
 
-        return Table(schema, table_intersect_records)
+        for left_record in self.left_node.get_records():
+            for right_record in right_records:
+                if right_record == left_record:
+                    yield right_record
 
-    def get_schema(self):
+    def _build_schema(self):
         schema1 = self.left_node.get_schema()
         schema2 = self.right_node.get_schema()
         _check_schemas(schema1, schema2)
@@ -104,24 +99,16 @@ class Except(AbstractSetOperator):
     an explanation of the operation is created in the explain method
     """
 
-    def get_result(self):
-        table1 = self.left_node.get_result()
-        table2 = self.right_node.get_result()
-
-        _check_schemas(table1.schema, table2.schema)
-
-        table_except_records = []
-
-        for record in table1.records:
-            if record not in table2.records:
-                table_except_records.append(record)
+    def get_records(self):
+        _check_schemas(self.left_node.get_schema(), self.right_node.get_schema())
 
-        table_except_name = f"{table1.table_name}_except_{table2.table_name}"
-        schema = Schema(table_except_name, table1.schema.column_names, table1.schema.column_types)
+        right_records = list(self.right_node.get_records())
 
-        return Table(schema, table_except_records)
+        for record in self.left_node.get_records():
+            if record not in right_records:
+                yield record
 
-    def get_schema(self):
+    def _build_schema(self):
         schema1 = self.left_node.get_schema()
         schema2 = self.right_node.get_schema()
         _check_schemas(schema1, schema2)
@@ -0,0 +1,40 @@
+from .abstract_operator import AbstractOperator
+
+
+class SortDistinct(AbstractOperator):
+    """
+    Class that represents a "distinct" operation on an input which is known to be sorted on all of its columns.
+    Since duplicates are adjacent in a sorted input, every record only needs to be compared with its predecessor,
+    so no records have to be kept in memory.
+    """
+
+    def __init__(self, node):
+        super().__init__()
+
+        self.node = node
+
+    def get_records(self):
+        previous_record = None
+
+        for record in self.node.get_records():
+            if previous_record is None or record != previous_record:
+                previous_record = record
+                yield record
+
+    def _build_schema(self):
+        return self.node.get_schema()
+
+    def get_child_nodes(self):
+        return [self.node]
+
+    def simplify(self):
+        self.node = self.node.simplify()
+
+        return self
+
+    def __str__(self):
+        return "SortDistinct"
+
+    def explain(self, rows, indent):
+        super().explain(rows, indent)
+        self.node.explain(rows, indent + 2)
@@ -1,5 +1,7 @@
 from copy import deepcopy
 from mosaic import table_service
+from mosaic.compiler.batch import Batch, BATCH_SIZE
+from mosaic.table_service import Table, ColumnarRecords
 from .abstract_operator import AbstractOperator
 
 
@@ -15,15 +17,44 @@ class TableScan(AbstractOperator):
         self.alias = alias
 
     def get_result(self):
-        table = table_service.retrieve_table(self.table_name, makeCopy=self.alias is not None)
+        table = table_service.retrieve_table(self.table_name, makeCopy=False)
 
         if self.alias is not None:
-            table.rename(self.alias)
+            # the records are shared, only the schema needs to be renamed
+            return Table(self.get_schema(), table.records)
 
         return table
 
+    def get_records(self):
+        yield from table_service.retrieve_table(self.table_name, makeCopy=False).records
+
+    def supports_batches(self):
+        return isinstance(table_service.retrieve_table(self.table_name, makeCopy=False).records, ColumnarRecords)
+
+    def get_batches(self):
+        records = table_service.retrieve_table(self.table_name, makeCopy=False).records
+
+        if not isinstance(records, ColumnarRecords):
+            yield from super().get_batches()
+            return
+
+        # columnar tables are sliced into batches without materializing records
+        for start in range(0, len(records), BATCH_SIZE):
+            end = min(start + BATCH_SIZE, len(records))
+            yield Batch([column.to_list(start, end) for column in records.columns], end - start)
+
     def get_schema(self):
-        schema = deepcopy(table_service.retrieve_table(self.table_name, makeCopy=False).schema)
+        table_schema = table_service.retrieve_schema(self.table_name)
+
+        # the schema is rebuilt if the table got (re-)loaded in the meantime
+        if self._schema is None or self._schema_child_schemas is not table_schema:
+            self._schema = self._build_schema()
+            self._schema_child_schemas = table_schema
+
+        return self._schema
+
+    def _build_schema(self):
+        schema = deepcopy(table_service.retrieve_schema(self.table_name))
         if self.alias is not None:
             schema.rename(self.alias)
         return schema
@@ -1,24 +1,35 @@
 from copy import deepcopy
+from itertools import combinations
 from mosaic.compiler.operators.hash_join import HashJoin
+from mosaic.compiler.operators.index_nested_loops_join import IndexNestedLoopsJoin
+from mosaic.compiler.operators.merge_join import MergeJoin, TableNotSortedException
+from mosaic.compiler.operators.nested_loops_join import NestedLoopsJoin
 
-from mosaic.table_service import Schema, TableIndexException, index_exists
+from mosaic.table_service import Schema, TableIndexException, AmbiguousColumnException, index_exists, ordered_index_exists, \
+    get_index_columns, retrieve_table_indices, retrieve_statistics
 from .abstract_compile_node import AbstractCompileNode
+from .alias_schema_builder import build_schema
+from .cost_model import estimate_num_records, estimate_join_cost, estimate_selectivity
 from .expressions.column_expression import ColumnExpression
 from .expressions.conjunctive_expression import ConjunctiveExpression
 from .expressions.disjunctive_expression import DisjunctiveExpression
 from .expressions.comparative_expression import ComparativeExpression, ComparativeOperator
 from .expressions.arithmetic_expression import ArithmeticExpression
 from .expressions.literal_expression import LiteralExpression
+from .expressions.parameter_expression import ParameterExpression
 from .operators.abstract_operator import AbstractOperator
 from .operators.index_seek import IndexSeek
+from .operators.index_range_seek import IndexRangeSeek
 from .operators.selection import Selection
 from .operators.explain import Explain
 from .operators.hash_distinct import HashDistinct
+from .operators.sort_distinct import SortDistinct
 from .operators.abstract_join import AbstractJoin, JoinConditionNotSupportedException, JoinType, \
     JoinTypeNotSupportedException
 from .operators.ordering import Ordering
 from .operators.projection import Projection
-from .operators.set_operators import AbstractSetOperator
+from .operators.set_operators import AbstractSetOperator, Union, Intersect, Except
+from .operators.hash_set_operators import HashIntersect, HashExcept
 from .operators.hash_aggregate import HashAggregate
 from .operators.table_scan import TableScan
 
@@ -31,9 +42,21 @@ def optimize(execution_plan: AbstractOperator):
     2. Selection push-down
         2.1 Split conjunctive selections into multiple
         2.2 Selection push-down
-        2.3 Merge a selection and a table scan into an index seek if applicable
+        2.3 Merge selections and a table scan into an index seek if applicable (using a composite index if
+            equalities cover multiple of its columns), otherwise merge range selections on a column with an ordered
+            index and the table scan into an index range seek
         2.4 Join consecutive selections to one conjunctive selection
-    3. Replace nested-loops-joins by best replacement join (if possible)
+    3. Reorder multi-way inner and cross joins (together with the selections between them) by the estimated
+       sizes of their intermediate results, see _reorder_join_region. Natural and left outer joins are not reordered
+    4. Replace every join by the cheapest join according to the cost model (see cost_model.estimate_join_cost):
+       a nested-loops-join, a hash join (building the hash table over either side), a merge join (if both sides
+       are sorted on the join columns) or an index-nested-loops-join (if one side is an indexed table scan)
+    5. Replace intersect and except operators by their hash-based counterparts
+        5.1 Use set semantics for them if duplicates are eliminated afterwards anyways
+    6. Replace hash-distincts by sort-distincts if their input is sorted on all columns
+    7. Column pruning: narrow the inputs of joins, unions and orderings to the columns that are required by the
+       operators above them (see _prune_columns) and merge projections that only rename or reorder columns into
+       the projections above them
 
     Returns the optimized execution plan
     """
@@ -50,21 +73,306 @@ def optimize(execution_plan: AbstractOperator):
     execution_plan = _node_access_helper(
         execution_plan, _join_selections, Selection)
 
+    # join reordering
+    execution_plan = _node_access_helper(
+        execution_plan, _reorder_joins, (Selection, AbstractJoin))
+
     # replace nested-loops-joins by best replacement join
     execution_plan = _node_access_helper(
         execution_plan, _select_optimal_join, AbstractJoin)
 
+    # replace set operators by hash-based set operators
+    execution_plan = _node_access_helper(
+        execution_plan, _select_hash_set_operator, AbstractSetOperator)
+    execution_plan = _node_access_helper(
+        execution_plan, _apply_set_semantics, HashDistinct)
+
+    # replace hash-distincts by sort-distincts for sorted inputs
+    execution_plan = _node_access_helper(
+        execution_plan, _select_optimal_distinct, HashDistinct)
+
+    # column pruning
+    execution_plan = _prune_columns(execution_plan)
+
     return execution_plan
 
 
+# maximum number of relations whose join order is determined by dynamic programming over all subsets,
+# the join order of more relations is determined greedily
+MAX_DYNAMIC_PROGRAMMING_RELATIONS = 8
+
+
+def _reorder_joins(node):
+    """
+    Reorders the join region (see _is_join_region_node) starting at the given node, or continues with the child-nodes
+    of the given selection or join if it doesn't start a join region.
+    Returns the node that should replace the given node
+    """
+    if _is_join_region_node(node):
+        return _reorder_join_region(node)
+
+    if isinstance(node, Selection):
+        node.node = _node_access_helper(node.node, _reorder_joins, (Selection, AbstractJoin))
+    else:
+        node.left_node = _node_access_helper(node.left_node, _reorder_joins, (Selection, AbstractJoin))
+        node.right_node = _node_access_helper(node.right_node, _reorder_joins, (Selection, AbstractJoin))
+
+    return node
+
+
+def _is_join_region_node(node: AbstractOperator):
+    """
+    Checks whether the given node belongs to a join region, which consists of inner joins with a join condition,
+    cross joins and the selections on top of them. The joins of a join region can be executed in any order.
+    Natural joins (which merge the join columns) and left outer joins are not part of join regions
+    """
+    if isinstance(node, Selection):
+        return _is_join_region_node(node.node)
+
+    return isinstance(node, AbstractJoin) and (node.join_type == JoinType.CROSS or (
+            node.join_type == JoinType.INNER and not node.is_natural))
+
+
+def _reorder_join_region(root: AbstractOperator):
+    """
+    Reorders the joins of the join region starting at the given node.
+    The join conditions and the conditions of the selections in the region are split into their conjuncts, which
+    are evaluated by the first join that joins all relations they reference (or by a selection on the relation, if
+    they reference only one). The join order minimizes the sum of the estimated number of records of all joins
+    (see cost_model.estimate_num_records), which also avoids large cross products. It is determined by dynamic
+    programming for up to MAX_DYNAMIC_PROGRAMMING_RELATIONS relations and greedily for more relations.
+    The original join order is kept if it is not improved or if a condition can not be assigned to the relations.
+    The reordered joins are nested-loops-joins, which are replaced afterwards (see _select_optimal_join). If they
+    change the order of the columns, a projection restores the original order and table name. Otherwise only the
+    (generated) table name of the joined table can differ, which is kept to avoid copying every joined record.
+    Returns the node that should replace the given node
+    """
+    relations = []
+    conditions = []
+    join_masks = []
+    _collect_join_region(root, relations, conditions, join_masks)
+
+    relation_masks = [_get_condition_relation_mask(condition, relations) for condition, _, _ in conditions]
+    table_names = [relation.get_schema().table_name for relation in relations]
+    if None in relation_masks or len(set(table_names)) < len(table_names):
+        return root
+
+    full_mask = (1 << len(relations)) - 1
+    # conditions without columns are evaluated by the last join
+    relation_masks = [relation_mask or full_mask for relation_mask in relation_masks]
+
+    relation_num_records = [estimate_num_records(relation) for relation in relations]
+    selectivities = [estimate_selectivity(condition, [relations[i] for i in range(len(relations))
+                                                      if relation_mask & (1 << i)])
+                     for (condition, _, _), relation_mask in zip(conditions, relation_masks)]
+
+    def estimate_region_num_records(mask, is_condition_applied):
+        num_records = 1.0
+        for i, relation_num_record in enumerate(relation_num_records):
+            if mask & (1 << i):
+                num_records *= relation_num_record
+        for i, selectivity in enumerate(selectivities):
+            if is_condition_applied(i):
+                num_records *= selectivity
+        return num_records
+
+    # the original joins only evaluate the conditions of the joins and selections below them
+    original_cost = sum(estimate_region_num_records(mask, lambda i: (
+            conditions[i][1] | mask == mask and (conditions[i][1] != mask or conditions[i][2])))
+                        for mask in join_masks)
+
+    region_num_records = {}
+
+    def get_num_records(mask):
+        if mask not in region_num_records:
+            region_num_records[mask] = estimate_region_num_records(
+                mask, lambda i: relation_masks[i] | mask == mask)
+        return region_num_records[mask]
+
+    if len(relations) <= MAX_DYNAMIC_PROGRAMMING_RELATIONS:
+        plans = _find_join_order_dynamic_programming(len(relations), get_num_records)
+    else:
+        plans = _find_join_order_greedy(len(relations), get_num_records)
+
+    # a small tolerance ignores rounding differences between equivalent join orders
+    if plans[full_mask][0] >= original_cost * (1 - 1e-9):
+        return root
+
+    single_relation_conditions = [[] for _ in relations]
+    for (condition, _, _), relation_mask in zip(conditions, relation_masks):
+        if relation_mask & (relation_mask - 1) == 0:
+            single_relation_conditions[relation_mask.bit_length() - 1].append(condition)
+
+    def build_join(mask):
+        left_mask = plans[mask][1]
+        if left_mask is None:
+            relation_index = mask.bit_length() - 1
+            relation_conditions = single_relation_conditions[relation_index]
+            if not relation_conditions:
+                return relations[relation_index]
+            return Selection(relations[relation_index], _build_conjunctive_condition(relation_conditions))
+
+        right_mask = mask ^ left_mask
+        join_conditions = [condition for (condition, _, _), relation_mask in zip(conditions, relation_masks)
+                           if relation_mask | mask == mask and relation_mask | left_mask != left_mask and
+                           relation_mask | right_mask != right_mask]
+        if not join_conditions:
+            return NestedLoopsJoin(build_join(left_mask), build_join(right_mask), JoinType.CROSS, None, False)
+        return NestedLoopsJoin(build_join(left_mask), build_join(right_mask), JoinType.INNER,
+                               _build_conjunctive_condition(join_conditions), False)
+
+    reordered_join = build_join(full_mask)
+
+    schema = root.get_schema()
+    reordered_schema = reordered_join.get_schema()
+    if schema.column_names == reordered_schema.column_names:
+        return reordered_join
+
+    return Projection(reordered_join, [(None, ColumnExpression(column_name)) for column_name in schema.column_names],
+                      schema.table_name)
+
+
+def _collect_join_region(node: AbstractOperator, relations, conditions, join_masks):
+    """
+    Collects the relations (the inputs of the join region, which are reordered themselves), the conjuncts of the
+    conditions and the joins of the join region starting at the given node.
+    A relation is represented by its position in relations, a set of relations by a bit mask of these positions.
+    Every condition is added as a tuple (condition, mask, is_join_condition), where mask contains the relations of
+    the join or selection that evaluates it. join_masks contains the relations of every join.
+    Returns the mask of the relations of the given node
+    """
+    if isinstance(node, Selection):
+        mask = _collect_join_region(node.node, relations, conditions, join_masks)
+        conditions.extend((condition, mask, False) for condition in _get_conjuncts(node.condition))
+        return mask
+
+    mask = 0
+    for child_attribute in ("left_node", "right_node"):
+        child_node = getattr(node, child_attribute)
+
+        if _is_join_region_node(child_node):
+            mask |= _collect_join_region(child_node, relations, conditions, join_masks)
+        else:
+            relations.append(_node_access_helper(child_node, _reorder_joins, (Selection, AbstractJoin)))
+            setattr(node, child_attribute, relations[-1])
+            mask |= 1 << (len(relations) - 1)
+
+    if node.join_type != JoinType.CROSS:
+        conditions.extend((condition, mask, True) for condition in _get_conjuncts(node.condition))
+    join_masks.append(mask)
+
+    return mask
+
+
+def _get_conjuncts(condition):
+    if isinstance(condition, ConjunctiveExpression):
+        return [conjunct for sub_condition in condition.conditions for conjunct in _get_conjuncts(sub_condition)]
+
+    return [condition]
+
+
+def _build_conjunctive_condition(conditions):
+    return conditions[0] if len(conditions) == 1 else ConjunctiveExpression(conditions)
+
+
+def _get_condition_relation_mask(condition, relations):
+    """
+    Returns the mask of the relations whose columns are referenced by the given condition, or None if a column is
+    not found in exactly one of the relations
+    """
+    mask = 0
+
+    for column in _get_condition_columns(condition):
+        column_mask = 0
+        for i, relation in enumerate(relations):
+            try:
+                relation.get_schema().get_column_index(column)
+            except TableIndexException:
+                continue
+            except AmbiguousColumnException:
+                return None
+            column_mask |= 1 << i
+
+        if column_mask == 0 or column_mask & (column_mask - 1):
+            return None
+        mask |= column_mask
+
+    return mask
+
+
+def _find_join_order_dynamic_programming(num_relations, get_num_records):
+    """
+    Determines the join order of the given number of relations with the least cost by dynamic programming over all
+    subsets of the relations (including bushy join trees). The cost of a join order is the sum of the number of
+    records of its joins.
+    Returns a dictionary, which maps the mask of every subset to a tuple (cost, left_mask) with the mask of the left
+    input of its best join (None for single relations)
+    """
+    plans = {1 << i: (0, None) for i in range(num_relations)}
+
+    # all subsets of a mask are smaller than the mask itself
+    for mask in range(1, 1 << num_relations):
+        if mask in plans:
+            continue
+
+        lowest_relation_mask = mask & -mask
+        best_plan = None
+        left_mask = (mask - 1) & mask
+        while left_mask:
+            # the left input contains the first relation, so that every split is considered once
+            if left_mask & lowest_relation_mask:
+                plan = (plans[left_mask][0] + plans[mask ^ left_mask][0] + get_num_records(mask), left_mask)
+                if best_plan is None or plan < best_plan:
+                    best_plan = plan
+            left_mask = (left_mask - 1) & mask
+
+        plans[mask] = best_plan
+
+    return plans
+
+
+def _find_join_order_greedy(num_relations, get_num_records):
+    """
+    Determines the join order of the given number of relations greedily, by joining the two join trees with the
+    least number of records in the result until only one join tree is left.
+    Returns a dictionary like _find_join_order_dynamic_programming, that contains the masks of the built join trees
+    """
+    plans = {1 << i: (0, None) for i in range(num_relations)}
+    join_trees = list(plans)
+
+    while len(join_trees) > 1:
+        left_mask, right_mask = min(combinations(join_trees, 2),
+                                    key=lambda masks: get_num_records(masks[0] | masks[1]))
+        if right_mask & -right_mask < left_mask & -left_mask:
+            left_mask, right_mask = right_mask, left_mask
+        mask = left_mask | right_mask
+
+        plans[mask] = (plans[left_mask][0] + plans[right_mask][0] + get_num_records(mask), left_mask)
+        join_trees.remove(left_mask)
+        join_trees.remove(right_mask)
+        join_trees.append(mask)
+
+    return plans
+
+
 def _select_optimal_join(join: AbstractJoin):
-    optimal_join = join
+    """
+    Replaces the given join by the alternative join with the least estimated cost, which gets annotated with its
+    estimated number of records and cost. The alternatives are considered in the order of their preference
+    if they have the same cost. Continues with the joins in the inputs.
+    """
+    left_num_records = estimate_num_records(join.left_node)
+    right_num_records = estimate_num_records(join.right_node)
+    num_records = estimate_num_records(join)
 
-    try:
-        optimal_join = HashJoin(join.left_node, join.right_node,
-                                join.join_type, join.condition, join.is_natural)
-    except (JoinTypeNotSupportedException, JoinConditionNotSupportedException):
-        optimal_join = join
+    alternative_joins = _get_alternative_joins(join) + [join]
+    costs = [estimate_join_cost(alternative_join, left_num_records, right_num_records, num_records)
+             for alternative_join in alternative_joins]
+    optimal_cost = min(costs)
+    optimal_join = alternative_joins[costs.index(optimal_cost)]
+
+    optimal_join.estimated_num_records = num_records
+    optimal_join.estimated_cost = optimal_cost
 
     optimal_join.left_node = _node_access_helper(
         optimal_join.left_node, _select_optimal_join, AbstractJoin)
@@ -73,6 +381,278 @@ def _select_optimal_join(join: AbstractJoin):
     return optimal_join
 
 
+def _get_alternative_joins(join: AbstractJoin):
+    """
+    Returns the joins that can replace the given join: an index-nested-loops-join, a merge join and hash joins
+    building the hash table over the left and the right side, as far as they support the join
+    """
+    alternative_joins = []
+    join_constructors = [IndexNestedLoopsJoin, MergeJoin, HashJoin,
+                         lambda *args: HashJoin(*args, build_right=True)]
+
+    for join_constructor in join_constructors:
+        try:
+            alternative_joins.append(join_constructor(join.left_node, join.right_node, join.join_type,
+                                                      join.condition, join.is_natural))
+        except (JoinTypeNotSupportedException, JoinConditionNotSupportedException, TableNotSortedException):
+            pass
+
+    return alternative_joins
+
+
+def _select_hash_set_operator(set_operator: AbstractSetOperator):
+    """
+    Replaces the given intersect or except operator by its hash-based counterpart (with bag semantics)
+    and does the same for its children.
+    Returns the set operator that should replace the given one
+    """
+    if isinstance(set_operator, Intersect) and not isinstance(set_operator, HashIntersect):
+        set_operator = HashIntersect(set_operator.left_node, set_operator.right_node)
+    elif isinstance(set_operator, Except) and not isinstance(set_operator, HashExcept):
+        set_operator = HashExcept(set_operator.left_node, set_operator.right_node)
+
+    set_operator.left_node = _node_access_helper(
+        set_operator.left_node, _select_hash_set_operator, AbstractSetOperator)
+    set_operator.right_node = _node_access_helper(
+        set_operator.right_node, _select_hash_set_operator, AbstractSetOperator)
+    return set_operator
+
+
+def _apply_set_semantics(distinct: HashDistinct):
+    """
+    Switches a hash-based set operator below the given distinct to set semantics, since the duplicates it
+    would produce with bag semantics get eliminated by the distinct anyways.
+    Projections, selections and orderings in between do not matter, since the distinct
+    only keeps one of the (projected) duplicates.
+    Returns the distinct
+    """
+    node = distinct.node
+
+    while isinstance(node, (Projection, Selection, Ordering)):
+        node = node.node
+
+    if isinstance(node, (HashIntersect, HashExcept)):
+        node.is_set_semantics = True
+
+    distinct.node = _node_access_helper(
+        distinct.node, _apply_set_semantics, HashDistinct)
+    return distinct
+
+
+def _select_optimal_distinct(distinct: HashDistinct):
+    """
+    Replaces the given hash-distinct by a sort-distinct if its input is known to be sorted on all of its columns,
+    since then duplicates are adjacent and only need to be compared with their predecessor.
+    Returns the distinct operator that should replace the given one
+    """
+    distinct.node = _node_access_helper(
+        distinct.node, _select_optimal_distinct, HashDistinct)
+
+    sorted_column_indices = _get_sorted_column_indices(distinct.node)
+    number_of_columns = len(distinct.node.get_schema().column_names)
+
+    if set(sorted_column_indices) == set(range(number_of_columns)):
+        return SortDistinct(distinct.node)
+
+    return distinct
+
+
+def _get_sorted_column_indices(node: AbstractOperator):
+    """
+    Returns the indices of the columns the records of the given node are known to be sorted by
+    (in the order of the sort key), or an empty list if nothing is known about the order of the records.
+    """
+    if isinstance(node, Ordering):
+        schema = node.node.get_schema()
+        return [schema.get_column_index(column.get_result()) for column in node.column_list]
+    elif isinstance(node, IndexRangeSeek):
+        return [node.get_schema().get_column_index(node.index_column)]
+    elif isinstance(node, (Selection, HashDistinct, SortDistinct)):
+        return _get_sorted_column_indices(node.node)
+    elif isinstance(node, Projection):
+        _, _, columns = node._build_schema_columns(node.node.get_schema())
+        projected_indices = {}
+        for index, column in enumerate(columns):
+            if isinstance(column, int):
+                projected_indices.setdefault(column, index)
+
+        sorted_column_indices = []
+
+        # the projection keeps the order for the longest prefix of the sort key it contains
+        for child_index in _get_sorted_column_indices(node.node):
+            if child_index not in projected_indices:
+                break
+            sorted_column_indices.append(projected_indices[child_index])
+
+        return sorted_column_indices
+
+    return []
+
+
+def _prune_columns(node: AbstractOperator, required_column_names=None):
+    """
+    Removes the columns that are not required by the operators above from the inputs of the joins, unions and
+    orderings in the given node, so that their records (e.g. the concatenated records of joins) get smaller.
+    The required columns are computed top-down: every operator requires the columns that are required of its result
+    and the columns it references itself. Distincts and the other set operators compare whole records and therefore
+    require all columns of their inputs. The inputs are narrowed by projections, which are only inserted if they
+    remove columns.
+    required_column_names contains the names of the required columns of the result of the node (None if all
+    columns are required). Returns the node that should replace the given node
+    """
+    schema = node.get_schema()
+    if required_column_names is None:
+        required_column_names = set(schema.column_names)
+
+    if isinstance(node, Projection):
+        node = _merge_projections(node)
+        node.node = _prune_columns(node.node, _get_referenced_column_names(
+            node.node.get_schema(), [column_reference for _, column_reference in node.column_references]))
+    elif isinstance(node, HashAggregate):
+        node.node = _prune_columns(node.node, _get_referenced_column_names(
+            node.node.get_schema(), [group_name for _, group_name in node.group_names] +
+                                    [aggregation[2] for aggregation in node.aggregations]))
+    elif isinstance(node, Selection):
+        node.node = _prune_columns(node.node, required_column_names | _get_referenced_column_names(
+            schema, [node.condition]))
+    elif isinstance(node, Ordering):
+        node.node = _prune_input_columns(node.node, required_column_names | _get_referenced_column_names(
+            schema, node.column_list))
+    elif isinstance(node, AbstractJoin):
+        _prune_join_columns(node, required_column_names)
+    elif isinstance(node, Union):
+        # the columns of both inputs are matched by their position
+        required_column_indices = [i for i, column_name in enumerate(schema.column_names)
+                                   if column_name in required_column_names]
+        for child_attribute in ("left_node", "right_node"):
+            child_node = getattr(node, child_attribute)
+            child_column_names = child_node.get_schema().column_names
+            setattr(node, child_attribute, _prune_input_columns(
+                child_node, {child_column_names[i] for i in required_column_indices}))
+    elif isinstance(node, (AbstractSetOperator, HashDistinct, SortDistinct, Explain)):
+        # all columns of the inputs are required
+        for child_attribute in ("left_node", "right_node") if isinstance(node, AbstractSetOperator) else ("node",):
+            setattr(node, child_attribute, _prune_columns(getattr(node, child_attribute)))
+
+    return node
+
+
+def _prune_join_columns(join: AbstractJoin, required_column_names):
+    """
+    Narrows the inputs of the given join to the required columns of its result and its join columns.
+    The indexed table scan of an index-nested-loops-join is not narrowed, as its index is probed directly
+    """
+    # makes sure that the (padded) schemas of the child-nodes are up to date
+    join.get_schema()
+    condition_columns = _get_condition_columns(join.condition) if join.condition is not None else []
+
+    for child_attribute, padded_schema in (("left_node", join.left_schema), ("right_node", join.right_schema)):
+        child_node = getattr(join, child_attribute)
+        child_column_names = child_node.get_schema().column_names
+        child_required_column_names = {column_name for column_name in child_column_names
+                                       if column_name in required_column_names}
+
+        for column in condition_columns:
+            try:
+                child_required_column_names.add(child_column_names[padded_schema.get_column_index(column)])
+            except TableIndexException:
+                pass
+
+        if isinstance(join, IndexNestedLoopsJoin) and child_node is join.get_indexed_node():
+            setattr(join, child_attribute, _prune_columns(child_node, child_required_column_names))
+        else:
+            setattr(join, child_attribute, _prune_input_columns(child_node, child_required_column_names))
+
+
+def _prune_input_columns(node: AbstractOperator, required_column_names):
+    """
+    Prunes the columns of the given input of a join, union or ordering and narrows it to its required columns
+    (keeping at least one column). A projection is narrowed itself, otherwise a projection is added if it removes
+    columns and the columns can be referenced unambiguously.
+    Returns the node that should replace the given node
+    """
+    column_names = node.get_schema().column_names
+    projected_column_names = [column_name for column_name in column_names if column_name in required_column_names]
+
+    if len(projected_column_names) == len(column_names):
+        return _prune_columns(node, required_column_names)
+    if not projected_column_names:
+        projected_column_names = column_names[:1]
+
+    if isinstance(node, Projection):
+        return _prune_columns(Projection(node.node, [column_reference for column_reference, column_name in
+                                                     zip(node.column_references, column_names)
+                                                     if column_name in projected_column_names], node.table_name))
+
+    node = _prune_columns(node, set(projected_column_names))
+    schema = node.get_schema()
+    if schema.column_names == projected_column_names:
+        return node
+
+    try:
+        if len({schema.get_column_index(column_name) for column_name in projected_column_names}) < \
+                len(projected_column_names):
+            return node
+    except AmbiguousColumnException:
+        return node
+
+    return Projection(node, [(None, ColumnExpression(column_name)) for column_name in projected_column_names])
+
+
+def _merge_projections(projection: Projection):
+    """
+    Merges the given projection with its child-projection if the child-projection only renames or reorders the
+    columns of its input (without removing any), so that the records are only copied once. The columns referenced by the given projection are replaced by the
+    columns of the input of the child-projection.
+    Returns the merged projection or the given projection if they can't be merged
+    """
+    child_projection = projection.node
+    if not isinstance(child_projection, Projection) or not all(
+            isinstance(column_reference, ColumnExpression) for _, column_reference in child_projection.column_references):
+        return projection
+
+    child_schema = child_projection.get_schema()
+    input_schema = child_projection.node.get_schema()
+    _, _, input_column_indices = build_schema(child_projection.column_references, input_schema)
+    if sorted(input_column_indices) != list(range(len(input_schema.column_names))):
+        return projection
+
+    column_replacement = {}
+    try:
+        for _, column_reference in projection.column_references:
+            for column in _get_condition_columns(column_reference):
+                input_column_index = input_column_indices[child_schema.get_column_index(column)]
+                input_column_name = input_schema.column_names[input_column_index]
+                if input_schema.get_column_index(input_column_name) != input_column_index:
+                    return projection
+                column_replacement[column] = input_column_name
+    except (TableIndexException, AmbiguousColumnException):
+        return projection
+
+    column_references = []
+    for alias, column_reference in projection.column_references:
+        if alias is None and isinstance(column_reference, ColumnExpression):
+            # keeps the name of the column of the child-projection, which is either an alias or the column name of
+            # its input
+            column_name = child_schema.column_names[child_schema.get_column_index(column_reference.get_result())]
+            if "." not in column_name:
+                alias = column_name
+        _replace_condition_columns(column_reference, column_replacement)
+        column_references.append((alias, column_reference))
+
+    table_name = child_schema.table_name if projection.table_name is None else projection.table_name
+
+    return _merge_projections(Projection(child_projection.node, column_references, table_name))
+
+
+def _get_referenced_column_names(schema: Schema, expressions):
+    """
+    Returns the names of the columns of the given schema that are referenced in the given expressions
+    """
+    return {schema.column_names[schema.get_column_index(column)]
+            for expression in expressions for column in _get_condition_columns(expression)}
+
+
 def _node_access_helper(node: AbstractCompileNode, function, searched_node_class):
     """
     Helper function to access the nodes of the specified class recursively in the given node.
@@ -88,7 +668,7 @@ def _node_access_helper(node: AbstractCompileNode, function, searched_node_class
             node.left_node, function, searched_node_class)
         node.right_node = _node_access_helper(
             node.right_node, function, searched_node_class)
-    elif isinstance(node, (Ordering, Projection, HashAggregate, HashDistinct, Selection, Explain)):
+    elif isinstance(node, (Ordering, Projection, HashAggregate, HashDistinct, SortDistinct, Selection, Explain)):
         node.node = _node_access_helper(
             node.node, function, searched_node_class)
 
@@ -493,6 +1073,12 @@ def _apply_index_seek(selection: Selection):
                 potential_candidate_selection.condition)
             if index_exists(table_name, column_name):
                 candidate_selections.append((potential_candidate_selection, pcs_parent))
+
+        # a composite index replaces multiple selections, a single column of it is only used without other indices
+        composite_index_seek = _apply_composite_index_seek(selection, node, 1 if not candidate_selections else 2)
+        if composite_index_seek is not None:
+            return composite_index_seek
+
         if candidate_selections:
             # choose a selection and merge with the table scan into an index seek
             index_seek, best_selection, bs_parent = _get_best_index_seek_for_candidates(candidate_selections, node)
@@ -507,6 +1093,8 @@ def _apply_index_seek(selection: Selection):
                 # the topmost selection was chosen for the index seek (i.e. the one we got as function parameter).
                 # replace the topmost selection of the branch by just returning its child node
                 return best_selection.node
+        else:
+            return _apply_index_range_seek(selection, node)
 
     # if other operator than table scan after selections, continue traversing tree
     else:
@@ -519,17 +1107,126 @@ def _apply_index_seek(selection: Selection):
 
 def _is_condition_suitable_for_index_seek(condition):
     """
-    Checks whether the condition is a simple comparative that checks the equality between a column and a literal.
+    Checks whether the condition is a simple comparative that checks the equality between a column and a literal
+    or a parameter.
     """
     if isinstance(condition, ComparativeExpression) and condition.operator == ComparativeOperator.EQUAL:
-        column_eq_literal = isinstance(condition.left, ColumnExpression) and isinstance(condition.right,
-                                                                                        LiteralExpression)
-        literal_eq_column = isinstance(condition.left, LiteralExpression) and isinstance(condition.right,
-                                                                                         ColumnExpression)
+        column_eq_literal = isinstance(condition.left, ColumnExpression) and isinstance(
+            condition.right, (LiteralExpression, ParameterExpression))
+        literal_eq_column = isinstance(condition.left, (LiteralExpression, ParameterExpression)) and isinstance(
+            condition.right, ColumnExpression)
         return column_eq_literal or literal_eq_column
     return False
 
 
+def _apply_index_range_seek(selection: Selection, table_scan: TableScan):
+    """
+    Merges the selections of the given consecutive selections (ending at the given table scan), whose conditions are
+    comparisons of the same column with an ordered index and a literal, with the table scan into an index range seek.
+    If there are range selections on multiple columns with ordered indices, the column with the least matching
+    records is chosen. Returns the top-level node that should replace the selection.
+    """
+    selections = []
+    node = selection
+    while isinstance(node, Selection):
+        selections.append(node)
+        node = node.node
+
+    range_selections = dict()
+    for range_selection in selections:
+        if _is_condition_suitable_for_index_range_seek(range_selection.condition):
+            column_name = _get_simple_column_name_from_condition_for_index_seek(range_selection.condition)
+            if ordered_index_exists(table_scan.table_name, column_name):
+                range_selections.setdefault(column_name, []).append(range_selection)
+
+    if not range_selections:
+        return selection
+
+    index_range_seek, chosen_selections = min(
+        ((IndexRangeSeek(table_scan.table_name, column_name, [s.condition for s in column_selections],
+                         table_scan.alias), column_selections)
+         for column_name, column_selections in range_selections.items()),
+        key=lambda candidate: candidate[0].get_num_records())
+
+    return _replace_selections(selections, chosen_selections, index_range_seek)
+
+
+def _apply_composite_index_seek(selection: Selection, table_scan: TableScan, min_columns):
+    """
+    Merges the selections of the given consecutive selections (ending at the given table scan), whose conditions are
+    equalities between a column and a literal, with the table scan into an index seek on a composite index.
+    The equalities need to cover at least min_columns columns of the index, either all of its columns or (for ordered
+    indices) a prefix of them. The index with the most covered columns is chosen, or the one with the least matching
+    records if multiple indices cover the same number of columns.
+    Returns the top-level node that should replace the selection, or None if no composite index can be used.
+    """
+    selections = []
+    node = selection
+    while isinstance(node, Selection):
+        selections.append(node)
+        node = node.node
+
+    equality_selections = dict()
+    for equality_selection in selections:
+        if _is_condition_suitable_for_index_seek(equality_selection.condition):
+            column_name = _get_simple_column_name_from_condition_for_index_seek(equality_selection.condition)
+            equality_selections.setdefault(column_name, equality_selection)
+
+    candidates = []
+    for index_column in retrieve_table_indices(table_scan.table_name):
+        index_columns = get_index_columns(index_column)
+        if len(index_columns) < 2:
+            continue
+
+        covered_selections = []
+        for column in index_columns:
+            if column not in equality_selections:
+                break
+            covered_selections.append(equality_selections[column])
+
+        is_covered = len(covered_selections) == len(index_columns) or \
+            ordered_index_exists(table_scan.table_name, index_column)
+        if len(covered_selections) >= min_columns and is_covered:
+            index_seek = IndexSeek(table_scan.table_name, index_column,
+                                   ConjunctiveExpression([s.condition for s in covered_selections]), table_scan.alias)
+            candidates.append((index_seek, covered_selections))
+
+    if not candidates:
+        return None
+
+    index_seek, chosen_selections = min(
+        candidates, key=lambda candidate: (-len(candidate[1]), estimate_num_records(candidate[0])))
+
+    return _replace_selections(selections, chosen_selections, index_seek)
+
+
+def _replace_selections(selections, replaced_selections, node):
+    """
+    Replaces the given consecutive selections and the node at their bottom end by the given node, keeping the
+    selections that are not replaced on top of it. Returns the top-level node
+    """
+    for remaining_selection in reversed([s for s in selections if s not in replaced_selections]):
+        remaining_selection.node = node
+        node = remaining_selection
+
+    return node
+
+
+def _is_condition_suitable_for_index_range_seek(condition):
+    """
+    Checks whether the condition is a simple comparative that compares a column and a literal with <, <=, > or >=.
+    """
+    if isinstance(condition, ComparativeExpression) and condition.operator in (
+            ComparativeOperator.SMALLER, ComparativeOperator.SMALLER_EQUAL,
+            ComparativeOperator.GREATER, ComparativeOperator.GREATER_EQUAL):
+        column_literal = isinstance(condition.left, ColumnExpression) and isinstance(condition.right,
+                                                                                     LiteralExpression)
+        literal_column = isinstance(condition.left, LiteralExpression) and isinstance(condition.right,
+                                                                                      ColumnExpression)
+        return column_literal or literal_column
+    return False
+
+
 def _get_simple_column_name_from_condition_for_index_seek(condition):
     """
     Retrieves the column name from a condition that is suitable for an index seek.
@@ -546,22 +1243,30 @@ def _get_simple_column_name_from_condition_for_index_seek(condition):
 def _get_best_index_seek_for_candidates(candidate_selections, target_table):
     """
     Chooses the best selection to replace with an index seek.
-    The best selection is the selection that returns the least number of rows.
+    The best selection is the selection that returns the least number of rows, which is estimated with the
+    statistics of the table, so the index seeks do not need to be executed for it. Equalities with parameters
+    are estimated with the average number of records per value, as their values are only known at execution.
     """
 
     result_selection = None
-    result_index = None
     min_entries = float('inf')
+    statistics = retrieve_statistics(target_table.table_name)
 
     for candidate in candidate_selections:
-
-        index = IndexSeek(target_table.table_name,
-                          _get_simple_column_name_from_condition_for_index_seek(candidate[0].condition),
-                          candidate[0].condition, target_table.alias)
-        num_entries = index.get_num_records()
+        condition = candidate[0].condition
+        column_statistics = statistics.get_column_statistics(
+            _get_simple_column_name_from_condition_for_index_seek(condition))
+        literal = condition.left if isinstance(condition.right, ColumnExpression) else condition.right
+        if isinstance(literal, ParameterExpression):
+            num_entries = column_statistics.estimate_average_equal_count()
+        else:
+            num_entries = column_statistics.estimate_equal_count(literal.get_result())
         if num_entries <= min_entries:
-            result_index = index
             result_selection = candidate
             min_entries = num_entries
 
+    result_index = IndexSeek(target_table.table_name,
+                             _get_simple_column_name_from_condition_for_index_seek(result_selection[0].condition),
+                             result_selection[0].condition, target_table.alias)
+
     return result_index, result_selection[0], result_selection[1]
@@ -7,6 +7,8 @@ from parsimonious.exceptions import ParseError
 from parsimonious.nodes import Node
 
 from .grammar import grammar as _grammar
+from .query_parser import QueryParser
+from .tokenizer import QuerySyntaxException
 
 
 class ParsingResult:
@@ -49,3 +51,20 @@ def parse_query(query: str):
 
     # Pack the result into a `CompilationResult`.
     return ParsingResult(ast, error)
+
+
+def compile_query(query: str):
+    """Parses the given query and builds its execution plan.
+
+    This uses the recursive-descent parser (see query_parser.py), which builds
+    the execution plan directly instead of parsing the query into an AST with
+    the grammar and compiling it with the ASTVisitor.
+
+    Args:
+        query (str): the query that should be compiled.
+
+    Returns a tuple (execution_plan, parameters), like
+    compiler.compile_with_parameters.
+    Raises a QuerySyntaxException if the query is not valid.
+    """
+    return QueryParser(query).parse()
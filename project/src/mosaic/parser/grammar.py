@@ -89,7 +89,7 @@ grammar = Grammar(r"""
     multiplicative_term  = term multiplicative*
     multiplicative       = multiplication_operator ws term
     multiplication_operator = "*" / "/"
-    term                 = parens / literal / column_name
+    term                 = parens / literal / parameter / column_name
     parens               = "(" ws expression ")" ws
 
     separator       = "," ws
@@ -100,6 +100,10 @@ grammar = Grammar(r"""
     null_literal    = ~"null"i ws
     literal         = float_literal / int_literal / varchar_literal / null_literal
 
+    positional_parameter = "?" ws
+    named_parameter      = ~":[a-zA-Z_][a-zA-Z0-9_]*" ws
+    parameter            = positional_parameter / named_parameter
+
     table_name      = ~"[\\#a-zA-Z][\\#a-zA-Z0-9]*"
     column_name     = ~"[\\#a-zA-Z_][\\#a-zA-Z0-9_]*(\\.[\\#a-zA-Z_][\\#a-zA-Z0-9_]*)?" ws
     name            = ~"[\\#a-zA-Z_][\\#a-zA-Z0-9_]*(\\.[\\#a-zA-Z_][\\#a-zA-Z0-9_]*)?" ws
@@ -0,0 +1,602 @@
+"""This file contains the recursive-descent query parser.
+
+The parser accepts the language of the grammar in grammar.py, but builds the
+execution plan directly from the tokens of the query (see tokenizer.py),
+without building and visiting the syntax tree of the parsimonious parser.
+Each parse method corresponds to a rule of the grammar. Like the PEG, the
+parser backtracks to the next alternative of a rule if an alternative does
+not match (e.g. "pi" is a table name, if it is not followed by a projection).
+
+The operators are only built after the whole query was parsed, so that
+syntax errors are reported before errors about the referenced tables, like
+by the parsimonious parser and the ASTVisitor. For that the methods that
+parse operators return a function that builds the operator.
+"""
+
+import re
+
+from mosaic.compiler.expressions.arithmetic_expression import ArithmeticExpression, ArithmeticOperator
+from mosaic.compiler.expressions.column_expression import ColumnExpression
+from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from mosaic.compiler.expressions.conjunctive_expression import ConjunctiveExpression
+from mosaic.compiler.expressions.disjunctive_expression import DisjunctiveExpression
+from mosaic.compiler.expressions.literal_expression import LiteralExpression
+from mosaic.compiler.expressions.parameter_expression import ParameterExpression, QueryParameters, \
+    check_no_parameters
+from mosaic.compiler.operators.abstract_join import JoinType
+from mosaic.compiler.operators.explain import Explain
+from mosaic.compiler.operators.hash_aggregate import AggregateFunction, HashAggregate
+from mosaic.compiler.operators.hash_distinct import HashDistinct
+from mosaic.compiler.operators.nested_loops_join import NestedLoopsJoin
+from mosaic.compiler.operators.ordering import Ordering
+from mosaic.compiler.operators.projection import Projection
+from mosaic.compiler.operators.selection import Selection
+from mosaic.compiler.operators.set_operators import Except, Intersect, Union
+from mosaic.compiler.operators.table_scan import TableScan
+
+from .tokenizer import END, FLOAT, INT, NAME, OPERATOR, PARAMETER, VARCHAR, QuerySyntaxException, Token, \
+    get_line_and_column, tokenize
+
+# table names are more restricted than the other names, e.g. they can not contain "_"
+_TABLE_NAME_PATTERN = re.compile(r"[#a-zA-Z][#a-zA-Z0-9]*")
+
+# the maximum number of tokens the parser looks ahead (for keywords like "natural left join")
+_MAX_LOOKAHEAD = 2
+
+_SET_OPERATORS = {
+    "union": Union,
+    "intersect": Intersect,
+    "except": Except,
+}
+
+_COMPARATIVE_OPERATORS = {operator.value: operator for operator in ComparativeOperator}
+
+_ADDITIVE_OPERATORS = {
+    "+": ArithmeticOperator.ADD,
+    "-": ArithmeticOperator.SUBTRACT,
+}
+
+_MULTIPLICATIVE_OPERATORS = {
+    "*": ArithmeticOperator.TIMES,
+    "/": ArithmeticOperator.DIVIDE,
+}
+
+_AGGREGATE_FUNCTIONS = {
+    "sum": AggregateFunction.SUM,
+    "avg": AggregateFunction.AVG,
+    "min": AggregateFunction.MIN,
+    "max": AggregateFunction.MAX,
+    "count": AggregateFunction.COUNT,
+}
+
+
+class QueryParser:
+    """Recursive-descent parser for a single query (or explain command)."""
+
+    def __init__(self, query: str):
+        """Creates a QueryParser.
+
+        Args:
+            query (str): the query that should be parsed.
+        """
+        self.query = query
+        tokens = tokenize(query)
+        # the END token is repeated, so that the parser can look ahead beyond it (see _peek)
+        self.tokens = tokens + tokens[-1:] * _MAX_LOOKAHEAD
+        self.position = 0
+        self.parameters = QueryParameters()
+
+    def parse(self):
+        """Parses the query and builds its execution plan.
+
+        Returns a tuple (execution_plan, parameters), like
+        compiler.compile_with_parameters.
+        """
+        build_command = self._parse_command()
+
+        if self._peek().kind != END:
+            raise self._error("end of query")
+
+        return build_command(), self.parameters
+
+    ####################
+    # Tokens
+    ####################
+    def _peek(self, offset=0):
+        return self.tokens[self.position + offset]
+
+    def _advance(self):
+        token = self.tokens[self.position]
+        if token.kind != END:
+            self.position += 1
+        return token
+
+    def _is_keyword(self, *keywords):
+        """Checks if the next tokens are the given keywords.
+
+        Like in the grammar, the words of a multi-word keyword (e.g. "order
+        by") are separated by a single space and a keyword is followed by
+        whitespace.
+        """
+        for offset, keyword in enumerate(keywords):
+            token = self._peek(offset)
+            if token.keyword != keyword:
+                return False
+
+            if offset > 0:
+                previous_token = self._peek(offset - 1)
+                if self.query[previous_token.position + len(previous_token.text):token.position] != " ":
+                    return False
+
+        return self._is_followed_by_whitespace(self._peek(len(keywords) - 1))
+
+    def _is_followed_by_whitespace(self, token):
+        end = token.position + len(token.text)
+        return end < len(self.query) and self.query[end].isspace()
+
+    def _accept_keyword(self, *keywords):
+        if not self._is_keyword(*keywords):
+            return False
+
+        self.position += len(keywords)
+        return True
+
+    def _expect_keyword(self, *keywords):
+        if not self._accept_keyword(*keywords):
+            raise self._error(f"'{' '.join(keywords)}'")
+
+    def _is_operator(self, operator):
+        return self._is_operator_at(0, operator)
+
+    def _is_operator_at(self, offset, operator):
+        token = self._peek(offset)
+        return token.kind == OPERATOR and token.text == operator
+
+    def _accept_operator(self, operator):
+        if not self._is_operator(operator):
+            return False
+
+        self.position += 1
+        return True
+
+    def _expect_operator(self, operator):
+        if not self._accept_operator(operator):
+            raise self._error(f"'{operator}'")
+
+    def _split_token(self, length):
+        """Splits the next token after the given number of characters and
+        tokenizes the rest of it again.
+
+        The tokens are replaced by a new list, so that backtracking (see
+        _try) restores the original tokens.
+        """
+        token = self._peek()
+        if len(token.text) == length:
+            return
+
+        first_token = Token(token.kind, token.text[:length], token.keyword[:length], token.position)
+        rest_tokens = tokenize(self.query, token.position + length, token.position + len(token.text))[:-1]
+        self.tokens = self.tokens[:self.position] + [first_token] + rest_tokens + self.tokens[self.position + 1:]
+
+    def _expect_name(self):
+        token = self._peek()
+        if token.kind != NAME:
+            raise self._error("name")
+
+        return self._advance().text
+
+    def _error(self, expected):
+        token = self._peek()
+        found = "end of query" if token.kind == END else f"'{token.text}'"
+
+        return QuerySyntaxException(f"Expected {expected}, but found {found} "
+                                    f"({get_line_and_column(self.query, token.position)})")
+
+    ####################
+    # Backtracking
+    ####################
+    def _try(self, parse_function):
+        """Calls the given parse method and returns its result.
+
+        Returns None and restores the state of the parser if the tokens do
+        not match, so that the next alternative can be tried.
+        """
+        tokens = self.tokens
+        position = self.position
+        num_positional = self.parameters.num_positional
+        num_names = len(self.parameters.names)
+
+        try:
+            return parse_function()
+        except QuerySyntaxException:
+            self.tokens = tokens
+            self.position = position
+            self.parameters.num_positional = num_positional
+            del self.parameters.names[num_names:]
+
+            return None
+
+    ####################
+    # Commands
+    ####################
+    def _parse_command(self):
+        if self._is_keyword("explain"):
+            build_explain = self._try(self._parse_explain_command)
+            if build_explain is not None:
+                return build_explain
+
+        return self._parse_query()
+
+    def _parse_explain_command(self):
+        self._expect_keyword("explain")
+        build_query = self._parse_query()
+
+        return lambda: Explain(build_query())
+
+    def _parse_query(self):
+        build_left = self._parse_set_factor()
+        set_operations = []
+
+        while self._peek().keyword in _SET_OPERATORS:
+            set_operation = self._try(self._parse_set_operation)
+            if set_operation is None:
+                break
+            set_operations.append(set_operation)
+
+        if not set_operations:
+            return build_left
+
+        def build_query():
+            node = build_left()
+            for operator_class, build_right in set_operations:
+                node = operator_class(node, build_right())
+            return node
+
+        return build_query
+
+    def _parse_set_operation(self):
+        keyword = self._peek().keyword
+        self._expect_keyword(keyword)
+        operator_class = _SET_OPERATORS[keyword]
+
+        return operator_class, self._parse_set_factor()
+
+    def _parse_set_factor(self):
+        build_left = self._parse_join_factor()
+        joins = []
+
+        while self._is_join_operator():
+            join = self._try(self._parse_join)
+            if join is None:
+                break
+            joins.append(join)
+
+        if not joins:
+            return build_left
+
+        def build_set_factor():
+            node = build_left()
+            for join_type, condition, build_right in joins:
+                node = NestedLoopsJoin(node, build_right(), join_type, condition=condition,
+                                       is_natural=(condition is None))
+            return node
+
+        return build_set_factor
+
+    def _is_join_operator(self):
+        if self._peek().keyword not in ("join", "left", "cross", "natural"):
+            return False
+
+        return self._is_keyword("join") or self._is_keyword("left", "join") or self._is_keyword("cross", "join") or \
+            self._is_keyword("natural", "join") or self._is_keyword("natural", "left", "join")
+
+    def _parse_join(self):
+        condition = None
+
+        if self._accept_keyword("natural", "left", "join"):
+            join_type = JoinType.LEFT_OUTER
+        elif self._accept_keyword("natural", "join"):
+            join_type = JoinType.INNER
+        elif self._accept_keyword("cross", "join"):
+            join_type = JoinType.CROSS
+        elif self._accept_keyword("left", "join"):
+            join_type = JoinType.LEFT_OUTER
+            condition = self._parse_expression()
+        else:
+            self._expect_keyword("join")
+            join_type = JoinType.INNER
+            condition = self._parse_expression()
+
+        return join_type, condition, self._parse_join_factor()
+
+    def _parse_join_factor(self):
+        keyword = self._peek().keyword
+        parse_function = None
+
+        if keyword in ("pi", "select"):
+            parse_function = self._parse_projection
+        elif keyword in ("sigma", "where"):
+            parse_function = self._parse_selection
+        elif keyword == "tau" or self._is_keyword("order", "by"):
+            parse_function = self._parse_ordering
+        elif keyword == "gamma" or self._is_keyword("group", "by"):
+            parse_function = self._parse_grouping
+
+        if parse_function is not None:
+            build_node = self._try(parse_function)
+            if build_node is not None:
+                return build_node
+
+        if self._is_operator("(") or (self._is_keyword("from") and self._is_operator_at(1, "(")):
+            return self._parse_paren_query()
+
+        return self._parse_relation_reference()
+
+    def _parse_projection(self):
+        if not self._accept_keyword("pi"):
+            self._expect_keyword("select")
+
+        if self._is_keyword("distinct"):
+            build_projection = self._try(lambda: self._parse_projection_columns(distinct=True))
+            if build_projection is not None:
+                return build_projection
+
+        return self._parse_projection_columns(distinct=False)
+
+    def _parse_projection_columns(self, distinct):
+        if distinct:
+            self._expect_keyword("distinct")
+
+        column_expressions = self._parse_column_list()
+        build_input = self._parse_join_factor()
+
+        def build_projection():
+            input_node = build_input()
+            check_no_parameters(column_expressions, "projected columns")
+
+            projection = Projection(input_node, column_expressions)
+            return HashDistinct(projection) if distinct else projection
+
+        return build_projection
+
+    def _parse_selection(self):
+        if not self._accept_keyword("sigma"):
+            self._expect_keyword("where")
+        condition = self._parse_expression()
+        build_input = self._parse_join_factor()
+
+        return lambda: Selection(build_input(), condition)
+
+    def _parse_ordering(self):
+        if not self._accept_keyword("tau"):
+            self._expect_keyword("order", "by")
+
+        expressions = [self._parse_expression()]
+        while self._accept_operator(","):
+            expressions.append(self._parse_expression())
+        build_input = self._parse_join_factor()
+
+        def build_ordering():
+            input_node = build_input()
+            check_no_parameters([(None, expression) for expression in expressions], "ordering columns")
+
+            return Ordering(input_node, expressions)
+
+        return build_ordering
+
+    def _parse_grouping(self):
+        if not self._accept_keyword("gamma"):
+            self._expect_keyword("group", "by")
+
+        build_grouping = self._try(lambda: self._parse_aggregation(with_group_columns=True))
+        if build_grouping is not None:
+            return build_grouping
+
+        # aggregation over the super group
+        return self._parse_aggregation(with_group_columns=False)
+
+    def _parse_aggregation(self, with_group_columns):
+        group_columns = self._parse_column_list() if with_group_columns else []
+        self._expect_keyword("aggregate")
+
+        aggregate_columns = [self._parse_aggregate_column()]
+        while self._accept_operator(","):
+            aggregate_columns.append(self._parse_aggregate_column())
+        build_input = self._parse_join_factor()
+
+        def build_grouping():
+            input_node = build_input()
+            check_no_parameters(group_columns, "group columns")
+            check_no_parameters([(name, expression) for name, _, expression in aggregate_columns], "aggregates")
+
+            return HashAggregate(input_node, group_columns, _nest_aggregate_columns(aggregate_columns))
+
+        return build_grouping
+
+    def _parse_aggregate_column(self):
+        name = self._expect_name()
+        self._expect_keyword("as")
+
+        aggregate_function = _AGGREGATE_FUNCTIONS.get(self._peek().keyword)
+        if aggregate_function is None:
+            raise self._error("aggregate function")
+        self._advance()
+
+        self._expect_operator("(")
+        expression = self._parse_expression()
+        self._expect_operator(")")
+
+        return name, aggregate_function, expression
+
+    def _parse_paren_query(self):
+        self._accept_keyword("from")
+        self._expect_operator("(")
+        build_query = self._parse_query()
+        self._expect_operator(")")
+
+        return build_query
+
+    def _parse_relation_reference(self):
+        # like the optional from keyword of the grammar, "from" followed by whitespace is always a keyword
+        self._accept_keyword("from")
+
+        token = self._peek()
+        if token.kind != NAME or not _TABLE_NAME_PATTERN.fullmatch(token.text):
+            raise self._error("table name")
+        table_name = self._advance().text
+
+        if self._is_keyword("as") and self._peek(1).kind == NAME:
+            self._advance()
+            alias = self._advance().text
+
+            return lambda: TableScan(table_name, alias)
+
+        return lambda: TableScan(table_name)
+
+    ####################
+    # References
+    ####################
+    def _parse_column_list(self):
+        columns = [self._parse_column_reference()]
+        while self._accept_operator(","):
+            columns.append(self._parse_column_reference())
+
+        return columns
+
+    def _parse_column_reference(self):
+        name = self._expect_name()
+
+        # "as" is case-sensitive in column references
+        token = self._peek()
+        if token.text == "as" and token.kind == NAME and self._is_followed_by_whitespace(token):
+            expression = self._try(self._parse_column_alias_expression)
+            if expression is not None:
+                return name, expression
+
+        return None, ColumnExpression(name)
+
+    def _parse_column_alias_expression(self):
+        self._advance()
+        return self._parse_expression()
+
+    ####################
+    # Expressions
+    ####################
+    def _parse_expression(self):
+        conditions = [self._parse_conjunctive_term()]
+
+        while self._peek().keyword == "or":
+            condition = self._try(self._parse_disjunctive)
+            if condition is None:
+                break
+            conditions.append(condition)
+
+        return DisjunctiveExpression(conditions) if len(conditions) > 1 else conditions[0]
+
+    def _parse_disjunctive(self):
+        self._expect_keyword("or")
+        return self._parse_conjunctive_term()
+
+    def _parse_conjunctive_term(self):
+        conditions = [self._parse_comparative_term()]
+
+        while self._peek().keyword == "and":
+            condition = self._try(self._parse_conjunctive)
+            if condition is None:
+                break
+            conditions.append(condition)
+
+        return ConjunctiveExpression(conditions) if len(conditions) > 1 else conditions[0]
+
+    def _parse_conjunctive(self):
+        self._expect_keyword("and")
+        return self._parse_comparative_term()
+
+    def _parse_comparative_term(self):
+        left = self._parse_additive_term()
+
+        token = self._peek()
+        while token.kind == OPERATOR and token.text in _COMPARATIVE_OPERATORS:
+            self._advance()
+            operator = _COMPARATIVE_OPERATORS[token.text]
+            left = ComparativeExpression(left, operator, self._parse_additive_term())
+            token = self._peek()
+
+        return left
+
+    def _parse_additive_term(self):
+        left = self._parse_multiplicative_term()
+
+        token = self._peek()
+        while token.kind == OPERATOR and token.text in _ADDITIVE_OPERATORS:
+            self._advance()
+            operator = _ADDITIVE_OPERATORS[token.text]
+            left = ArithmeticExpression(left, operator, self._parse_multiplicative_term())
+            token = self._peek()
+
+        return left
+
+    def _parse_multiplicative_term(self):
+        left = self._parse_term()
+
+        token = self._peek()
+        while token.kind == OPERATOR and token.text in _MULTIPLICATIVE_OPERATORS:
+            self._advance()
+            operator = _MULTIPLICATIVE_OPERATORS[token.text]
+            left = ArithmeticExpression(left, operator, self._parse_term())
+            token = self._peek()
+
+        return left
+
+    def _parse_term(self):
+        token = self._peek()
+
+        if token.kind == NAME:
+            if token.keyword.startswith("null"):
+                # like the grammar, which matches the null literal as a prefix, e.g. "nullName" is read as null
+                # followed by "Name"
+                self._split_token(len("null"))
+                self._advance()
+                return LiteralExpression(None)
+
+            self._advance()
+            return ColumnExpression(token.text)
+        elif token.kind == INT:
+            self._advance()
+            return LiteralExpression(int(token.text))
+        elif token.kind == FLOAT:
+            self._advance()
+            return LiteralExpression(float(token.text))
+        elif token.kind == VARCHAR:
+            self._advance()
+            return LiteralExpression(token.text[1:-1])
+        elif token.kind == PARAMETER:
+            self._advance()
+            if token.text == "?":
+                return ParameterExpression(self.parameters.add_positional(), self.parameters)
+            return ParameterExpression(self.parameters.add_named(token.text[1:]), self.parameters)
+        elif self._is_operator("("):
+            self._advance()
+            expression = self._parse_expression()
+            self._expect_operator(")")
+            return expression
+        elif self._is_operator("-") and self._peek(1).kind in (INT, FLOAT) and \
+                self._peek(1).position == token.position + 1:
+            # negative number literal (there must not be whitespace between the sign and the number)
+            self._advance()
+            number = self._advance()
+            return LiteralExpression(int("-" + number.text) if number.kind == INT else float("-" + number.text))
+
+        raise self._error("expression")
+
+
+def _nest_aggregate_columns(aggregate_columns):
+    """
+    Nests the aggregate columns like the compiler does for the aggregate_list rule of the grammar, e.g. for three
+    columns: [[column1, [], [[column2, [], [column3]]]]] (see hash_aggregate.extract)
+    """
+    nested_columns = [aggregate_columns[-1]]
+    for aggregate_column in reversed(aggregate_columns[:-1]):
+        nested_columns = [[aggregate_column, [], nested_columns]]
+
+    return nested_columns
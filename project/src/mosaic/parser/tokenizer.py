@@ -0,0 +1,79 @@
+"""This file contains the tokenizer of the recursive-descent query parser.
+
+The tokens follow the terminals of the grammar in grammar.py.
+"""
+
+import re
+from collections import namedtuple
+
+INT = "int"
+FLOAT = "float"
+VARCHAR = "varchar"
+PARAMETER = "parameter"
+NAME = "name"
+OPERATOR = "operator"
+END = "end"
+
+# kind: one of the token kinds above
+# text: the text of the token
+# keyword: the lower-case text of NAME tokens (keywords are case-insensitive), None for other tokens
+# position: the offset of the token in the query
+Token = namedtuple("Token", ["kind", "text", "keyword", "position"])
+
+# whitespace before a token is skipped as part of the match
+# (the most frequent tokens come first, as the alternatives are tried in order)
+_TOKEN_PATTERN = re.compile(r"""
+    \s*
+    (?:
+        (?P<name>[#a-zA-Z_][#a-zA-Z0-9_]*(?:\.[#a-zA-Z_][#a-zA-Z0-9_]*)?)
+        | (?P<operator>!=|<=|>=|[=<>+\-*/,()])
+        | (?P<float>[0-9]+\.[0-9]*)
+        | (?P<int>[0-9]+)
+        | (?P<varchar>"[^"]*")
+        | (?P<parameter>\?|:[a-zA-Z_][a-zA-Z0-9_]*)
+        | (?P<error>.)
+    )
+    """, re.VERBOSE | re.DOTALL)
+
+
+class QuerySyntaxException(Exception):
+    pass
+
+
+def tokenize(query: str, start: int = 0, end: int = None):
+    """Splits the given query into tokens, skipping whitespace.
+
+    Args:
+        query (str): the query that should be tokenized.
+        start (int): the offset in the query where tokenizing starts.
+        end (int): the offset in the query where tokenizing stops (the end
+            of the query by default).
+
+    Returns a list of Tokens, which always ends with an END token at the end
+    of the query.
+    """
+    tokens = []
+
+    # trailing whitespace is removed, as it is not followed by a token
+    end = len(query.rstrip()) if end is None else end
+    for match in _TOKEN_PATTERN.finditer(query, start, end):
+        kind = match.lastgroup
+        text = match.group(kind)
+
+        if kind == "error":
+            raise QuerySyntaxException(f"Unexpected character '{text}' "
+                                       f"({get_line_and_column(query, match.start(kind))})")
+
+        tokens.append(Token(kind, text, text.lower() if kind == NAME else None, match.start(kind)))
+
+    tokens.append(Token(END, "", None, len(query)))
+
+    return tokens
+
+
+def get_line_and_column(query: str, position: int):
+    """Returns the description of the given position in the query, e.g. "line 1, column 5"."""
+    line = query.count("\n", 0, position) + 1
+    column = position - (query.rfind("\n", 0, position) + 1) + 1
+
+    return f"line {line}, column {column}"
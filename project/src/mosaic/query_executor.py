@@ -1,15 +1,33 @@
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
 from time import perf_counter_ns
 
 from mosaic import cli
 from mosaic import parser
-from mosaic.compiler import compiler
+from mosaic import table_service
 from mosaic.table_service import TableNotFoundException
 from mosaic.compiler import optimizer
 
+# maximum number of compiled (and optimized) execution plans that are kept for reuse
+PLAN_CACHE_SIZE = 128
+
+# the cached execution plans and their parameters (see parser.compile_query) in the order of their last
+# use: {(normalized_query, optimize): (execution_plan, parameters)}
+_plan_cache = OrderedDict()
+# catalog version (see table_service.get_catalog_version) the cached execution plans were compiled for
+_plan_cache_catalog_version = None
+
+# splits a query into varchar literals (odd positions) and the text between them
+_VARCHAR_LITERAL_PATTERN = re.compile(r'("[^"]*")')
+
 
 def execute_query(user_in, optimize=False):
     """
     Function that executes queries. Multiple queries per line are also possible.
+    The execution plans of the queries are cached (see _get_cached_plan), so that repeated queries are not parsed,
+    compiled and optimized again.
     Returns a list containing all results as tuples: (result, execution_time)
     The execution_time is passed as milliseconds
     """
@@ -20,36 +38,178 @@ def execute_query(user_in, optimize=False):
         query = query.strip()
 
         if query:
-            ast = parser.parse_query(query)
+            with _cli_errors():
+                result_expression, parameters = _get_execution_plan(query, optimize)
 
-            if ast.has_error():
-                raise cli.CliErrorMessageException(ast.error)
+                if not parameters.is_empty():
+                    raise cli.CliErrorMessageException("Queries with parameters need to be prepared with "
+                                                       "prepare_query")
 
-            try:
-                result_expression = compiler.compile(ast.ast)
+                results.append(_execute_plan(result_expression))
+
+    return results
 
-                if optimize:
-                    result_expression = optimizer.optimize(result_expression)
 
-                start_execution = perf_counter_ns()
+def prepare_query(query, optimize=False):
+    """
+    Function that prepares a single query, which may contain parameter placeholders ("?" or ":name") in place of
+    literals, for repeated execution with different values (see PreparedQuery.execute).
+    The query is parsed, compiled and optimized only once, the values are bound into its own copy of the cached
+    execution plan.
+    Returns a PreparedQuery-Object
+    """
+    queries = [query for query in query.split(";") if query.strip()]
+    if len(queries) != 1:
+        raise cli.CliErrorMessageException("Exactly one query can be prepared at a time")
 
-                result = result_expression.get_result()
+    prepared_query = PreparedQuery(queries[0].strip(), optimize)
+    with _cli_errors():
+        prepared_query._prepare()
 
-                end_execution = perf_counter_ns()
-                execution_time = (end_execution - start_execution) / 1000000
+    return prepared_query
 
-                results.append((result, execution_time))
-            except TableNotFoundException as e:
-                raise cli.CliErrorMessageException(f"Table with name \"{e.args[0]}\" does not exist")
-            except Exception as e:
-                message = str(e)
 
-                if len(message) == 0:
-                    message = f"A '{type(e).__name__}' occurred"
+class PreparedQuery:
+    """
+    Class that represents a query that was prepared with prepare_query.
+    This class has the following properties:
+    query: the text of the query
+    optimize: whether the execution plan of the query is optimized
+    """
 
-                raise cli.CliErrorMessageException(message)
+    def __init__(self, query, optimize):
+        self.query = query
+        self.optimize = optimize
+        self._execution_plan = None
+        self._parameters = None
+        self._catalog_version = None
+
+    def _prepare(self):
+        execution_plan, parameters = _get_execution_plan(self.query, self.optimize)
+
+        # the cached execution plan is shared by all prepared queries with the same text, so every prepared query
+        # binds its values in its own copy (the parameter expressions of the copy reference the copied parameters)
+        self._parameters = parameters.copy()
+        self._execution_plan = deepcopy(execution_plan, {id(parameters): self._parameters})
+        self._catalog_version = table_service.get_catalog_version()
+
+    def execute(self, *positional_values, **named_values):
+        """
+        Binds the given values to the parameters of the query (the positional values to the "?" placeholders in
+        the order of the query, the named values to the ":name" placeholders) and executes it.
+        The query is prepared again if the catalog changed since it was prepared.
+        Returns the result as tuple: (result, execution_time)
+        The execution_time is passed as milliseconds
+        """
+        with _cli_errors():
+            if self._catalog_version != table_service.get_catalog_version():
+                self._prepare()
+
+            self._parameters.bind(positional_values, named_values)
+            return _execute_plan(self._execution_plan)
+
+
+def _get_execution_plan(query, optimize):
+    """
+    Returns the execution plan of the given query together with its parameters as tuple (execution_plan, parameters),
+    which is either taken from the plan cache or compiled (and optimized) and added to it
+    """
+    cached_plan = _get_cached_plan(query, optimize)
+    if cached_plan is not None:
+        return cached_plan
 
-    return results
+    try:
+        execution_plan, parameters = parser.compile_query(query)
+    except parser.QuerySyntaxException as e:
+        raise cli.CliErrorMessageException(f"Error During Query Parsing: {e}")
+
+    if optimize:
+        execution_plan = optimizer.optimize(execution_plan)
+
+    _cache_plan(query, optimize, execution_plan, parameters)
+
+    return execution_plan, parameters
+
+
+def _execute_plan(execution_plan):
+    """
+    Executes the given execution plan and measures its execution time.
+    Returns the result as tuple: (result, execution_time)
+    """
+    start_execution = perf_counter_ns()
+
+    result = execution_plan.get_result()
+
+    end_execution = perf_counter_ns()
+    execution_time = (end_execution - start_execution) / 1000000
+
+    return result, execution_time
+
+
+@contextmanager
+def _cli_errors():
+    """
+    Context manager that turns the errors of compiling and executing queries into error messages for the cli
+    """
+    try:
+        yield
+    except cli.CliErrorMessageException:
+        raise
+    except TableNotFoundException as e:
+        raise cli.CliErrorMessageException(f"Table with name \"{e.args[0]}\" does not exist")
+    except Exception as e:
+        message = str(e)
+
+        if len(message) == 0:
+            message = f"A '{type(e).__name__}' occurred"
+
+        raise cli.CliErrorMessageException(message)
+
+
+def _normalize_query(query):
+    """
+    Normalizes the whitespace of the given query outside of varchar literals, so that queries which only differ in
+    their formatting share their cached execution plan
+    """
+    parts = _VARCHAR_LITERAL_PATTERN.split(query)
+    parts[::2] = [" ".join(part.split()) for part in parts[::2]]
+
+    return "".join(parts).strip()
+
+
+def _get_cached_plan(query, optimize):
+    """
+    Returns the cached execution plan of the given query as tuple (execution_plan, parameters), or None if it is not
+    cached.
+    All cached execution plans are dropped if the catalog changed since they were compiled, as they reference
+    the tables, indices and statistics of the catalog
+    """
+    global _plan_cache_catalog_version
+
+    catalog_version = table_service.get_catalog_version()
+    if catalog_version != _plan_cache_catalog_version:
+        _plan_cache.clear()
+        _plan_cache_catalog_version = catalog_version
+
+    key = (_normalize_query(query), optimize)
+    cached_plan = _plan_cache.get(key)
+    if cached_plan is not None:
+        _plan_cache.move_to_end(key)
+
+    return cached_plan
+
+
+def _cache_plan(query, optimize, execution_plan, parameters):
+    """
+    Caches the execution plan of the given query and drops the least recently used execution plans if there are more
+    than PLAN_CACHE_SIZE.
+    The execution plans are reused as they are, which is possible because the operators do not change during
+    their execution and retrieve the records of the tables and the values of the parameters for every execution
+    """
+    _plan_cache[(_normalize_query(query), optimize)] = (execution_plan, parameters)
+
+    while len(_plan_cache) > PLAN_CACHE_SIZE:
+        _plan_cache.popitem(last=False)
 
 
 def execute_query_file(file_path, optimize=False):
@@ -1,6 +1,18 @@
+import hashlib
+import io
+import json
+import mmap
 import os
+import pickle
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from enum import Enum
+from operator import itemgetter
 
 import tabulate
 
@@ -32,6 +44,47 @@ class Schema:
         self.column_names = column_names
         self.column_types = column_types
 
+    @property
+    def column_names(self):
+        return self._column_names
+
+    @column_names.setter
+    def column_names(self, column_names):
+        self._column_names = column_names
+        # the lookup is (re-)built lazily on the next column name resolution
+        self._column_lookup = None
+
+    def _get_column_lookup(self):
+        """
+        Returns a dictionary that maps every name a column can be referenced by to the positions of the
+        matching columns, e.g. "table.column" can be referenced by "table.column" and "column".
+        More than one position for a name means that the name is ambiguous.
+        """
+        if self._column_lookup is None:
+            column_lookup = dict()
+
+            for i, column_name in enumerate(self._column_names):
+                name_parts = column_name.split(".")
+                for k in range(len(name_parts)):
+                    column_lookup.setdefault(".".join(name_parts[k:]), []).append(i)
+
+            self._column_lookup = column_lookup
+
+        return self._column_lookup
+
+    def _get_column_positions(self, column_name):
+        """
+        Returns the positions of the columns that match the given (simple or FQN) column name.
+        If the column name is ambiguous, an AmbiguousColumnException is raised
+        """
+        positions = self._get_column_lookup().get(column_name, [])
+
+        if len(positions) > 1:
+            raise AmbiguousColumnException(
+                f"Column \"{column_name}\" is ambiguous in table \"{self.table_name}\"")
+
+        return positions
+
     def get_simple_column_name_list(self):
         return [self.get_simple_column_name(name) for name in self.column_names]
 
@@ -48,17 +101,12 @@ class Schema:
         """
         Transforms a column name to a FQN column name
         """
+        positions = self._get_column_positions(column_name)
 
-        found_columns = list(filter(lambda column: column.endswith(f".{column_name}") or
-                                                   column == column_name, self.column_names))
+        if len(positions) == 1:
+            return self.column_names[positions[0]]
 
-        if len(found_columns) > 1:
-            raise AmbiguousColumnException(
-                f"Column \"{column_name}\" is ambiguous in table \"{self.table_name}\"")
-        elif len(found_columns) == 1:
-            return found_columns[0]
-
-        if len(found_columns) == 0 and "." in column_name:
+        if "." in column_name:
             return column_name
 
         return f"{self.table_name}.{column_name}"
@@ -68,14 +116,14 @@ class Schema:
         Returns the index of the column in the schema. It handles also FQNs and simple references.
         If the column is not found, a TableIndexException is raised
         """
-        fqn_column_name = self.get_fully_qualified_column_name(column_name)
+        positions = self._get_column_positions(column_name)
 
-        try:
-            return self.column_names.index(fqn_column_name)
-        except ValueError:
+        if len(positions) == 0:
             raise TableIndexException(
                 f'No column with name "{self.get_simple_column_name(column_name)}" in table "{self.table_name}"')
 
+        return positions[0]
+
     def rename(self, new_name):
         """
         Renames the table
@@ -108,6 +156,18 @@ class Table:
     def rename(self, new_name):
         self.schema.rename(new_name)
 
+    def get_column(self, column_name):
+        """
+        Returns the values of the given column.
+        For columnar tables, the stored column is returned directly without materializing the records.
+        """
+        column_index = self.get_column_index(column_name)
+
+        if isinstance(self.records, ColumnarRecords):
+            return self.records.columns[column_index]
+
+        return [record[column_index] for record in self.records]
+
     def __str__(self):
         records = [[column if column is not None else "NULL" for column in row]
                    for row in self.records]
@@ -132,6 +192,522 @@ class Table:
         return len(self.records)
 
 
+class LazyTable(Table):
+    """
+    Class that represents a table of a lazily loaded directory (see load_tables_from_directory).
+    Only the schema is known up front, the records are parsed from the table file when they are accessed for the
+    first time. They can be unloaded again to free memory (see _evict_lazy_tables) and get parsed again on the next
+    access.
+    This class has the following additional properties:
+    path: str - the path of the table file
+    columnar: bool - whether the records are stored in columnar form (see ColumnarRecords)
+    """
+
+    def __init__(self, schema, path, columnar):
+        super().__init__(schema, None)
+        self.path = path
+        self.columnar = columnar
+
+    @property
+    def records(self):
+        _load_lazy_table(self)
+        return self._records
+
+    @records.setter
+    def records(self, records):
+        self._records = records
+
+    def is_loaded(self):
+        return self._records is not None
+
+
+def _is_null(null_bitmap, position):
+    return null_bitmap[position >> 3] & (1 << (position & 7)) != 0
+
+
+class TypedColumn(Sequence):
+    """
+    Class that represents a column of a columnar table, that stores int or float values in a typed array.
+    NULL values are stored as 0 and marked in a separate null bitmap.
+    This class has the following properties:
+    values: array - the values of the column (typecode "q" for int and "d" for float columns)
+    null_bitmap: bytearray - bit i is set if the value in row i is NULL
+    """
+
+    def __init__(self, typecode):
+        self.values = array(typecode)
+        self.null_bitmap = bytearray()
+
+    def append(self, value):
+        position = len(self.values)
+        if position & 7 == 0:
+            self.null_bitmap.append(0)
+
+        if value is None:
+            self.null_bitmap[position >> 3] |= 1 << (position & 7)
+            value = 0
+
+        try:
+            self.values.append(value)
+        except OverflowError:
+            # ints exceeding 64 bit can not be stored in a typed array, fall back to a list
+            self.values = list(self.values)
+            self.values.append(value)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+
+        value = self.values[position]
+        if position < 0:
+            position += len(self.values)
+
+        return None if _is_null(self.null_bitmap, position) else value
+
+    def __iter__(self):
+        null_bitmap = self.null_bitmap
+        for position, value in enumerate(self.values):
+            yield None if null_bitmap[position >> 3] & (1 << (position & 7)) else value
+
+    def to_list(self, start=0, end=None):
+        """
+        Returns the values of the rows from start to end as list, NULL values are returned as None.
+        """
+        end = len(self) if end is None else min(end, len(self))
+        values = self.values[start:end]
+        values = values if isinstance(values, list) else values.tolist()
+
+        if any(self.null_bitmap[start >> 3:(end + 7) >> 3]):
+            for position in range(start, end):
+                if _is_null(self.null_bitmap, position):
+                    values[position - start] = None
+
+        return values
+
+    def __len__(self):
+        return len(self.values)
+
+
+class DictionaryColumn(Sequence):
+    """
+    Class that represents a varchar column of a columnar table, which is stored dictionary-encoded.
+    Every distinct string is stored once in the dictionary, the rows only store the code of their value.
+    This class has the following properties:
+    dictionary: [str] - the distinct values of the column, the position in the list is the code of the value
+    codes: array - the code of the value of each row
+    null_bitmap: bytearray - bit i is set if the value in row i is NULL
+    """
+
+    def __init__(self):
+        self.dictionary = []
+        self.codes = array("l")
+        self.null_bitmap = bytearray()
+        self._dictionary_codes = dict()
+
+    def append(self, value):
+        position = len(self.codes)
+        if position & 7 == 0:
+            self.null_bitmap.append(0)
+
+        if value is None:
+            self.null_bitmap[position >> 3] |= 1 << (position & 7)
+            self.codes.append(0)
+            return
+
+        code = self._dictionary_codes.get(value)
+        if code is None:
+            code = len(self.dictionary)
+            self._dictionary_codes[value] = code
+            self.dictionary.append(value)
+
+        self.codes.append(code)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+
+        code = self.codes[position]
+        if position < 0:
+            position += len(self.codes)
+
+        return None if _is_null(self.null_bitmap, position) else self.dictionary[code]
+
+    def __iter__(self):
+        null_bitmap = self.null_bitmap
+        dictionary = self.dictionary
+        for position, code in enumerate(self.codes):
+            yield None if null_bitmap[position >> 3] & (1 << (position & 7)) else dictionary[code]
+
+    def to_list(self, start=0, end=None):
+        """
+        Returns the decoded values of the rows from start to end as list, NULL values are returned as None.
+        """
+        end = len(self) if end is None else min(end, len(self))
+
+        if any(self.null_bitmap[start >> 3:(end + 7) >> 3]):
+            return [self[position] for position in range(start, end)]
+
+        return list(map(self.dictionary.__getitem__, self.codes[start:end]))
+
+    def __len__(self):
+        return len(self.codes)
+
+
+def _create_column(schema_type):
+    if schema_type == SchemaType.INT:
+        return TypedColumn("q")
+    elif schema_type == SchemaType.FLOAT:
+        return TypedColumn("d")
+    elif schema_type == SchemaType.VARCHAR:
+        return DictionaryColumn()
+
+    # columns that only contain NULL values
+    return TypedColumn("b")
+
+
+class ColumnarRecords(Sequence):
+    """
+    Class that stores the records of a table column by column.
+    It acts as an adapter, that provides the same row access as a list of records ([[float | int | str]]),
+    so it can be used as the records of a Table. Operators that work on whole columns can use columns directly.
+    This class has the following properties:
+    columns: [TypedColumn | DictionaryColumn] - the columns of the table, in the order of the schema
+    """
+
+    def __init__(self, column_types, records=()):
+        self.columns = [_create_column(column_type) for column_type in column_types]
+
+        for record in records:
+            self.append(record)
+
+    def append(self, record):
+        for column, value in zip(self.columns, record):
+            column.append(value)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+
+        if position >= len(self) or position < -len(self):
+            raise IndexError("record index out of range")
+
+        return [column[position] for column in self.columns]
+
+    def __iter__(self):
+        for values in zip(*self.columns):
+            yield list(values)
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, ColumnarRecords)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(record == other_record for record, other_record in zip(self, other))
+
+
+class ColumnarIndex:
+    """
+    Class that represents an index over a columnar table.
+    Instead of the records, it stores the positions of the records for every key and materializes
+    the records on access, so it can be used like the dictionary of an index over a row table.
+    """
+
+    def __init__(self, records: ColumnarRecords):
+        self.records = records
+        self.positions = dict()
+
+    def add(self, key, position):
+        if key not in self.positions:
+            self.positions[key] = array("q")
+        self.positions[key].append(position)
+
+    def count(self, key):
+        """
+        Returns the number of records with the given key
+        """
+        return len(self.positions[key])
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    def __getitem__(self, key):
+        return [self.records[position] for position in self.positions[key]]
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def keys(self):
+        return self.positions.keys()
+
+
+class _OrderedIndexMixin:
+    """
+    Mixin for indices that additionally support range lookups.
+    The keys of the index are kept in a sorted array, which is searched with bisect. Since keys are only ever added,
+    the array only needs to be sorted again if the number of keys changed since the last lookup.
+    """
+
+    def _get_sorted_keys(self):
+        sorted_keys = getattr(self, "_sorted_keys", None)
+
+        if sorted_keys is None or self._sorted_keys_count != len(self):
+            # NULL values never satisfy a range condition
+            sorted_keys = sorted(key for key in self.keys() if not _is_null_key(key))
+            self._sorted_keys = sorted_keys
+            self._sorted_keys_count = len(self)
+
+        return sorted_keys
+
+    def get_range_keys(self, lower=None, lower_inclusive=True, upper=None, upper_inclusive=True):
+        """
+        Returns the keys between the given bounds in ascending order. A bound of None means that there is no bound.
+        """
+        sorted_keys = self._get_sorted_keys()
+
+        start = 0
+        if lower is not None:
+            start = bisect_left(sorted_keys, lower) if lower_inclusive else bisect_right(sorted_keys, lower)
+
+        end = len(sorted_keys)
+        if upper is not None:
+            end = bisect_right(sorted_keys, upper) if upper_inclusive else bisect_left(sorted_keys, upper)
+
+        return sorted_keys[start:end]
+
+    def get_prefix_keys(self, prefix):
+        """
+        Returns the keys of a composite index that start with the given tuple of values in ascending order
+        """
+        sorted_keys = self._get_sorted_keys()
+
+        start = bisect_left(sorted_keys, prefix)
+        # the matching keys follow the first one, the scan is linear in the number of returned keys
+        end = start
+        while end < len(sorted_keys) and sorted_keys[end][:len(prefix)] == prefix:
+            end += 1
+
+        return sorted_keys[start:end]
+
+    def get_range(self, lower=None, lower_inclusive=True, upper=None, upper_inclusive=True):
+        """
+        Generator that yields the records with keys between the given bounds, ordered by their key
+        """
+        for key in self.get_range_keys(lower, lower_inclusive, upper, upper_inclusive):
+            yield from self[key]
+
+    def count_range(self, lower=None, lower_inclusive=True, upper=None, upper_inclusive=True):
+        """
+        Returns the number of records with keys between the given bounds
+        """
+        return sum(map(self.count, self.get_range_keys(lower, lower_inclusive, upper, upper_inclusive)))
+
+
+def _is_null_key(key):
+    return key is None or (isinstance(key, tuple) and None in key)
+
+
+class OrderedIndex(_OrderedIndexMixin, dict):
+    """
+    Class that represents an ordered index over a row table.
+    It is used like the dictionary of a hash index (key -> list of records) and additionally supports
+    range lookups (see _OrderedIndexMixin).
+    """
+
+    def count(self, key):
+        """
+        Returns the number of records with the given key
+        """
+        return len(self[key])
+
+
+class OrderedColumnarIndex(_OrderedIndexMixin, ColumnarIndex):
+    """
+    Class that represents an ordered index over a columnar table, which additionally supports
+    range lookups (see _OrderedIndexMixin).
+    """
+    pass
+
+
+def _create_columnar_index(index, records):
+    """
+    Creates an empty columnar index over the given records, that has the same type (hash or ordered) as the given index
+    """
+    return OrderedColumnarIndex(records) if isinstance(index, _OrderedIndexMixin) else ColumnarIndex(records)
+
+
+def _create_empty_index(index):
+    """
+    Creates an empty index over a row table, that has the same type (hash or ordered) as the given index
+    """
+    return OrderedIndex() if isinstance(index, _OrderedIndexMixin) else dict()
+
+
+class ColumnStatistics:
+    """
+    Class that represents the statistics about the values of one column of a table.
+    This class has the following properties:
+    num_records: int - the number of records of the table
+    num_distinct: int - the number of distinct values (without null)
+    num_nulls: int - the number of null values
+    min_value, max_value - the smallest and the largest value, or None if the column only contains null values
+    most_common_values: [(value, count)] - the most common values (which occur more than once) with their number
+        of occurrences, ordered by descending number of occurrences
+    histogram_bounds: [int | float] - the bounds of an equi-depth histogram over numeric columns, so that about the same
+        number of values lies between every two consecutive bounds. Empty for other columns
+    """
+
+    def __init__(self, num_records, num_distinct, num_nulls, min_value, max_value, most_common_values,
+                 histogram_bounds):
+        self.num_records = num_records
+        self.num_distinct = num_distinct
+        self.num_nulls = num_nulls
+        self.min_value = min_value
+        self.max_value = max_value
+        self.most_common_values = most_common_values
+        self.histogram_bounds = histogram_bounds
+
+    def estimate_equal_count(self, value):
+        """
+        Estimates the number of records whose value in this column equals the given value.
+        Values that are not among the most common values are assumed to be distributed uniformly
+        """
+        if value is None or self.num_distinct == 0:
+            return 0
+
+        for common_value, count in self.most_common_values:
+            if common_value == value:
+                return count
+
+        try:
+            if value < self.min_value or value > self.max_value:
+                return 0
+        except TypeError:
+            return 0
+
+        num_uncommon_records = self.num_records - self.num_nulls - sum(count for _, count
+                                                                       in self.most_common_values)
+        num_uncommon_values = self.num_distinct - len(self.most_common_values)
+        if num_uncommon_values <= 0:
+            return 0
+
+        return num_uncommon_records / num_uncommon_values
+
+    def estimate_average_equal_count(self):
+        """
+        Estimates the number of records whose value in this column equals a value that is not known yet (e.g. the
+        value of a parameter), which is the average number of records per distinct value
+        """
+        if self.num_distinct == 0:
+            return 0
+
+        return (self.num_records - self.num_nulls) / self.num_distinct
+
+    def estimate_range_count(self, lower=None, upper=None):
+        """
+        Estimates the number of records whose value in this column lies between the given bounds (None means
+        unbounded) with the histogram of the column, assuming that the values are distributed uniformly within
+        its buckets.
+        Returns None if the column has no histogram or the bounds are not comparable with its values
+        """
+        if not self.histogram_bounds:
+            return None
+
+        try:
+            fraction = (1.0 if upper is None else self._get_fraction_below(upper)) - \
+                       (0.0 if lower is None else self._get_fraction_below(lower))
+        except TypeError:
+            return None
+
+        return max(fraction, 0.0) * (self.num_records - self.num_nulls)
+
+    def _get_fraction_below(self, value):
+        """
+        Returns the estimated fraction of the (non-null) values that are smaller than the given value
+        """
+        bounds = self.histogram_bounds
+        if value >= bounds[-1]:
+            return 1.0
+        if value <= bounds[0]:
+            return 0.0
+
+        bucket = bisect_right(bounds, value) - 1
+        return (bucket + (value - bounds[bucket]) / (bounds[bucket + 1] - bounds[bucket])) / (len(bounds) - 1)
+
+
+class TableStatistics:
+    """
+    Class that represents the statistics about a table (see compute_statistics).
+    This class has the following properties:
+    num_records: int - the number of records of the table
+    columns: {str: ColumnStatistics} - the statistics of every column, with the simple column names as keys
+    """
+
+    def __init__(self, num_records, columns):
+        self.num_records = num_records
+        self.columns = columns
+
+    def get_column_statistics(self, column_name):
+        """
+        Returns the statistics of the column with the given (simple or fully qualified) name
+        """
+        return self.columns[column_name.split(".")[-1]]
+
+
+def compute_statistics(table):
+    """
+    Computes the statistics about the given table by counting the values of each of its columns once.
+    Returns a TableStatistics-Object
+    """
+    num_records = len(table.records)
+    columns = dict()
+
+    for column_name, column_type in zip(table.schema.column_names, table.schema.column_types):
+        counts = Counter(table.get_column(column_name))
+        num_nulls = counts.pop(None, 0)
+        values = sorted(counts)
+
+        most_common_values = [(value, count) for value, count in counts.most_common(STATISTICS_MOST_COMMON_VALUES)
+                              if count > 1]
+        histogram_bounds = _create_histogram_bounds(values, counts) \
+            if column_type in (SchemaType.INT, SchemaType.FLOAT) else []
+
+        columns[table.schema.get_simple_column_name(column_name)] = ColumnStatistics(
+            num_records, len(values), num_nulls, values[0] if values else None, values[-1] if values else None,
+            most_common_values, histogram_bounds)
+
+    return TableStatistics(num_records, columns)
+
+
+def _create_histogram_bounds(values, counts):
+    """
+    Creates the bounds of an equi-depth histogram with (at most) STATISTICS_HISTOGRAM_BUCKETS buckets over the given
+    sorted distinct values, which occur as often as given by counts
+    """
+    if not values:
+        return []
+
+    num_values = sum(counts.values())
+    num_buckets = min(STATISTICS_HISTOGRAM_BUCKETS, len(values))
+    bounds = [values[0]]
+    num_seen_values = 0
+
+    for value in values:
+        num_seen_values += counts[value]
+        # a bound is added as soon as the next bucket is filled up (a value is never split up between buckets)
+        if num_seen_values * num_buckets >= num_values * len(bounds) and value != bounds[-1]:
+            bounds.append(value)
+
+    if bounds[-1] != values[-1]:
+        bounds.append(values[-1])
+
+    return bounds
+
+
 class IndexNotFoundException(CompilerException):
     pass
 
@@ -162,6 +738,28 @@ class AmbiguousColumnException(Exception):
 
 _tables = dict()
 _indices = dict()
+# the statistics of the tables, which are computed when they are needed for the first time (see retrieve_statistics)
+_statistics = dict()
+# the loaded LazyTables in the order of their last use, with their estimated size: {table_name: (table, size)}
+_loaded_lazy_tables = OrderedDict()
+# memory limit (in bytes) for the loaded LazyTables, or None if they are never unloaded
+_memory_limit = None
+# number that is increased whenever the catalog changes (see get_catalog_version)
+_catalog_version = 0
+
+# number of most common values and of histogram buckets that are stored in the statistics of a column
+STATISTICS_MOST_COMMON_VALUES = 10
+STATISTICS_HISTOGRAM_BUCKETS = 10
+
+# minimal total size of the table files of a directory, from which on they are parsed in a process pool
+PARALLEL_LOADING_MIN_BYTES = 4 * 1024 * 1024
+# file extension and magic number of table files in the binary columnar format
+BINARY_TABLE_EXTENSION = ".ctable"
+_BINARY_TABLE_MAGIC = b"MOSAICCT"
+_BINARY_SEGMENT_ALIGNMENT = 8
+# file extension of the table snapshots in the cache directory and the version of their format
+SNAPSHOT_EXTENSION = ".snapshot"
+_SNAPSHOT_VERSION = 2
 
 
 def _convert_schema_type_string(type_string):
@@ -235,135 +833,654 @@ def _read_schema_section(table_name, schema_start, schema_lines):
     return column_names, column_types
 
 
-def _create_indices(table_name, schema: Schema, index_start, index_lines):
-    _indices[table_name] = dict()
+def _create_indices(schema: Schema, index_start, index_lines):
+    """
+    Creates the (still empty) indices for the columns listed in the index section.
+    A composite index over multiple columns is declared by separating them with commas (e.g. "MatrNr,VorlNr"), its
+    keys are the tuples of the values of the columns in the given order.
+    The columns can be followed by the type of the index ("<columns>: hash" or "<columns>: ordered"), hash indices
+    are created by default.
+    Returns a dictionary with the index column names (comma separated for composite indices) as keys and the
+    indices as values
+    """
+    indices = dict()
     for i, line in enumerate(index_lines):
         line = line.rstrip('\n')
+        index_type = "hash"
+        if ":" in line:
+            line, index_type = (part.strip() for part in line.split(":", 1))
+        if "," in line:
+            line = ",".join(column.strip() for column in line.split(","))
+
+        for column in get_index_columns(line):
+            try:
+                schema.get_column_index(column)
+            except TableIndexException:
+                raise TableParsingException(
+                    f'Column "{column}" in line {i + 2 + index_start} does not exist in schema')
+
+        if index_type == "hash":
+            indices[line] = dict()
+        elif index_type == "ordered":
+            indices[line] = OrderedIndex()
+        else:
+            raise TableParsingException(f'Unknown index type in line {i + 2 + index_start}: "{index_type}"')
+
+    return indices
+
+
+def get_index_columns(index_column):
+    """
+    Returns the list of the columns of the index with the given index column name (see _create_indices)
+    """
+    return index_column.split(",")
+
+
+def _get_index_key_getter(schema, index_column):
+    """
+    Returns the callable that extracts the key of the index with the given index column name from a record,
+    which is a tuple for composite indices
+    """
+    return itemgetter(*[schema.get_column_index(column) for column in get_index_columns(index_column)])
 
-        try:
-            schema.get_column_index(line)
-        except TableIndexException:
-            raise TableParsingException(
-                f'Column "{line}" in line {i + 2 + index_start} does not exist in schema')
 
-        _indices[table_name][line] = dict()
+def _get_converter(schema_type):
+    """
+    Returns the callable that converts a field of a data line into a value of the given schema type
+    """
+    if schema_type == SchemaType.INT:
+        return int
+    elif schema_type == SchemaType.FLOAT:
+        return float
+    else:
+        return str
+
+
+def _read_data_section(column_types, schema, numbered_lines, columnar=False, indices=None):
+    """
+    Reads the data section from the given iterator over the (zero-based) line numbers and lines of the table file,
+    which is consumed up to and including the empty line that ends the data section.
+    Every line is converted straight into a typed record using one converter per column.
+    Returns the records as list (or ColumnarRecords if columnar is set)
+    """
+    data_list = ColumnarRecords(column_types) if columnar else []
+
+    if columnar and indices is not None:
+        for index_column in indices:
+            indices[index_column] = _create_columnar_index(indices[index_column], data_list)
 
+    _append_data_lines(data_list, schema, numbered_lines, columnar, indices)
 
-def _read_data_section(column_types, schema, data_start, data_lines):
-    data_list = []
-    for i, line in enumerate(data_lines):
+    return data_list
+
+
+def _append_data_lines(data_list, schema, numbered_lines, columnar=False, indices=None):
+    """
+    Converts the given data lines into records and appends them to the given records and indices.
+    The lines are consumed up to and including the first empty line (see _read_data_section).
+    """
+    converters = [_get_converter(column_type) for column_type in schema.column_types]
+    index_key_getters = [] if indices is None else \
+        [(indices[index_column], _get_index_key_getter(schema, index_column)) for index_column in indices]
+
+    for j, line in numbered_lines:
         if line == "\n":
             break
 
         fields = line.rstrip('\n').split(';')
-        if len(fields) != len(column_types):
+        if len(fields) != len(converters):
             raise TableParsingException(
-                f"Wrong number of columns in line {i + 2 + data_start}")
+                f"Wrong number of columns in line {j + 1}")
 
-        data = list(range(len(fields)))
         try:
-            for k, field in enumerate(fields):
-                if column_types[k] == SchemaType.INT:
-                    data[k] = int(field)
-                elif column_types[k] == SchemaType.FLOAT:
-                    data[k] = float(field)
-                else:
-                    data[k] = field
+            data = [converter(field) for converter, field in zip(converters, fields)]
         except Exception:
+            field = _find_unconvertible_field(converters, fields)
             raise TableParsingException(
-                f"Parsing error in line {i + 2 + data_start} near \"{field}\"")
+                f"Parsing error in line {j + 1} near \"{field}\"")
 
         data_list.append(data)
 
-        if schema.table_name in _indices:
-            for index_column in _indices[schema.table_name]:
-                index_column_index = schema.get_column_index(index_column)
-                key = data[index_column_index]
-                if key not in _indices[schema.table_name][index_column]:
-                    _indices[schema.table_name][index_column][key] = []
-                _indices[schema.table_name][index_column][key].append(data)
+        for index, get_index_key in index_key_getters:
+            _add_to_index(index, get_index_key(data), data, len(data_list) - 1, columnar)
 
-    return data_list
+
+def _find_unconvertible_field(converters, fields):
+    """
+    Returns the first of the given fields that can not be converted by its converter
+    """
+    for converter, field in zip(converters, fields):
+        try:
+            converter(field)
+        except Exception:
+            return field
+
+
+def _add_to_index(index, key, record, position, columnar):
+    """
+    Adds the given record (at the given position of the table) with the given key to the index
+    """
+    if columnar:
+        index.add(key, position)
+    else:
+        if key not in index:
+            index[key] = []
+        index[key].append(record)
 
 
-def load_from_file(path):
+class _TableFileParser:
+    """
+    Class that parses a table file in a single pass over its lines.
+    The sections are detected while the lines are read. The data section is converted into records straight from the
+    file as soon as the schema (and the indices) are known, so the file never has to be held in memory as a whole.
+    Only the lines of data sections that precede the schema or indices sections are buffered.
+    Errors are collected and the first one is raised at the end of the file, where missing sections take precedence
+    over missing newlines between sections, which take precedence over errors in the content of the sections.
+    """
+
+    def __init__(self, table_name, columnar, headers_only=False):
+        self.table_name = table_name
+        self.columnar = columnar
+        self.headers_only = headers_only
+
+        # (zero-based) line numbers of the first section headers and of the empty lines ending the sections
+        self.schema_start = None
+        self.schema_end = None
+        self.index_start = None
+        self.index_end = None
+        self.data_start = None
+        self.data_end = None
+
+        self.schema_lines = []
+        self.index_lines = []
+        self.buffered_data_lines = []
+
+        self.schema = None
+        self.indices = None
+        self.data_indices = None
+        self.data_list = None
+
+        self.schema_section_error = None
+        self.index_section_error = None
+        self.schema_error = None
+        self.index_error = None
+        self.data_error = None
+
+    def parse(self, lines):
+        """
+        Parses the given lines of a table file.
+        Returns a tuple (table, indices) (see _parse_table_file)
+        """
+        numbered_lines = enumerate(lines)
+
+        for j, line in numbered_lines:
+            self._detect_section_header(j, line)
+            self._read_schema_line(j, line)
+            self._read_index_line(j, line)
+
+            if self.headers_only and self._has_read_headers():
+                break
+
+            if j == self.data_start:
+                if self.headers_only:
+                    self._skip_data_lines(numbered_lines)
+                elif self._is_ready_for_data():
+                    # the data lines are consumed from the same iterator without being buffered
+                    self.data_indices = self.indices
+                    try:
+                        self.data_list = _read_data_section(self.schema.column_types, self.schema,
+                                                            self._observe_data_lines(numbered_lines),
+                                                            self.columnar, self.indices)
+                    except TableParsingException as ex:
+                        self.data_error = ex
+                    self.data_end = -1
+            elif self.data_start is not None and self.data_end is None:
+                if line == "\n":
+                    self.data_end = j
+                elif not self._has_error():
+                    self.buffered_data_lines.append((j, line))
+
+        return self._finish()
+
+    def _observe_data_lines(self, numbered_lines):
+        """
+        Generator that passes the given lines through to the data section, while still detecting the section headers
+        and reading the index section in them
+        """
+        for j, line in numbered_lines:
+            if line.startswith("[") or (self.index_start is not None and self.index_end is None):
+                self._detect_section_header(j, line)
+                self._read_index_line(j, line)
+            yield j, line
+
+    def _skip_data_lines(self, numbered_lines):
+        """
+        Consumes the lines of the data section without converting them
+        """
+        for _, line in self._observe_data_lines(numbered_lines):
+            if line == "\n":
+                break
+
+        self.data_end = -1
+
+    def _has_read_headers(self):
+        """
+        Checks whether the schema and the index section have been read and the data section has been found,
+        so the rest of the file can not change the schema or the indices anymore
+        """
+        return self.schema_end is not None and self.index_end is not None and self.data_start is not None
+
+    def _detect_section_header(self, j, line):
+        if line == '[Schema]\n' and self.schema_start is None:
+            self.schema_start = j
+        elif line == '[Indices]\n' and self.index_start is None:
+            self.index_start = j
+        elif (line == '[Data]\n' or line == '[Data]') and self.data_start is None:
+            self.data_start = j
+
+    def _read_schema_line(self, j, line):
+        if self.schema_start is None or j <= self.schema_start or self.schema_end is not None:
+            return
+
+        if line == "\n":
+            self.schema_end = j
+            self._read_schema()
+            return
+
+        if self.schema_section_error is None:
+            if j == self.index_start:
+                self.schema_section_error = TableParsingException(
+                    "Newline between schema and indices section required")
+            elif j == self.data_start:
+                self.schema_section_error = TableParsingException(
+                    "Newline between schema and data section required")
+
+        self.schema_lines.append(line)
+
+    def _read_index_line(self, j, line):
+        if self.index_start is None or j <= self.index_start or self.index_end is not None:
+            return
+
+        if line == "\n":
+            self.index_end = j
+            self._create_indices()
+            return
+
+        if j == self.data_start and self.index_section_error is None:
+            self.index_section_error = TableParsingException(
+                "Newline between indices and data section required")
+
+        self.index_lines.append(line)
+
+    def _read_schema(self):
+        try:
+            column_names, column_types = _read_schema_section(
+                self.table_name, self.schema_start, self.schema_lines)
+            self.schema = Schema(self.table_name, column_names, column_types)
+        except TableParsingException as ex:
+            self.schema_error = ex
+
+        self._create_indices()
+
+    def _create_indices(self):
+        """
+        Creates the indices as soon as both the schema and the index section have been read
+        """
+        if self.schema is None or self.index_end is None or self.indices is not None or not self.index_lines:
+            return
+
+        try:
+            self.indices = _create_indices(self.schema, self.index_start, self.index_lines)
+        except TableParsingException as ex:
+            self.index_error = ex
+
+    def _is_ready_for_data(self):
+        """
+        Checks whether the data section can be read straight from the file, which requires the schema and (if
+        an index section was found before the data section) the indices to be read without errors
+        """
+        if self.schema is None or self._has_error():
+            return False
+
+        return self.index_start is None or (self.index_end is not None and
+                                            (self.indices is not None or not self.index_lines))
+
+    def _has_error(self):
+        return self.schema_section_error is not None or self.index_section_error is not None or \
+               self.schema_error is not None or self.index_error is not None
+
+    def _finish(self):
+        """
+        Ends the sections that are still open at the end of the file and raises the first error (if any).
+        Reads the buffered data lines if the data section could not be read straight from the file.
+        Returns a tuple (table, indices), or a tuple (schema, indices) with empty indices if only the headers are read
+        """
+        if self.schema_start is None:
+            raise TableParsingException("No schema section found")
+        if self.data_start is None:
+            raise TableParsingException("No data section found")
+
+        if self.schema_end is None:
+            self.schema_end = -1
+            self._read_schema()
+        if self.index_start is not None and self.index_end is None:
+            self.index_end = -1
+            self._create_indices()
+
+        for error in (self.schema_section_error, self.index_section_error, self.schema_error, self.index_error,
+                      self.data_error):
+            if error is not None:
+                raise error
+
+        if self.headers_only:
+            return self.schema, self.indices
+
+        if self.data_list is None:
+            self.data_list = _read_data_section(self.schema.column_types, self.schema,
+                                                iter(self.buffered_data_lines), self.columnar, self.indices)
+        elif self.indices is not self.data_indices:
+            # the index section was found after the data section had been read, so the records are added afterwards
+            self._add_records_to_indices()
+
+        return Table(self.schema, self.data_list), self.indices
+
+    def _add_records_to_indices(self):
+        if self.columnar:
+            for index_column in self.indices:
+                self.indices[index_column] = _create_columnar_index(self.indices[index_column], self.data_list)
+
+        index_key_getters = [(self.indices[index_column], _get_index_key_getter(self.schema, index_column))
+                             for index_column in self.indices]
+
+        for position, record in enumerate(self.data_list):
+            for index, get_index_key in index_key_getters:
+                _add_to_index(index, get_index_key(record), record, position, self.columnar)
+
+
+def load_from_file(path, columnar=False):
     """
     Loads a table from a file.
     This function extracts a table from a specific file format and saves a specific table into the tables dict.
+    If columnar is set, the records are stored column by column in typed arrays (see ColumnarRecords).
+    """
+    table, indices = _parse_table_file(path, columnar)
+
+    _register_table(table, indices)
+
+
+def _register_table(table, indices):
+    """
+    Saves the given table and its indices (if the table file has an index section) into the tables and indices dict.
+    """
+    global _catalog_version
+
+    if indices is not None:
+        _indices[table.table_name] = indices
+
+    _tables[table.table_name] = table
+    _statistics.pop(table.table_name, None)
+    _catalog_version += 1
+
+
+def _parse_table_file(path, columnar=False):
+    """
+    Parses the table in the given file without saving it, so that it can also be called in a worker process.
+    Returns a tuple (table, indices), where indices is a dictionary with the index column names as keys and the
+    indices as values, or None if the file does not contain indices
     """
     table_name = path.split('/')[-1].split('.')[0]
 
     with open(path, "r") as f:
-        lines = f.readlines()
+        # the file is read line by line in a single pass
+        return _TableFileParser(table_name, columnar).parse(f)
 
-        # find schema and data sections
-        try:
-            schema_start = lines.index('[Schema]\n')
-        except ValueError:
-            raise TableParsingException("No schema section found")
 
-        try:
-            data_start = lines.index('[Data]\n')
-        except ValueError:
-            try:
-                data_start = lines.index('[Data]')
-            except ValueError:
-                raise TableParsingException("No data section found")
+def write_to_binary_file(table_name, path):
+    """
+    Writes the loaded table with the given name into a file in the binary columnar format (see load_from_binary_file).
+    The file starts with a magic number and the length of the header, followed by the header (JSON) containing
+    the schema, the declared indices and the positions of the segments. Every column is stored in its own
+    8-byte aligned segments: the values (or the codes and the string dictionary for varchar columns)
+    and the null bitmap.
+    """
+    table = retrieve_table(table_name)
+    records = table.records
+    if not isinstance(records, ColumnarRecords):
+        records = ColumnarRecords(table.schema.column_types, records)
+
+    segments = []
+    header = json.dumps({
+        "table_name": table.table_name,
+        "column_names": table.schema.column_names,
+        "column_types": [column_type.value for column_type in table.schema.column_types],
+        "num_records": len(records),
+        "byteorder": sys.byteorder,
+        "indices": list(_indices.get(table_name, dict()).keys()),
+        "ordered_indices": [index_column for index_column, index in _indices.get(table_name, dict()).items()
+                            if isinstance(index, _OrderedIndexMixin)],
+        "columns": [_add_column_segments(column, segments) for column in records.columns]
+    }).encode("utf-8")
+    data_start = _align_segment(len(_BINARY_TABLE_MAGIC) + 8 + len(header))
+
+    with open(path, "wb") as f:
+        f.write(_BINARY_TABLE_MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+
+        for offset, data in segments:
+            f.write(bytes(data_start + offset - f.tell()))
+            f.write(data)
+
+
+def _align_segment(offset):
+    return -(-offset // _BINARY_SEGMENT_ALIGNMENT) * _BINARY_SEGMENT_ALIGNMENT
+
+
+def _add_segment(segments, data):
+    """
+    Appends the given bytes as new segment to the list of (offset, data) tuples.
+    Returns the offset (relative to the start of the data area) and the length of the segment
+    """
+    offset = _align_segment(segments[-1][0] + len(segments[-1][1])) if segments else 0
+    segments.append((offset, data))
+
+    return [offset, len(data)]
+
+
+def _add_column_segments(column, segments):
+    """
+    Appends the segments of the given column to the list of segments.
+    Returns the description of the column for the header of a binary table file
+    """
+    description = {"null_bitmap": _add_segment(segments, bytes(column.null_bitmap))}
+
+    if isinstance(column, DictionaryColumn):
+        # the dictionary is stored as one string, the offsets mark the start of each value in it
+        offsets = array("q", [0])
+        for value in column.dictionary:
+            offsets.append(offsets[-1] + len(value))
+
+        description["kind"] = "dictionary"
+        description["codes"] = _add_segment(segments, array("q", column.codes).tobytes())
+        description["dictionary_offsets"] = _add_segment(segments, offsets.tobytes())
+        description["dictionary"] = _add_segment(segments, "".join(column.dictionary).encode("utf-8"))
+    elif isinstance(column.values, list):
+        # ints exceeding 64 bit can not be stored in a typed array
+        description["kind"] = "json"
+        description["values"] = _add_segment(segments, json.dumps(column.values).encode("utf-8"))
+    else:
+        description["kind"] = "typed"
+        description["typecode"] = memoryview(column.values).format
+        description["values"] = _add_segment(segments, bytes(column.values))
 
-        index_start = None
+    return description
+
+
+def load_from_binary_file(path):
+    """
+    Loads a table from a file in the binary columnar format (see write_to_binary_file) and saves it into the
+    tables dict. The file is memory-mapped instead of parsed: the int and float columns and the codes of the varchar
+    columns are read-only views on the mapped file, so they are not copied. Only the string dictionaries are decoded.
+    The declared indices are rebuilt from the mapped columns.
+    """
+    table, indices = _read_binary_table_file(path)
+
+    _register_table(table, indices)
+
+
+def _read_binary_table_file(path):
+    """
+    Maps the given binary table file into memory without saving the table.
+    Returns a tuple (table, indices) (see _parse_table_file)
+    """
+    with open(path, "rb") as f:
         try:
-            index_start = lines.index('[Indices]\n')
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
         except ValueError:
-            pass
+            raise TableParsingException("Binary table file is empty")
 
-        schema_end = schema_start
-        while schema_end < len(lines) and lines[schema_end] != "\n":
+    if buffer[:len(_BINARY_TABLE_MAGIC)] != _BINARY_TABLE_MAGIC:
+        raise TableParsingException("Not a binary table file")
 
-            if index_start is not None and schema_end == index_start:
-                raise TableParsingException(
-                    "Newline between schema and indices section required")
+    header_start = len(_BINARY_TABLE_MAGIC) + 8
+    header_length = int.from_bytes(buffer[len(_BINARY_TABLE_MAGIC):header_start], "little")
+    try:
+        header = json.loads(bytes(buffer[header_start:header_start + header_length]))
+    except ValueError:
+        raise TableParsingException("Header of binary table file is corrupted")
 
-            if schema_end == data_start:
-                raise TableParsingException(
-                    "Newline between schema and data section required")
-            schema_end += 1
+    if header["byteorder"] != sys.byteorder:
+        raise TableParsingException(f"Binary table file has wrong byte order: {header['byteorder']}")
 
-        if index_start is not None:
-            index_end = index_start
-            while index_end < len(lines) and lines[index_end] != "\n":
-                if index_end == data_start:
-                    raise TableParsingException(
-                        "Newline between indices and data section required")
-                index_end += 1
+    data_start = _align_segment(header_start + header_length)
 
-        # read content
-        column_names, column_types = _read_schema_section(
-            table_name, schema_start, lines[schema_start + 1:schema_end])
-        schema = Schema(table_name, column_names, column_types)
-        if index_start is not None and index_start != index_end - 1:
-            _create_indices(table_name, schema, index_start,
-                            lines[index_start + 1:index_end])
+    def get_segment(segment):
+        offset, length = segment
+        if data_start + offset + length > len(buffer):
+            raise TableParsingException("Binary table file is truncated")
 
-        data_list = _read_data_section(
-            column_types, schema, data_start, lines[data_start + 1:])
+        return buffer[data_start + offset:data_start + offset + length]
 
-    _tables[table_name] = Table(schema, data_list)
+    records = ColumnarRecords([])
+    records.columns = [_load_column(description, get_segment) for description in header["columns"]]
 
+    schema = Schema(header["table_name"], header["column_names"],
+                    [SchemaType(column_type) for column_type in header["column_types"]])
 
-def load_tables_from_directory(path):
+    indices = None
+    if header["indices"]:
+        indices = dict()
+        for index_column in header["indices"]:
+            index = OrderedColumnarIndex(records) if index_column in header["ordered_indices"] \
+                else ColumnarIndex(records)
+            key_columns = [records.columns[schema.get_column_index(column)]
+                           for column in get_index_columns(index_column)]
+            keys = key_columns[0] if len(key_columns) == 1 else zip(*key_columns)
+            for position, key in enumerate(keys):
+                index.add(key, position)
+            indices[index_column] = index
+
+    return Table(schema, records), indices
+
+
+def _load_column(description, get_segment):
+    """
+    Creates a column out of its description in the header of a binary table file,
+    using get_segment to retrieve the segments of the mapped file
     """
-    This function calls the load_from_file function for every file (which represent a table) in path
+    if description["kind"] == "dictionary":
+        column = DictionaryColumn()
+        offsets = get_segment(description["dictionary_offsets"]).cast("q")
+        dictionary = str(get_segment(description["dictionary"]), "utf-8")
+        column.dictionary = [dictionary[start:end] for start, end in zip(offsets, offsets[1:])]
+        column.codes = get_segment(description["codes"]).cast("q")
+    else:
+        column = TypedColumn("q")
+        if description["kind"] == "json":
+            column.values = json.loads(bytes(get_segment(description["values"])))
+        else:
+            column.values = get_segment(description["values"]).cast(description["typecode"])
+
+    column.null_bitmap = get_segment(description["null_bitmap"])
+
+    return column
+
+
+def load_tables_from_directory(path, columnar=False, max_workers=None, lazy=False, memory_limit=None,
+                               cache_directory=None, rebuild_cache=False):
+    """
+    This function parses every file (which represent a table) in path and saves the tables.
+    Files in the binary columnar format (see BINARY_TABLE_EXTENSION) are memory-mapped instead of parsed.
+    If the table files are big enough (see PARALLEL_LOADING_MIN_BYTES), they are parsed in a process pool with
+    max_workers processes (defaults to the number of CPUs), otherwise the load_from_file function is called
+    for each of them.
+    If lazy is set, only the schema and index sections of the files are read and the tables are saved as LazyTable,
+    whose data section is parsed when the table is retrieved for the first time. If memory_limit (in bytes) is set,
+    the least recently used tables are unloaded again as soon as the loaded tables exceed it.
+    If cache_directory is set, a snapshot of every parsed table and its indices is saved there. Tables whose file
+    did not change since (same path, size and modification time) are loaded from their snapshot instead of being
+    parsed again, unless rebuild_cache is set. If records have only been appended to a file, just the appended lines
+    are parsed and added to the table and indices of its snapshot.
+    The catalog tables are built after all tables have been loaded.
+    If columnar is set, the tables are stored in columnar form.
     Returns a list of tuples for files that could not be loaded (file_name, error_information)
     """
     global _tables
+    global _memory_limit
+    global _catalog_version
     _tables = dict()
+    _memory_limit = memory_limit
+    _catalog_version += 1
+    _loaded_lazy_tables.clear()
+    _statistics.clear()
 
     not_loaded_files = []
     loaded_files = []
-    for file in os.listdir(path):
+    files = os.listdir(path)
+    table_paths = {file: os.path.join(path, file).replace("\\", "/") for file in files if file.endswith(".table")}
+
+    snapshot_keys = dict()
+    snapshots = dict()
+    if cache_directory is not None and not lazy:
+        for file, table_path in table_paths.items():
+            snapshot_keys[file] = _get_snapshot_key(table_path, columnar)
+            if not rebuild_cache:
+                snapshot = _read_snapshot(cache_directory, snapshot_keys[file], table_path)
+                if snapshot is not None:
+                    snapshots[file] = snapshot
+
+    parsed_table_paths = {file: table_path for file, table_path in table_paths.items() if file not in snapshots}
+
+    futures = None
+    if not lazy and _should_load_in_parallel(list(parsed_table_paths.values()), max_workers):
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {file: executor.submit(_parse_table_file, table_path, columnar)
+                       for file, table_path in parsed_table_paths.items()}
+
+    for file in files:
         if file.endswith(".table"):
             try:
-                load_from_file(os.path.join(path, file).replace("\\", "/"))
+                if lazy:
+                    _register_lazy_table(table_paths[file], columnar)
+                elif file in snapshots:
+                    table, indices, is_extended = snapshots[file]
+                    _register_table(table, indices)
+
+                    if is_extended:
+                        _write_snapshot(cache_directory, snapshot_keys[file], table, indices)
+                else:
+                    table, indices = futures[file].result() if futures is not None \
+                        else _parse_table_file(table_paths[file], columnar)
+                    _register_table(table, indices)
+
+                    if snapshot_keys.get(file) is not None:
+                        _write_snapshot(cache_directory, snapshot_keys[file], table, indices)
+                loaded_files.append(file)
+            except Exception as ex:
+                not_loaded_files.append((file, str(ex)))
+        elif file.endswith(BINARY_TABLE_EXTENSION):
+            try:
+                load_from_binary_file(os.path.join(path, file).replace("\\", "/"))
                 loaded_files.append(file)
             except Exception as ex:
                 not_loaded_files.append((file, str(ex)))
@@ -377,10 +1494,248 @@ def load_tables_from_directory(path):
         _create_indices_table()
         _create_tables_table()
         _create_columns_table()
+        _create_statistics_table()
         # do not change function call order here. this yields a result exactly as required in MS1
     return not_loaded_files
 
 
+def _get_snapshot_key(table_path, columnar):
+    """
+    Returns the key that identifies the snapshot of the given table file, which changes as soon as the file changes.
+    Returns None if the file can not be accessed
+    """
+    try:
+        stat = os.stat(table_path)
+    except OSError:
+        return None
+
+    return [_SNAPSHOT_VERSION, os.path.abspath(table_path), stat.st_size, stat.st_mtime_ns, columnar]
+
+
+def _get_snapshot_path(cache_directory, snapshot_key):
+    file_name = hashlib.sha1(snapshot_key[1].encode("utf-8")).hexdigest()
+    return os.path.join(cache_directory, file_name + SNAPSHOT_EXTENSION)
+
+
+def _read_snapshot(cache_directory, snapshot_key, table_path):
+    """
+    Reads the snapshot with the given key from the cache directory.
+    If the snapshot is outdated only because lines have been appended to the table file since, the records in these
+    lines are added to the table and its indices of the snapshot (see _extend_snapshot).
+    Returns a tuple (table, indices, is_extended) (see _parse_table_file), or None if there is no usable snapshot
+    """
+    if snapshot_key is None:
+        return None
+
+    try:
+        with open(_get_snapshot_path(cache_directory, snapshot_key), "rb") as f:
+            # the key and the append state are stored in front of the table, so outdated snapshots are not read
+            # completely
+            stored_snapshot_key = pickle.load(f)
+            append_state = pickle.load(f)
+
+            if stored_snapshot_key == snapshot_key:
+                return (*pickle.load(f), False)
+
+            if stored_snapshot_key[:2] != snapshot_key[:2] or stored_snapshot_key[4] != snapshot_key[4] or \
+                    append_state is None or append_state[0] >= snapshot_key[2]:
+                return None
+
+            table, indices = pickle.load(f)
+            if not _extend_snapshot(table_path, table, indices, append_state, snapshot_key[4]):
+                return None
+
+            return table, indices, True
+    except Exception:
+        # missing or broken snapshots (and errors in the appended lines) are replaced after the table file has been
+        # parsed
+        return None
+
+
+def _extend_snapshot(table_path, table, indices, append_state, columnar):
+    """
+    Adds the records of the lines that have been appended to the given table file since the snapshot with the given
+    append state (see _get_append_state) was saved to its table and indices.
+    Returns False if the file has not only been appended to, so the snapshot can not be extended
+    """
+    size, digest, num_lines = append_state
+
+    with open(table_path, "rb") as f:
+        if _get_file_prefix_state(f, size) != (digest, num_lines):
+            return False
+
+        # decoded the same way as the file is decoded by the parser
+        appended_lines = list(enumerate(io.TextIOWrapper(f), num_lines))
+
+    if any(line == "\n" for _, line in appended_lines):
+        # an empty line ends the data section, so the following lines would not be records
+        return False
+
+    _append_data_lines(table.records, table.schema, iter(appended_lines), columnar, indices)
+    return True
+
+
+def _get_append_state(snapshot_key):
+    """
+    Returns the state of the table file with the given snapshot key that is needed to extend its snapshot later on:
+    a tuple (size, hash, number of lines) of the content of the file.
+    Returns None if lines that are appended to the file would not be part of its data section, which needs to be the
+    last section of the file and end with a complete line.
+    """
+    table_path, size = snapshot_key[1], snapshot_key[2]
+    if size == 0:
+        return None
+
+    with open(table_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            last_section_start = content.rfind(b"\n\n", 0, size) + 2
+            if content[size - 1:size] != b"\n" or \
+                    content[last_section_start:last_section_start + 7] != b"[Data]\n":
+                return None
+
+        digest, num_lines = _get_file_prefix_state(f, size)
+
+    if _get_snapshot_key(table_path, snapshot_key[4]) != snapshot_key:
+        # the file has changed while it was read
+        return None
+
+    return size, digest, num_lines
+
+
+def _get_file_prefix_state(f, size):
+    """
+    Reads the first size bytes of the given binary file.
+    Returns a tuple (hash, number of lines) of them
+    """
+    digest = hashlib.sha1()
+    num_lines = 0
+
+    while size > 0:
+        chunk = f.read(min(size, 1 << 20))
+        if not chunk:
+            break
+
+        digest.update(chunk)
+        num_lines += chunk.count(b"\n")
+        size -= len(chunk)
+
+    return digest.hexdigest(), num_lines
+
+
+def _write_snapshot(cache_directory, snapshot_key, table, indices):
+    """
+    Saves a snapshot of the given table and its indices with the given key into the cache directory.
+    The snapshot is written into a temporary file first, so that it is never read while it is incomplete
+    """
+    snapshot_path = _get_snapshot_path(cache_directory, snapshot_key)
+
+    try:
+        append_state = _get_append_state(snapshot_key)
+
+        os.makedirs(cache_directory, exist_ok=True)
+        with open(snapshot_path + ".tmp", "wb") as f:
+            pickle.dump(snapshot_key, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(append_state, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump((table, indices), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(snapshot_path + ".tmp", snapshot_path)
+    except OSError:
+        # the table is still loaded, it only needs to be parsed again at the next start
+        pass
+
+
+def _register_lazy_table(path, columnar=False):
+    """
+    Reads the schema and the index section of the given table file and saves it as LazyTable.
+    The indices are saved without content until the table is loaded, so the index columns are already known.
+    """
+    table_name = path.split('/')[-1].split('.')[0]
+
+    with open(path, "r") as f:
+        schema, indices = _TableFileParser(table_name, columnar, headers_only=True).parse(f)
+
+    _register_table(LazyTable(schema, path, columnar), indices)
+
+
+def _load_lazy_table(table):
+    """
+    Parses the data section of the given LazyTable (if it is not loaded yet) and marks it as most recently used.
+    Unloads the least recently used tables if the memory limit is exceeded afterwards
+    """
+    if table.is_loaded():
+        if table.table_name in _loaded_lazy_tables:
+            _loaded_lazy_tables.move_to_end(table.table_name)
+        return
+
+    parsed_table, indices = _parse_table_file(table.path, table.columnar)
+    table.records = parsed_table.records
+    if indices is not None and _tables.get(table.table_name) is table:
+        _indices[table.table_name] = indices
+
+    _loaded_lazy_tables[table.table_name] = (table, _estimate_records_size(table.records))
+    _evict_lazy_tables()
+
+
+def _evict_lazy_tables():
+    """
+    Unloads the least recently used LazyTables until the loaded tables fit into the memory limit.
+    The most recently used table is never unloaded.
+    """
+    if _memory_limit is None:
+        return
+
+    loaded_size = sum(size for _, size in _loaded_lazy_tables.values())
+
+    while loaded_size > _memory_limit and len(_loaded_lazy_tables) > 1:
+        table_name, (table, size) = _loaded_lazy_tables.popitem(last=False)
+        table.records = None
+        if _tables.get(table_name) is table and table_name in _indices:
+            _indices[table_name] = {index_column: _create_empty_index(index)
+                                    for index_column, index in _indices[table_name].items()}
+
+        loaded_size -= size
+
+
+def _estimate_records_size(records):
+    """
+    Estimates the memory (in bytes) that is used by the given records
+    """
+    if isinstance(records, ColumnarRecords):
+        size = sys.getsizeof(records.columns)
+        for column in records.columns:
+            if isinstance(column, DictionaryColumn):
+                size += sys.getsizeof(column.codes) + sum(map(sys.getsizeof, column.dictionary))
+            elif isinstance(column.values, list):
+                size += sys.getsizeof(column.values) + sum(map(sys.getsizeof, column.values))
+            else:
+                size += sys.getsizeof(column.values)
+            size += len(column.null_bitmap)
+
+        return size
+
+    return sys.getsizeof(records) + sum(sys.getsizeof(record) + sum(map(sys.getsizeof, record))
+                                        for record in records)
+
+
+def _should_load_in_parallel(table_paths, max_workers):
+    """
+    Checks whether the given table files should be parsed in a process pool.
+    This is only the case if there are multiple files and workers, and the files are big enough
+    for the parsing to outweigh the overhead of starting the worker processes.
+    """
+    if len(table_paths) < 2 or (max_workers or os.cpu_count() or 1) < 2:
+        return False
+
+    total_size = 0
+    for table_path in table_paths:
+        try:
+            total_size += os.path.getsize(table_path)
+        except OSError:
+            # the error gets reported when the file is loaded
+            pass
+
+    return total_size >= PARALLEL_LOADING_MIN_BYTES
+
+
 def _create_tables_table():
     table_name = "#tables"
     table_names = [[item] for item in list(
@@ -427,21 +1782,106 @@ def _create_indices_table():
     column_types = [SchemaType.VARCHAR, SchemaType.VARCHAR, SchemaType.VARCHAR]
     records = []
     for table in _indices:
-        for column in _indices[table]:
-            records.append([_get_index_name(table, column), table, column])
+        for index_column in _indices[table]:
+            # composite indices are listed with one row per column, in the order of the key
+            for column in get_index_columns(index_column):
+                records.append([_get_index_name(table, index_column), table, column])
     schema = Schema(table_name, column_names, column_types)
     _tables[table_name] = Table(schema, records)
 
 
+class StatisticsTable(Table):
+    """
+    Class that represents the #statistics table, which contains one record with the statistics of every column of
+    the loaded tables (see retrieve_statistics).
+    The records are only built when they are accessed for the first time, since this requires the statistics of all
+    tables to be computed.
+    """
+
+    def __init__(self, schema, table_names):
+        super().__init__(schema, None)
+        self.table_names = table_names
+
+    @property
+    def records(self):
+        if self._records is None:
+            self._records = self._build_records()
+        return self._records
+
+    @records.setter
+    def records(self, records):
+        self._records = records
+
+    def _build_records(self):
+        records = []
+        for table_name in self.table_names:
+            try:
+                statistics = retrieve_statistics(table_name)
+            except TableParsingException:
+                # the data of lazily loaded tables is only parsed now, tables with errors in it are left out
+                continue
+
+            for column_name in retrieve_schema(table_name).get_simple_column_name_list():
+                column_statistics = statistics.columns[column_name]
+                records.append([table_name, column_name, statistics.num_records, column_statistics.num_distinct,
+                                column_statistics.num_nulls, _format_statistics_value(column_statistics.min_value),
+                                _format_statistics_value(column_statistics.max_value),
+                                ", ".join(f"{_format_statistics_value(value)} ({count})"
+                                          for value, count in column_statistics.most_common_values),
+                                ", ".join(_format_statistics_value(value)
+                                          for value in column_statistics.histogram_bounds)])
+        return records
+
+
+def _format_statistics_value(value):
+    return None if value is None else str(value)
+
+
+def _create_statistics_table():
+    table_name = "#statistics"
+    column_names = [f"{table_name}.table_name",
+                    f"{table_name}.column_name",
+                    f"{table_name}.num_records",
+                    f"{table_name}.num_distinct",
+                    f"{table_name}.num_nulls",
+                    f"{table_name}.min_value",
+                    f"{table_name}.max_value",
+                    f"{table_name}.most_common_values",
+                    f"{table_name}.histogram_bounds"]
+    column_types = [SchemaType.VARCHAR, SchemaType.VARCHAR, SchemaType.INT, SchemaType.INT, SchemaType.INT,
+                    SchemaType.VARCHAR, SchemaType.VARCHAR, SchemaType.VARCHAR, SchemaType.VARCHAR]
+    # the catalog tables are not included
+    table_names = [name for name in _tables if not name.startswith("#")]
+    schema = Schema(table_name, column_names, column_types)
+    _tables[table_name] = StatisticsTable(schema, table_names)
+
+
 def retrieve_table(table_name, makeCopy=False):
     """
-    This function returns a table specified by the table_name
+    This function returns a table specified by the table_name.
+    The data of lazily loaded tables is parsed on the first retrieval.
     """
     try:
-        if makeCopy:
-            return deepcopy(_tables[table_name])
+        table = _tables[table_name]
+    except KeyError:
+        raise TableNotFoundException(table_name)
+
+    if isinstance(table, LazyTable):
+        _load_lazy_table(table)
+
+    if makeCopy:
+        return deepcopy(table)
+
+    return table
 
-        return _tables[table_name]
+
+def retrieve_schema(table_name):
+    """
+    This function returns the schema of the table specified by the table_name, without loading the data of lazily
+    loaded tables
+    """
+    try:
+        return _tables[table_name].schema
     except KeyError:
         raise TableNotFoundException(table_name)
 
@@ -451,10 +1891,13 @@ def table_exists(name):
 
 
 def _get_index_name(table_name, index_column):
-    return f"{table_name}_{index_column}"
+    return f"{table_name}_{'_'.join(get_index_columns(index_column))}"
 
 
 def retrieve_index(table_name, index_column):
+    if isinstance(_tables.get(table_name), LazyTable) and index_exists(table_name, index_column):
+        _load_lazy_table(_tables[table_name])
+
     try:
         return _indices[table_name][index_column]
     except KeyError:
@@ -462,18 +1905,60 @@ def retrieve_index(table_name, index_column):
             f'Index with name "{_get_index_name(table_name, index_column)}" does not exist')
 
 
+def retrieve_table_indices(table_name):
+    """
+    Returns the index column names of all indices of the table specified by the table_name
+    """
+    return list(_indices.get(table_name, dict()).keys())
+
+
+def retrieve_statistics(table_name):
+    """
+    Returns the statistics about the table specified by the table_name (see compute_statistics).
+    They are computed on the first call and kept until the table is loaded again.
+    """
+    if table_name not in _statistics:
+        _statistics[table_name] = compute_statistics(retrieve_table(table_name))
+
+    return _statistics[table_name]
+
+
+def get_catalog_version():
+    """
+    Returns a number that changes whenever tables are (re-)loaded or the tables are cleared (see initialize), so
+    that results derived from the catalog (e.g. cached query plans) can be invalidated.
+    Loading and unloading the data of LazyTables does not change the catalog
+    """
+    return _catalog_version
+
+
 def index_exists(table_name, index_column):
     return table_name in _indices and index_column in _indices[table_name]
 
 
+def ordered_index_exists(table_name, index_column):
+    """
+    Checks whether the index over the given column exists and supports range lookups
+    """
+    return index_exists(table_name, index_column) and isinstance(_indices[table_name][index_column],
+                                                                 _OrderedIndexMixin)
+
+
 def initialize():
     """
     Clears the stored tables and creates #tables and #columns table at start
     """
     global _tables
     global _indices
+    global _memory_limit
+    global _catalog_version
     _tables = dict()
     _indices = dict()
+    _memory_limit = None
+    _catalog_version += 1
+    _loaded_lazy_tables.clear()
+    _statistics.clear()
     _create_indices_table()
     _create_tables_table()
     _create_columns_table()
+    _create_statistics_table()
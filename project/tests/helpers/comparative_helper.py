@@ -14,3 +14,10 @@ def evaluate(comparative_operation):
 def retrieve_table(name):
     table_service.load_tables_from_directory("./tests/testdata/")
     return table_service.retrieve_table(name)
+
+
+def evaluate_compiled(expression):
+    table = retrieve_table("studenten")
+    compiled_expression = expression.compile(table.schema)
+
+    return [compiled_expression(record) for record in table.records]
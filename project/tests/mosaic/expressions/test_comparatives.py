@@ -1,3 +1,4 @@
+from mosaic.compiler.expressions.arithmetic_expression import ArithmeticExpression, ArithmeticOperator
 from mosaic.compiler.expressions.column_expression import ColumnExpression
 from mosaic.compiler.expressions.literal_expression import LiteralExpression
 from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator, \
@@ -92,3 +93,29 @@ def test_explain():
     expression = ComparativeExpression(LiteralExpression(
         comparison_string), ComparativeOperator.GREATER, ColumnExpression("MatrNr"))
     assert str(expression) == f'("{comparison_string}" > MatrNr)'
+
+
+def test_compiled_comparison_matches_row_evaluation():
+    table = comparative_helper.retrieve_table("studenten")
+    comparative_operation = ComparativeExpression(ArithmeticExpression(
+        ColumnExpression("Semester"), ArithmeticOperator.TIMES, LiteralExpression(2)), ComparativeOperator.GREATER,
+        ColumnExpression("studenten.Semester"))
+
+    results = comparative_helper.evaluate_compiled(comparative_operation)
+    assert results == [comparative_operation.get_result(table, i) for i in range(len(table))]
+
+
+def test_compiled_comparison_with_null():
+    for operator, expected in [(ComparativeOperator.EQUAL, 0), (ComparativeOperator.NOT_EQUAL, 1),
+                               (ComparativeOperator.SMALLER, 0), (ComparativeOperator.GREATER_EQUAL, 0)]:
+        comparative_operation = ComparativeExpression(ColumnExpression("MatrNr"), operator, LiteralExpression(None))
+        results = comparative_helper.evaluate_compiled(comparative_operation)
+        assert set(results) == {expected}
+
+
+def test_compiled_comparison_incompatible_types():
+    comparative_operation = ComparativeExpression(ColumnExpression("Name"), ComparativeOperator.SMALLER,
+                                                  ColumnExpression("MatrNr"))
+
+    with pytest.raises(IncompatibleOperandTypesException):
+        comparative_helper.evaluate_compiled(comparative_operation)
@@ -1,9 +1,20 @@
 from mosaic.cli import CliErrorMessageException
 from mosaic.query_executor import execute_query
 from mosaic import table_service
+from mosaic.compiler.expressions.column_expression import ColumnExpression
+from mosaic.compiler.operators.hash_aggregate import HashAggregate, AggregateFunction
+from mosaic.compiler.operators.table_scan import TableScan
+from mosaic.compiler.operators.explain import Explain
+from mosaic.compiler.operators.nested_loops_join import NestedLoopsJoin
+from mosaic.compiler.operators.abstract_join import JoinType
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def refresh_loaded_tables():
+    table_service.load_tables_from_directory("./tests/testdata/")
+
+
 def test_sum_aggregation():
     result, _ = execute_query(
         "gamma Boss aggregate SumPersNr as sum(PersNr) assistenten;")[0]
@@ -75,3 +86,54 @@ def test_int_subtraction_aggregation():
         table_service.SchemaType.INT, table_service.SchemaType.INT]
     assert result.records == [[4997, 2], [5037, 1], [5040, 1], [5047, 1], [4048, 1], [5049, 1], [5214, 1], [5257, 1],
                               [5020, 1], [4626, 1]]
+
+
+def test_aggregation_executes_child_once():
+    executions = []
+
+    class CountingScan(TableScan):
+        def get_records(self):
+            executions.append(self.table_name)
+            yield from super().get_records()
+
+        def get_result(self):
+            executions.append(self.table_name)
+            return super().get_result()
+
+    hash_aggregate = HashAggregate(CountingScan("assistenten"), [(None, ColumnExpression("Boss"))],
+                                   [("SumPersNr", AggregateFunction.SUM, ColumnExpression("PersNr")), [],
+                                    [("CountPersNr", AggregateFunction.COUNT, ColumnExpression("PersNr"))]])
+    result = hash_aggregate.get_result()
+
+    assert executions == ["assistenten"]
+    assert result.records == [[2125, 6005, 2], [2126, 3004, 1], [2127, 6011, 2], [2134, 3007, 1]]
+
+
+def test_aggregation_empty_input():
+    result, _ = execute_query(
+        "gamma aggregate Anzahl as count(PersNr), SumPersNr as sum(PersNr) sigma PersNr < 0 assistenten;")[0]
+    assert result.records == [[0, 0]]
+
+
+def test_aggregation_schema_without_execution():
+    executions = []
+
+    class CountingScan(TableScan):
+        def get_records(self):
+            executions.append(self.table_name)
+            yield from super().get_records()
+
+        def get_result(self):
+            executions.append(self.table_name)
+            return super().get_result()
+
+    hash_aggregate = HashAggregate(CountingScan("assistenten"), [(None, ColumnExpression("Boss"))],
+                                   [("SumPersNr", AggregateFunction.SUM, ColumnExpression("PersNr"))])
+    join = NestedLoopsJoin(hash_aggregate, CountingScan("professoren"), JoinType.INNER,
+                           condition=None, is_natural=True)
+    explain = Explain(join).get_result()
+
+    assert executions == []
+    assert join.get_schema().column_names == ["assistenten.Boss", "SumPersNr", "professoren.PersNr",
+                                              "professoren.Name", "professoren.Rang", "professoren.Raum"]
+    assert len(explain) == 4
@@ -1,3 +1,4 @@
+from mosaic import table_service
 from mosaic.compiler.operators.table_scan import TableScan
 from mosaic.compiler.expressions.column_expression import ColumnExpression
 from mosaic.compiler.operators.projection import Projection
@@ -16,3 +17,16 @@ def test_distinct_one_column():
 
     for index in reversed(range(len(result_column))):
         assert result_column.index(result_column[index]) == index
+
+
+def test_distinct_columnar():
+    table_service.load_from_file("./tests/testdata/hoeren.table", columnar=True)
+
+    projection = Projection(TableScan("hoeren"), [(None, ColumnExpression("VorlNr"))])
+    result = HashDistinct(projection).get_result()
+
+    table_service.load_from_file("./tests/testdata/hoeren.table")
+    expected = HashDistinct(projection).get_result()
+
+    assert result.records == expected.records
+    assert len(result) < len(TableScan("hoeren").get_result())
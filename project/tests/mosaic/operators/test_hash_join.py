@@ -125,6 +125,23 @@ def test_hashjoin_left_natural():
     assert [29555, "Feuerbach", 2, None, None, None] in result.records
 
 
+@pytest.mark.parametrize('join_type', [JoinType.INNER, JoinType.LEFT_OUTER])
+@pytest.mark.parametrize('is_natural', [False, True])
+def test_hashjoin_build_right(join_type, is_natural):
+    condition = None if is_natural else ComparativeExpression(ColumnExpression("studenten.Name"),
+                                                              ComparativeOperator.EQUAL,
+                                                              ColumnExpression("assistenten.Name"))
+    expected = HashJoin(TableScan("studenten"), TableScan("assistenten"), join_type, condition,
+                        is_natural).get_result()
+    join = HashJoin(TableScan("studenten"), TableScan("assistenten"), join_type, condition, is_natural,
+                    build_right=True)
+    result = join.get_result()
+
+    assert result.schema.column_names == expected.schema.column_names
+    assert sorted(result.records, key=str) == sorted(expected.records, key=str)
+    assert "build=right" in str(join)
+
+
 def test_hashjoin_wrong_condition_type():
     table1 = TableScan("vorlesungen")
     table2 = TableScan("voraussetzen")
@@ -222,3 +239,26 @@ def test_natural_join_alias_projection():
     result = join.get_result()
     assert len(result) == 10
     assert result.schema.column_names == ["PersNr", "professoren.Name", "professoren.Rang", "professoren.Raum"]
+
+
+def test_hashjoin_streams_probe_side():
+    consumed = []
+
+    class CountingScan(TableScan):
+        def get_records(self):
+            for record in super().get_records():
+                consumed.append(record)
+                yield record
+
+    table1 = TableScan("professoren")
+    table2 = CountingScan("vorlesungen")
+    comparative = ComparativeExpression(ColumnExpression("professoren.PersNr"),
+                                        ComparativeOperator.EQUAL,
+                                        ColumnExpression("vorlesungen.gelesenVon"))
+    join = HashJoin(table1, table2, JoinType.INNER, comparative, False)
+    records = join.get_records()
+
+    first_record = next(records)
+    assert first_record[0] == first_record[-1]
+    assert len(consumed) < len(table_service.retrieve_table("vorlesungen"))
+    assert [first_record] + list(records) == join.get_result().records
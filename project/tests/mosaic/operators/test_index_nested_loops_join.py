@@ -0,0 +1,129 @@
+import pytest
+from mosaic import table_service
+from mosaic.compiler.operators.abstract_join import JoinType, JoinConditionNotSupportedException
+from mosaic.compiler.operators.hash_join import HashJoin
+from mosaic.compiler.operators.index_nested_loops_join import IndexNestedLoopsJoin
+from mosaic.compiler.operators.index_seek import IndexSeek
+from mosaic.compiler.operators.table_scan import TableScan
+from mosaic.compiler.operators.explain import Explain
+from mosaic.compiler.expressions.column_expression import ColumnExpression
+from mosaic.compiler.expressions.literal_expression import LiteralExpression
+from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, \
+    ComparativeOperator
+
+
+@pytest.fixture(autouse=True)
+def refresh_loaded_tables():
+    table_service.load_tables_from_directory("./data/kemper02/")
+
+
+def _gelesen_von_condition():
+    return ComparativeExpression(ColumnExpression("professoren.PersNr"),
+                                 ComparativeOperator.EQUAL,
+                                 ColumnExpression("vorlesungen.gelesenVon"))
+
+
+def test_index_nested_loops_join_inner():
+    join = IndexNestedLoopsJoin(TableScan("professoren"), TableScan("vorlesungen"), JoinType.INNER,
+                                _gelesen_von_condition(), False)
+    expected = HashJoin(TableScan("professoren"), TableScan("vorlesungen"), JoinType.INNER,
+                        _gelesen_von_condition(), False).get_result()
+    result = join.get_result()
+
+    assert join.get_indexed_node().table_name == "vorlesungen"
+    assert result.schema.column_names == expected.schema.column_names
+    assert sorted(result.records) == sorted(expected.records)
+    assert len(result) == 10
+
+
+def test_index_nested_loops_join_left_indexed():
+    # hoeren has no index over VorlNr, so the index of the left table gets probed
+    condition = ComparativeExpression(ColumnExpression("hoeren.VorlNr"),
+                                      ComparativeOperator.EQUAL,
+                                      ColumnExpression("vorlesungen.VorlNr"))
+    join = IndexNestedLoopsJoin(TableScan("vorlesungen"), TableScan("hoeren"), JoinType.INNER, condition, False)
+    expected = HashJoin(TableScan("vorlesungen"), TableScan("hoeren"), JoinType.INNER, condition, False).get_result()
+    result = join.get_result()
+
+    assert join.get_indexed_node().table_name == "vorlesungen"
+    assert join.get_outer_node().table_name == "hoeren"
+    assert result.schema.column_names == expected.schema.column_names
+    assert sorted(result.records) == sorted(expected.records)
+
+
+def test_index_nested_loops_join_left_outer():
+    condition = ComparativeExpression(ColumnExpression("studenten.MatrNr"),
+                                      ComparativeOperator.EQUAL,
+                                      ColumnExpression("pruefen.MatrNr"))
+    with pytest.raises(JoinConditionNotSupportedException):
+        IndexNestedLoopsJoin(TableScan("studenten"), TableScan("pruefen"), JoinType.LEFT_OUTER, condition, False)
+
+    condition = ComparativeExpression(ColumnExpression("pruefen.MatrNr"),
+                                      ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    join = IndexNestedLoopsJoin(TableScan("pruefen"), TableScan("studenten"), JoinType.LEFT_OUTER, condition, False)
+    expected = HashJoin(TableScan("pruefen"), TableScan("studenten"), JoinType.LEFT_OUTER, condition,
+                        False).get_result()
+    result = join.get_result()
+
+    assert sorted(result.records) == sorted(expected.records)
+
+
+def test_index_nested_loops_join_left_outer_null_padding():
+    outer = IndexSeek("vorlesungen", "VorlNr", ComparativeExpression(ColumnExpression("VorlNr"),
+                                                                     ComparativeOperator.EQUAL,
+                                                                     LiteralExpression(5001)))
+    condition = ComparativeExpression(ColumnExpression("vorlesungen.VorlNr"),
+                                      ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    join = IndexNestedLoopsJoin(outer, TableScan("studenten"), JoinType.LEFT_OUTER, condition, False)
+    result = join.get_result()
+
+    assert len(result) == 1
+    assert result.records[0][:4] == [5001, "Grundzuege", 4, 2137]
+    assert result.records[0][4:] == [None, None, None]
+
+
+def test_index_nested_loops_join_natural():
+    join = IndexNestedLoopsJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER, None, True)
+    expected = HashJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER, None, True).get_result()
+    result = join.get_result()
+
+    assert result.schema.column_names == expected.schema.column_names
+    assert sorted(result.records) == sorted(expected.records)
+
+
+def test_index_nested_loops_join_no_index():
+    condition = ComparativeExpression(ColumnExpression("hoeren.MatrNr"),
+                                      ComparativeOperator.EQUAL,
+                                      ColumnExpression("pruefen.MatrNr"))
+    with pytest.raises(JoinConditionNotSupportedException):
+        IndexNestedLoopsJoin(TableScan("hoeren"), TableScan("pruefen"), JoinType.INNER, condition, False)
+
+
+def test_index_nested_loops_join_composite_index(tmp_path):
+    (tmp_path / "kurse.table").write_text("[Schema]\nJahr: int\nNr: int\nTitel: varchar\n\n[Indices]\nJahr, Nr\n\n"
+                                          "[Data]\n2020;1;A\n2020;2;B\n2021;1;C\n")
+    (tmp_path / "belegt.table").write_text("[Schema]\nName: varchar\nNr: int\nJahr: int\n\n"
+                                           "[Data]\nX;1;2020\nY;1;2021\nZ;3;2021\n")
+    table_service.load_tables_from_directory(tmp_path)
+
+    condition = ComparativeExpression(ColumnExpression("belegt.Nr"), ComparativeOperator.EQUAL,
+                                      ColumnExpression("kurse.Nr"))
+    join = IndexNestedLoopsJoin(TableScan("belegt"), TableScan("kurse"), JoinType.INNER, None, True)
+    result = join.get_result()
+
+    assert join.index_column == "Jahr,Nr"
+    assert sorted(result.records) == [["X", 1, 2020, "A"], ["Y", 1, 2021, "C"]]
+
+    with pytest.raises(JoinConditionNotSupportedException):
+        IndexNestedLoopsJoin(TableScan("belegt"), TableScan("kurse"), JoinType.INNER, condition, False)
+
+
+def test_index_nested_loops_join_explain():
+    join = IndexNestedLoopsJoin(TableScan("professoren"), TableScan("vorlesungen"), JoinType.INNER,
+                                _gelesen_von_condition(), False)
+    result = Explain(join).get_result()
+
+    assert result.records[0] == ["-->IndexNestedLoopsJoin(inner, natural=False, index=vorlesungen_gelesenVon, "
+                                 "condition=(professoren.PersNr = vorlesungen.gelesenVon))"]
@@ -0,0 +1,65 @@
+import pytest
+from mosaic import table_service
+from mosaic.compiler.expressions.column_expression import ColumnExpression
+from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from mosaic.compiler.expressions.literal_expression import LiteralExpression
+from mosaic.compiler.operators.index_range_seek import IndexRangeSeek
+from mosaic.compiler.operators.index_seek import IndexSeekConditionNotSupportedException, \
+    ErrorInIndexSeekConditionException
+
+
+@pytest.fixture(autouse=True, params=[False, True])
+def load_ordered_index_table(tmp_path, request):
+    table_service.initialize()
+    table_file = tmp_path / "orderedIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Indices]\nMatrNr: ordered\nVorlNr\n\n[Data]\n"
+                          "28106;5041\n26120;5001\n29120;5001\n27550;5001\n28106;5052\n27550;4052\n29120;5049\n")
+    table_service.load_from_file(str(table_file), columnar=request.param)
+
+
+def _condition(column, operator, value):
+    return ComparativeExpression(ColumnExpression(column), operator, LiteralExpression(value))
+
+
+def test_index_range_seek():
+    operator = IndexRangeSeek("orderedIndex", "MatrNr", [
+        _condition("MatrNr", ComparativeOperator.GREATER_EQUAL, 27550),
+        _condition("MatrNr", ComparativeOperator.SMALLER, 29120)
+    ])
+    result = operator.get_result()
+
+    assert result.schema.column_names == ["orderedIndex.MatrNr", "orderedIndex.VorlNr"]
+    assert result.records == [[27550, 5001], [27550, 4052], [28106, 5041], [28106, 5052]]
+    assert operator.get_num_records() == 4
+    assert str(operator) == "IndexRangeSeek(orderedIndex_MatrNr, condition=((orderedIndex.MatrNr >= 27550) AND " \
+                            "(orderedIndex.MatrNr < 29120)))"
+
+
+def test_index_range_seek_tightest_bounds():
+    operator = IndexRangeSeek("orderedIndex", "o.MatrNr", [
+        _condition("o.MatrNr", ComparativeOperator.GREATER_EQUAL, 26120),
+        ComparativeExpression(LiteralExpression(27550), ComparativeOperator.SMALLER, ColumnExpression("MatrNr")),
+        _condition("MatrNr", ComparativeOperator.SMALLER_EQUAL, 29120),
+        _condition("MatrNr", ComparativeOperator.SMALLER_EQUAL, 28106)
+    ], alias="o")
+
+    assert list(operator.get_records()) == [[28106, 5041], [28106, 5052]]
+    assert operator.get_schema().column_names == ["o.MatrNr", "o.VorlNr"]
+
+
+def test_index_range_seek_equality_and_null():
+    operator = IndexRangeSeek("orderedIndex", "MatrNr", [_condition("MatrNr", ComparativeOperator.EQUAL, 29120)])
+    assert list(operator.get_records()) == [[29120, 5001], [29120, 5049]]
+
+    operator = IndexRangeSeek("orderedIndex", "MatrNr", [_condition("MatrNr", ComparativeOperator.GREATER, None)])
+    assert list(operator.get_records()) == []
+    assert operator.get_num_records() == 0
+
+
+def test_index_range_seek_not_supported():
+    with pytest.raises(IndexSeekConditionNotSupportedException):
+        IndexRangeSeek("orderedIndex", "VorlNr", [_condition("VorlNr", ComparativeOperator.GREATER, 5000)])
+    with pytest.raises(IndexSeekConditionNotSupportedException):
+        IndexRangeSeek("orderedIndex", "MatrNr", [_condition("MatrNr", ComparativeOperator.NOT_EQUAL, 5000)])
+    with pytest.raises(ErrorInIndexSeekConditionException):
+        IndexRangeSeek("orderedIndex", "MatrNr", [_condition("VorlNr", ComparativeOperator.GREATER, 5000)])
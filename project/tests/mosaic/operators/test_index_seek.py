@@ -1,13 +1,20 @@
 from mosaic.compiler.expressions.column_expression import ColumnExpression
 from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from mosaic.compiler.expressions.conjunctive_expression import ConjunctiveExpression
 from mosaic.compiler.expressions.literal_expression import LiteralExpression
 from mosaic.compiler.operators.index_seek import IndexSeek, ErrorInIndexSeekConditionException, \
     IndexSeekConditionNotSupportedException
 from mosaic.table_service import Table, IndexNotFoundException
 from mosaic.table_service import TableNotFoundException
+from mosaic import table_service
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def refresh_loaded_tables():
+    table_service.load_tables_from_directory("./tests/testdata/")
+
+
 def test_index_seek_no_alias():
     operator = IndexSeek("correctIndex", "MatrNr", _get_nice_condition(), alias=None)
     result = operator.get_result()
@@ -118,3 +125,29 @@ def test_index_seek_table_bad_condition_no_column_reference():
     condition = ComparativeExpression(left, ComparativeOperator.EQUAL, right)
     with pytest.raises(ErrorInIndexSeekConditionException):
         IndexSeek("correctIndex", "MatrNr", condition)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_index_seek_composite_index(tmp_path, columnar):
+    table_file = tmp_path / "compositeIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Indices]\nMatrNr,VorlNr: ordered\nVorlNr,MatrNr\n\n"
+                          "[Data]\n28106;5041\n26120;5001\n27550;5001\n27550;4052\n")
+    table_service.load_from_file(str(table_file), columnar)
+    matr_nr_condition = ComparativeExpression(ColumnExpression("c.MatrNr"), ComparativeOperator.EQUAL,
+                                              LiteralExpression(27550))
+    vorl_nr_condition = ComparativeExpression(LiteralExpression(4052), ComparativeOperator.EQUAL,
+                                              ColumnExpression("VorlNr"))
+
+    operator = IndexSeek("compositeIndex", "MatrNr,VorlNr",
+                         ConjunctiveExpression([matr_nr_condition, vorl_nr_condition]), alias="c")
+    assert list(operator.get_records()) == [[27550, 4052]]
+    assert str(operator) == "IndexSeek(compositeIndex_MatrNr_VorlNr, table_alias=c, " \
+                            "condition=((c.MatrNr = 27550) AND (4052 = c.VorlNr)))"
+
+    # only ordered indices support seeks on a prefix of their columns
+    operator = IndexSeek("compositeIndex", "MatrNr,VorlNr", matr_nr_condition, alias="c")
+    assert list(operator.get_records()) == [[27550, 4052], [27550, 5001]]
+    with pytest.raises(IndexSeekConditionNotSupportedException):
+        IndexSeek("compositeIndex", "VorlNr,MatrNr", vorl_nr_condition)
+    with pytest.raises(ErrorInIndexSeekConditionException):
+        IndexSeek("compositeIndex", "VorlNr,MatrNr", ConjunctiveExpression([matr_nr_condition, vorl_nr_condition]))
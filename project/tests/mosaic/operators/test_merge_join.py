@@ -7,6 +7,8 @@ from mosaic.compiler.operators.ordering import Ordering
 from mosaic.compiler.operators.table_scan import TableScan
 from mosaic.compiler.operators.projection import Projection
 from mosaic.compiler.operators.explain import Explain
+from mosaic.compiler.operators.hash_join import HashJoin
+from mosaic.compiler.operators.selection import Selection
 from mosaic.compiler.expressions.column_expression import ColumnExpression
 from mosaic.compiler.expressions.literal_expression import LiteralExpression
 from mosaic.compiler.expressions.disjunctive_expression import DisjunctiveExpression
@@ -255,3 +257,30 @@ def test_mergejoin_explain():
     assert "left_outer" in result.records[0][0]
     assert "condition=(studenten.Name = assistenten.Name)" in result.records[0][0]
     assert "natural=True" in result.records[0][0]
+
+
+@pytest.mark.parametrize('join_type', [JoinType.INNER, JoinType.LEFT_OUTER])
+@pytest.mark.parametrize('is_natural', [False, True])
+def test_mergejoin_duplicates_at_the_end(join_type, is_natural):
+    # hoeren has more records than studenten and ends with multiple records of the same student
+    comparative = ComparativeExpression(ColumnExpression("hoeren.MatrNr"),
+                                        ComparativeOperator.EQUAL,
+                                        ColumnExpression("studenten.MatrNr"))
+    join = MergeJoin(Ordering(TableScan("hoeren"), [ColumnExpression("MatrNr")]),
+                     Ordering(TableScan("studenten"), [ColumnExpression("MatrNr")]), join_type, comparative, is_natural)
+    expected = HashJoin(TableScan("hoeren"), TableScan("studenten"), join_type, comparative, is_natural).get_result()
+
+    assert sorted(join.get_result().records) == sorted(expected.records)
+
+
+def test_mergejoin_left_empty_right_relation():
+    comparative = ComparativeExpression(ColumnExpression("hoeren.MatrNr"),
+                                        ComparativeOperator.EQUAL,
+                                        ColumnExpression("studenten.MatrNr"))
+    empty = Selection(TableScan("studenten"), LiteralExpression(False))
+    join = MergeJoin(Ordering(TableScan("hoeren"), [ColumnExpression("MatrNr")]),
+                     Ordering(empty, [ColumnExpression("MatrNr")]), JoinType.LEFT_OUTER, comparative, True)
+    result = join.get_result()
+
+    assert len(result) == 10
+    assert [26120, 5001, None, None] in result.records
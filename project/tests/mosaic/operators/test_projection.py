@@ -10,6 +10,7 @@ from mosaic.compiler.expressions.arithmetic_expression import ArithmeticExpressi
 from mosaic.compiler.expressions.literal_expression import LiteralExpression
 from mosaic.table_service import SchemaType
 from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from mosaic.query_executor import execute_query
 import pytest
 
 
@@ -251,3 +252,34 @@ def test_select_comparative():
     assert result.schema.column_names[0] == "test"
     assert result.schema.column_types[0] == SchemaType.INT
     assert result[0, "test"] == 1
+
+
+def test_projection_vectorized():
+    query = "pi MatrNr, Double as Semester * 2, Next as Semester + null, Label as Name + \"!\", " \
+            "Late as Semester > 10 and Semester < 13 sigma Semester < 12 studenten;"
+    table_service.load_from_file("./tests/testdata/studenten.table")
+    expected, _ = execute_query(query)[0]
+
+    try:
+        table_service.load_from_file("./tests/testdata/studenten.table", columnar=True)
+        assert Projection(TableScan("studenten"), [(None, ColumnExpression("MatrNr"))]).supports_batches()
+
+        result, _ = execute_query(query)[0]
+        assert result.schema.column_names == expected.schema.column_names
+        assert result.records == expected.records
+        assert [record[2] for record in result.records] == [None] * len(result.records)
+    finally:
+        table_service.load_from_file("./tests/testdata/studenten.table")
+
+
+def test_projection_schema_cached_and_rebuilt_on_rewiring():
+    table_service.load_tables_from_directory("./tests/testdata/")
+
+    projection = Projection(TableScan("professoren"), [(None, ColumnExpression("Name"))])
+    schema = projection.get_schema()
+
+    assert projection.get_schema() is schema
+
+    projection.node = TableScan("studenten")
+
+    assert projection.get_schema().column_names == ["studenten.Name"]
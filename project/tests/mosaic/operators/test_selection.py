@@ -1,4 +1,10 @@
+import pytest
 from mosaic import table_service
+from mosaic.compiler.expressions.column_expression import ColumnExpression
+from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from mosaic.compiler.expressions.literal_expression import LiteralExpression
+from mosaic.compiler.operators.selection import Selection
+from mosaic.compiler.operators.table_scan import TableScan
 from mosaic.query_executor import execute_query
 
 
@@ -25,3 +31,47 @@ def test_selection_with_column_name():
 
     for i in range(len(result)):
         assert result[i, "ordinal_position"]
+
+
+def test_selection_get_records_is_pipelined():
+    consumed = []
+
+    class CountingScan(TableScan):
+        def get_records(self):
+            for record in super().get_records():
+                consumed.append(record)
+                yield record
+
+    selection = Selection(CountingScan("professoren"),
+                          ComparativeExpression(ColumnExpression("Rang"), ComparativeOperator.EQUAL,
+                                                LiteralExpression("C4")))
+    records = selection.get_records()
+
+    first_record = next(records)
+    assert first_record[2] == "C4"
+    assert len(consumed) < len(table_service.retrieve_table("professoren"))
+    assert [first_record] + list(records) == selection.get_result().records
+
+
+@pytest.mark.parametrize(
+    'query',
+    [
+        'sigma Semester > 10 studenten;',
+        'sigma Semester >= 3 and Name < "K" studenten;',
+        'sigma Semester = 2 or Semester * 2 > 20 or Name = "Feuerbach" studenten;',
+        'sigma Semester < null or MatrNr != null studenten;',
+        'sigma 1 studenten;',
+    ],
+)
+def test_selection_vectorized(query):
+    table_service.load_from_file("./tests/testdata/studenten.table")
+    expected, _ = execute_query(query)[0]
+
+    try:
+        table_service.load_from_file("./tests/testdata/studenten.table", columnar=True)
+        assert TableScan("studenten").supports_batches()
+
+        result, _ = execute_query(query)[0]
+        assert result.records == expected.records
+    finally:
+        table_service.load_from_file("./tests/testdata/studenten.table")
@@ -1,8 +1,19 @@
 import pytest
 
+from mosaic import table_service
+from mosaic.compiler.operators.hash_set_operators import HashIntersect, HashExcept
+from mosaic.compiler.operators.projection import Projection
+from mosaic.compiler.operators.set_operators import Intersect, Except
+from mosaic.compiler.operators.table_scan import TableScan
+from mosaic.compiler.expressions.column_expression import ColumnExpression
 from mosaic.query_executor import execute_query
 
 
+@pytest.fixture(autouse=True)
+def refresh_loaded_tables():
+    table_service.load_tables_from_directory("./tests/testdata/")
+
+
 def test_union_get_result():
     result, _ = execute_query("pi VorlNr as Vorgaenger voraussetzen union pi VorlNr vorlesungen;")[0]
     assert len(result) == 18
@@ -25,3 +36,33 @@ def test_except_get_result():
 def test_table_schema_does_not_match_exception():
     with pytest.raises(Exception):
         execute_query("pi Titel vorlesungen except pi VorlNr vorlesungen;")
+
+
+def _project(table_name, column_name):
+    return Projection(TableScan(table_name), [("VorlNr", ColumnExpression(column_name))])
+
+
+@pytest.mark.parametrize("set_operator,hash_set_operator", [(Intersect, HashIntersect), (Except, HashExcept)])
+def test_hash_set_operators_bag_semantics(set_operator, hash_set_operator):
+    expected = set_operator(_project("hoeren", "VorlNr"), _project("voraussetzen", "Nachfolger")).get_result()
+    result = hash_set_operator(_project("hoeren", "VorlNr"), _project("voraussetzen", "Nachfolger")).get_result()
+
+    assert len(result) > 0
+    assert result.records == expected.records
+
+
+@pytest.mark.parametrize("set_operator,hash_set_operator", [(Intersect, HashIntersect), (Except, HashExcept)])
+def test_hash_set_operators_set_semantics(set_operator, hash_set_operator):
+    expected = set_operator(_project("hoeren", "VorlNr"), _project("voraussetzen", "Nachfolger")).get_result()
+    result = hash_set_operator(_project("hoeren", "VorlNr"), _project("voraussetzen", "Nachfolger"),
+                               is_set_semantics=True).get_result()
+
+    assert sorted(result.records) == sorted([list(record) for record in {tuple(record) for record in expected.records}])
+
+
+def test_hash_set_operators_optimized_query():
+    result, _ = execute_query("pi VorlNr vorlesungen except pi VorlNr as Vorgaenger voraussetzen;", True)[0]
+    assert len(result) == 6
+    result, _ = execute_query("pi distinct VorlNr (pi VorlNr as Vorgaenger voraussetzen intersect pi VorlNr vorlesungen);",
+                              True)[0]
+    assert len(result) == 4
@@ -0,0 +1,25 @@
+import pytest
+
+from mosaic import table_service
+from mosaic.compiler.operators.table_scan import TableScan
+from mosaic.compiler.expressions.column_expression import ColumnExpression
+from mosaic.compiler.operators.projection import Projection
+from mosaic.compiler.operators.ordering import Ordering
+from mosaic.compiler.operators.hash_distinct import HashDistinct
+from mosaic.compiler.operators.sort_distinct import SortDistinct
+
+
+@pytest.fixture(autouse=True)
+def refresh_loaded_tables():
+    table_service.load_tables_from_directory("./tests/testdata/")
+
+
+def test_sort_distinct_one_column():
+    ordering = Ordering(TableScan("hoeren"), [ColumnExpression("VorlNr")])
+    projection = Projection(ordering, [(None, ColumnExpression("VorlNr"))])
+
+    result = SortDistinct(projection).get_result()
+    expected = HashDistinct(projection).get_result()
+
+    assert result.records == expected.records
+    assert len(result) < len(TableScan("hoeren").get_result())
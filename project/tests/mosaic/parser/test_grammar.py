@@ -23,6 +23,8 @@ from mosaic.parser.grammar import grammar
         'sigma car > "5" rel',
         'gamma Semester aggregate Anzahl as count(MatrNr) studenten',
         'pi Name, FullName as "Prof. " + Name professoren',
+        'sigma car = ? rel',
+        'sigma car = :car and wheel < ? + 1 rel',
     ],
 )
 def test_valid_query(query):
@@ -42,6 +44,8 @@ def test_valid_query(query):
         'select #rel.car.wheel rel',
         'gamma Semester aggregate "Anzahl" as count(MatrNr) studenten',
         'pi Name, "FullName" as "Prof. " + Name professoren',
+        'sigma car = : rel',
+        'sigma car = :1 rel',
     ],
 )
 def test_invalid_query(query):
@@ -0,0 +1,161 @@
+"""Tests the recursive-descent parser against the parsimonious grammar."""
+from enum import Enum
+
+import pytest
+
+from mosaic import table_service
+from mosaic.compiler import compiler
+from mosaic.compiler.compiler_exception import CompilerException
+from mosaic.compiler.expressions.parameter_expression import QueryParameters
+from mosaic.parser import QuerySyntaxException
+from mosaic.parser import compile_query
+from mosaic.parser import parse_query
+from mosaic.parser.tokenizer import tokenize
+
+
+@pytest.fixture(autouse=True)
+def refresh_loaded_tables():
+    table_service.load_tables_from_directory("./tests/testdata/")
+
+
+def _compile_with_grammar(query):
+    parsing_result = parse_query(query)
+    assert not parsing_result.has_error(), parsing_result.error
+
+    return compiler.compile_with_parameters(parsing_result.ast)
+
+
+def _assert_same_node(expected, actual, path="plan"):
+    """Compares the public attributes of the given nodes recursively."""
+    assert type(actual) is type(expected), path
+
+    if isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected), path
+        for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+            _assert_same_node(expected_item, actual_item, f"{path}[{i}]")
+    elif isinstance(expected, QueryParameters):
+        assert (actual.num_positional, actual.names) == (expected.num_positional, expected.names), path
+    elif hasattr(expected, "__dict__") and not isinstance(expected, Enum):
+        for name, value in vars(expected).items():
+            if not name.startswith("_"):
+                _assert_same_node(value, getattr(actual, name), f"{path}.{name}")
+    else:
+        assert actual == expected, path
+
+
+@pytest.mark.parametrize(
+    'query',
+    [
+        '#tables',
+        'from studenten as s',
+        '(studenten)',
+        'pi distinct Semester studenten',
+        'pi distinct studenten',
+        'select MatrNr, m as MatrNr * 2 - -1 from studenten',
+        'pi Name, FullName as "Prof. " + Name professoren',
+        'pi x as 1 + 2 * (3 - 4) / 5.5 studenten',
+        'pi MatrNr studenten as as',
+        'sigma MatrNr = 1 and Name = "a  b" or Semester >= 3 and NULL != Name studenten',
+        'sigma (MatrNr < ? or Semester <= :s) and MatrNr > :s (studenten)',
+        'where MatrNr=-1 sigma Semester > 0 studenten',
+        'tau Name, Semester * 2 studenten',
+        'ORDER BY Name studenten',
+        'gamma Semester aggregate Anzahl as count(MatrNr) studenten',
+        'group by s as Semester aggregate c as sum(MatrNr), d AS AVG(MatrNr), e as min(Name) studenten',
+        'gamma aggregate c as max(MatrNr) studenten',
+        'studenten join studenten.MatrNr = hoeren.MatrNr hoeren left join hoeren.VorlNr = vorlesungen.VorlNr '
+        'vorlesungen',
+        'studenten natural join hoeren natural left join (vorlesungen) cross join assistenten',
+        'pi MatrNr studenten union pi MatrNr hoeren except pi MatrNr studenten intersect pi MatrNr hoeren',
+        'explain pi MatrNr studenten natural join hoeren',
+        'sigma MatrNr = 1and Semester = 2 studenten',
+        'studenten as\ts\tcross join hoeren',
+        # null is matched as a prefix of a name like by the grammar
+        'sigma MatrNr =null studenten',
+        'sigma MatrNr = nullstudenten',
+        'sigma x < nullName studenten',
+        'sigma x = null.x studenten',
+        # multi-word keywords are separated by a single space
+        'studenten cross  join hoeren',
+        'studenten natural left  join hoeren',
+        'studenten natural join\nhoeren',
+        'order  by Name studenten',
+        # keywords are followed by whitespace
+        'from ',
+        'from(studenten)',
+        'sigma(MatrNr = 1) studenten',
+        'pi x as(1) studenten',
+        'sigma MatrNr = 1 or(MatrNr = 2) studenten',
+        'studenten union(studenten)',
+    ],
+)
+def test_same_plan_as_grammar(query):
+    """Tests if both parsers build the same execution plan or both reject the query."""
+    if parse_query(query).has_error():
+        with pytest.raises(QuerySyntaxException):
+            compile_query(query)
+    else:
+        _assert_same_node(_compile_with_grammar(query), compile_query(query))
+
+
+@pytest.mark.parametrize(
+    'query',
+    [
+        '',
+        'studenten 1',
+        'studenten;',
+        'my_table',
+        'pi studenten.MatrNr.x studenten',
+        'pi MatrNr',
+        'sigma MatrNr = studenten',
+        'sigma MatrNr = - 1 studenten',
+        'sigma MatrNr = :1 studenten',
+        'studenten join hoeren',
+        'gamma aggregate c as median(MatrNr) studenten',
+        'gamma Semester aggregate "Anzahl" as count(MatrNr) studenten',
+        '(studenten',
+        # syntax errors are reported before missing tables
+        'sigma MatrNr = 1 (notATable',
+    ],
+)
+def test_invalid_query(query):
+    """Tests if invalid queries are rejected like by the grammar."""
+    assert parse_query(query).has_error()
+    with pytest.raises(QuerySyntaxException):
+        compile_query(query)
+
+
+@pytest.mark.parametrize(
+    'query',
+    [
+        'pi x as ? studenten',
+        'tau Name, ? studenten',
+        'gamma aggregate c as sum(?) studenten',
+        'gamma Semester aggregate c as count(MatrNr), d as sum(?), e as max(MatrNr) studenten',
+    ],
+)
+def test_parameters_not_supported(query):
+    """Tests if both parsers reject parameters in result and sort columns."""
+    with pytest.raises(CompilerException):
+        _compile_with_grammar(query)
+    with pytest.raises(CompilerException):
+        compile_query(query)
+
+
+def test_error_message():
+    """Tests if syntax errors describe where they occurred."""
+    with pytest.raises(QuerySyntaxException, match="found 'hoeren' \\(line 2, column 5\\)"):
+        compile_query("studenten\n    hoeren")
+    with pytest.raises(QuerySyntaxException, match="Unexpected character ';' \\(line 1, column 10\\)"):
+        compile_query("studenten;")
+
+
+def test_tokenize():
+    """Tests if the tokens are split like by the grammar."""
+    tokens = tokenize('sigma s.MatrNr>=-1.5 AND Name = " x "  ')
+
+    assert [(token.kind, token.text) for token in tokens] == [
+        ("name", "sigma"), ("name", "s.MatrNr"), ("operator", ">="), ("operator", "-"), ("float", "1.5"),
+        ("name", "AND"), ("name", "Name"), ("operator", "="), ("varchar", '" x "'), ("end", "")]
+    assert tokens[5].keyword == "and"
+    assert tokens[5].position == 21
@@ -126,12 +126,31 @@ def test_main_no_query_file():
     assert "Welcome to Mosaic" in result.output
 
 
-def test_main_query_file():
+def test_main_query_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
     runner = CliRunner()
     result = runner.invoke(cli.main, ["--data-directory", "./tests/testdata/", "--query-file",
                                       "./tests/mosaic/testqueries/valid_query.mql"])
     assert "MatrNr" in result.output
     assert "studenten" in result.output
+    # snapshots are only written to an explicitly given cache directory
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_main_query_file_rebuild_cache(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--data-directory", "./tests/testdata/", "--cache-directory", str(tmp_path),
+                                      "--rebuild-cache", "--query-file", "./tests/mosaic/testqueries/valid_query.mql"])
+    assert "MatrNr" in result.output
+    assert len(list(tmp_path.iterdir())) == 9
+
+
+def test_main_query_file_lazy():
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["--data-directory", "./tests/testdata/", "--lazy", "--memory-limit", "1",
+                                      "--query-file", "./tests/mosaic/testqueries/valid_query.mql"])
+    assert "MatrNr" in result.output
+    assert isinstance(table_service.retrieve_table("studenten"), table_service.LazyTable)
 
 
 def test_main_optimize():
@@ -0,0 +1,107 @@
+import pytest
+from mosaic import table_service
+from mosaic.compiler import cost_model
+from mosaic.compiler.operators.abstract_join import JoinType
+from mosaic.compiler.operators.hash_join import HashJoin
+from mosaic.compiler.operators.nested_loops_join import NestedLoopsJoin
+from mosaic.compiler.operators.projection import Projection
+from mosaic.compiler.operators.selection import Selection
+from mosaic.compiler.operators.table_scan import TableScan
+from mosaic.compiler.operators.set_operators import Union
+from mosaic.compiler.expressions.column_expression import ColumnExpression
+from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator
+from mosaic.compiler.expressions.conjunctive_expression import ConjunctiveExpression
+from mosaic.compiler.expressions.disjunctive_expression import DisjunctiveExpression
+from mosaic.compiler.expressions.literal_expression import LiteralExpression
+from mosaic.compiler.expressions.parameter_expression import ParameterExpression, QueryParameters
+
+
+@pytest.fixture(autouse=True)
+def refresh_loaded_tables():
+    table_service.load_tables_from_directory("./tests/testdata/")
+
+
+def _compare(column, operator, value):
+    return ComparativeExpression(ColumnExpression(column), operator, LiteralExpression(value))
+
+
+def test_estimate_num_records_table_scan():
+    assert cost_model.estimate_num_records(TableScan("hoeren")) == 10
+    assert cost_model.estimate_num_records(Projection(TableScan("hoeren"), [(None, ColumnExpression("MatrNr"))])) \
+           == 10
+    assert cost_model.estimate_num_records(Union(TableScan("hoeren"), TableScan("hoeren"))) == 20
+
+
+def test_estimate_num_records_selection():
+    assert cost_model.estimate_num_records(
+        Selection(TableScan("hoeren"), _compare("MatrNr", ComparativeOperator.EQUAL, 28106))) == 4
+    assert cost_model.estimate_num_records(
+        Selection(TableScan("hoeren"), _compare("MatrNr", ComparativeOperator.EQUAL, 1))) == 0
+    assert cost_model.estimate_num_records(
+        Selection(TableScan("hoeren"), _compare("MatrNr", ComparativeOperator.NOT_EQUAL, 28106))) == 6
+    assert cost_model.estimate_num_records(
+        Selection(TableScan("hoeren"), _compare("hoeren.MatrNr", ComparativeOperator.GREATER, 30000))) == 0
+    assert cost_model.estimate_num_records(
+        Selection(TableScan("hoeren"), ComparativeExpression(LiteralExpression(30000), ComparativeOperator.SMALLER,
+                                                             ColumnExpression("MatrNr")))) == 0
+    assert cost_model.estimate_num_records(
+        Selection(TableScan("hoeren"), _compare("MatrNr", ComparativeOperator.SMALLER_EQUAL, 30000))) == 10
+
+    conjunction = ConjunctiveExpression([_compare("MatrNr", ComparativeOperator.EQUAL, 28106),
+                                         _compare("VorlNr", ComparativeOperator.EQUAL, 5001)])
+    assert cost_model.estimate_num_records(Selection(TableScan("hoeren"), conjunction)) == pytest.approx(1.2)
+    disjunction = DisjunctiveExpression([_compare("MatrNr", ComparativeOperator.EQUAL, 28106),
+                                         _compare("MatrNr", ComparativeOperator.EQUAL, 29120)])
+    assert cost_model.estimate_num_records(Selection(TableScan("hoeren"), disjunction)) == pytest.approx(5.8)
+
+
+def test_estimate_num_records_unknown_selectivity():
+    selection = Selection(TableScan("hoeren"), _compare("MatrNr", ComparativeOperator.EQUAL, "x"))
+    assert cost_model.estimate_num_records(selection) == 0
+
+    projection = Projection(TableScan("hoeren"), [("m", ColumnExpression("MatrNr"))])
+    selection = Selection(projection, _compare("m", ComparativeOperator.GREATER, 1))
+    assert cost_model.estimate_num_records(selection) == pytest.approx(10 * cost_model.DEFAULT_SELECTIVITY)
+
+
+def test_estimate_num_records_parameter():
+    parameter = ParameterExpression(0, QueryParameters())
+
+    # the value of the parameter is unknown, so the average number of records per value (10 / 4) is assumed
+    selection = Selection(TableScan("hoeren"),
+                          ComparativeExpression(ColumnExpression("MatrNr"), ComparativeOperator.EQUAL, parameter))
+    assert cost_model.estimate_num_records(selection) == pytest.approx(2.5)
+
+    selection = Selection(TableScan("hoeren"),
+                          ComparativeExpression(parameter, ComparativeOperator.NOT_EQUAL, ColumnExpression("MatrNr")))
+    assert cost_model.estimate_num_records(selection) == pytest.approx(7.5)
+
+
+def test_estimate_num_records_join():
+    condition = ComparativeExpression(ColumnExpression("hoeren.MatrNr"), ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    join = NestedLoopsJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER, condition, False)
+    assert cost_model.estimate_num_records(join) == 10
+
+    join = NestedLoopsJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.CROSS, None, False)
+    assert cost_model.estimate_num_records(join) == 80
+
+    selection = Selection(TableScan("studenten"), _compare("MatrNr", ComparativeOperator.EQUAL, 1))
+    join = NestedLoopsJoin(TableScan("hoeren"), selection, JoinType.LEFT_OUTER, condition, False)
+    assert cost_model.estimate_num_records(join) == 10
+
+
+def test_estimate_join_cost():
+    condition = ComparativeExpression(ColumnExpression("hoeren.MatrNr"), ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    nested_loops_join = NestedLoopsJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER, condition,
+                                        False)
+    hash_join = HashJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER, condition, False)
+    hash_join_build_right = HashJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER, condition, False,
+                                     build_right=True)
+
+    costs = [cost_model.estimate_join_cost(join, 1000, 10, 10)
+             for join in (nested_loops_join, hash_join, hash_join_build_right)]
+    assert costs[2] < costs[1] < costs[0]
+    assert cost_model.estimate_join_cost(hash_join, 10, 1000, 10) < \
+           cost_model.estimate_join_cost(hash_join_build_right, 10, 1000, 10)
@@ -1,19 +1,27 @@
+from copy import deepcopy
 from mosaic.compiler.operators.explain import Explain
 import pytest
 from mosaic import table_service
 from mosaic.compiler.operators.index_seek import IndexSeek
+from mosaic.compiler.operators.index_range_seek import IndexRangeSeek
 from mosaic.table_service import Schema
 from mosaic.compiler.operators.selection import Selection
 from mosaic.compiler.operators.projection import Projection
 from mosaic.compiler.operators.table_scan import TableScan
 from mosaic.compiler.operators.abstract_join import JoinType
 from mosaic.compiler.operators.hash_join import HashJoin
-from mosaic.compiler.operators.set_operators import Union
+from mosaic.compiler.operators.nested_loops_join import NestedLoopsJoin
+from mosaic.compiler.operators.merge_join import MergeJoin
+from mosaic.compiler.operators.set_operators import Union, Intersect, Except
+from mosaic.compiler.operators.hash_set_operators import HashIntersect, HashExcept
 from mosaic.compiler.operators.hash_distinct import HashDistinct
+from mosaic.compiler.operators.sort_distinct import SortDistinct
 from mosaic.compiler.operators.ordering import Ordering
+from mosaic.compiler.operators.hash_aggregate import HashAggregate, AggregateFunction
 from mosaic.compiler.expressions.conjunctive_expression import ConjunctiveExpression
 from mosaic.compiler.expressions.column_expression import ColumnExpression
 from mosaic.compiler.expressions.literal_expression import LiteralExpression
+from mosaic.compiler.expressions.parameter_expression import ParameterExpression, QueryParameters
 from mosaic.compiler.expressions.comparative_expression import ComparativeExpression, ComparativeOperator
 from mosaic.compiler.expressions.arithmetic_expression import ArithmeticExpression, \
     ArithmeticOperator
@@ -562,6 +570,87 @@ def test_optimizer_apply_index_seek_multiple_selections_over_table_scan_choose_m
     assert isinstance(index_seek.condition, ComparativeExpression)
 
 
+def test_optimizer_apply_index_range_seek(tmp_path):
+    table_file = tmp_path / "orderedIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Indices]\nMatrNr: ordered\nVorlNr: ordered\n\n"
+                          "[Data]\n28106;5041\n26120;5001\n27550;5001\n27550;4052\n29120;5049\n")
+    table_service.load_from_file(str(table_file))
+    vorl_nr_condition = ComparativeExpression(ColumnExpression("o.VorlNr"), ComparativeOperator.SMALLER,
+                                              LiteralExpression(5049))
+    node = Selection(Selection(Selection(Selection(
+        TableScan("orderedIndex", alias="o"),
+        ComparativeExpression(ColumnExpression("o.MatrNr"), ComparativeOperator.SMALLER, LiteralExpression(29120))),
+        ComparativeExpression(ColumnExpression("o.MatrNr"), ComparativeOperator.NOT_EQUAL, LiteralExpression(1))),
+        ComparativeExpression(LiteralExpression(26120), ComparativeOperator.SMALLER, ColumnExpression("MatrNr"))),
+        vorl_nr_condition)
+
+    node = optimizer._node_access_helper(node, optimizer._apply_index_seek, Selection)
+
+    # the range on MatrNr matches fewer records than the one on VorlNr
+    assert isinstance(node, Selection)
+    assert node.condition is vorl_nr_condition
+    assert isinstance(node.node, Selection)
+    assert node.node.condition.operator == ComparativeOperator.NOT_EQUAL
+    index_range_seek = node.node.node
+    assert isinstance(index_range_seek, IndexRangeSeek)
+    assert index_range_seek.index_column == "MatrNr"
+    assert index_range_seek.alias == "o"
+    assert list(node.get_records()) == [[27550, 5001], [27550, 4052], [28106, 5041]]
+    assert optimizer._get_sorted_column_indices(node) == [0]
+
+
+def test_optimizer_apply_composite_index_seek(tmp_path):
+    table_file = tmp_path / "compositeIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Indices]\nMatrNr\nMatrNr,VorlNr\n\n"
+                          "[Data]\n28106;5041\n26120;5001\n27550;5001\n27550;4052\n")
+    table_service.load_from_file(str(table_file))
+    range_condition = ComparativeExpression(ColumnExpression("MatrNr"), ComparativeOperator.GREATER,
+                                               LiteralExpression(0))
+    node = Selection(Selection(Selection(
+        TableScan("compositeIndex"),
+        ComparativeExpression(ColumnExpression("VorlNr"), ComparativeOperator.EQUAL, LiteralExpression(5001))),
+        range_condition),
+        ComparativeExpression(ColumnExpression("MatrNr"), ComparativeOperator.EQUAL, LiteralExpression(27550)))
+
+    node = optimizer._node_access_helper(node, optimizer._apply_index_seek, Selection)
+
+    assert isinstance(node, Selection)
+    assert node.condition is range_condition
+    assert isinstance(node.node, IndexSeek)
+    assert node.node.index_column == "MatrNr,VorlNr"
+    assert node.node.comparison_value == (27550, 5001)
+    assert list(node.get_records()) == [[27550, 5001]]
+
+
+def test_optimizer_apply_index_seek_parameters(tmp_path):
+    table_file = tmp_path / "compositeIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Indices]\nMatrNr,VorlNr\n\n"
+                          "[Data]\n28106;5041\n26120;5001\n27550;5001\n27550;4052\n")
+    table_service.load_from_file(str(table_file))
+    parameters = QueryParameters()
+    node = Selection(Selection(
+        TableScan("compositeIndex"),
+        ComparativeExpression(ColumnExpression("VorlNr"), ComparativeOperator.EQUAL,
+                              ParameterExpression("vorlnr", parameters))),
+        ComparativeExpression(ParameterExpression(0, parameters), ComparativeOperator.EQUAL,
+                              ColumnExpression("MatrNr")))
+    parameters.add_positional()
+    parameters.add_named("vorlnr")
+
+    node = optimizer._node_access_helper(node, optimizer._apply_index_seek, Selection)
+
+    assert isinstance(node, IndexSeek)
+    assert node.has_parameters()
+
+    # the same index seek is executed with the values of every binding
+    parameters.bind([27550], {"vorlnr": 5001})
+    assert list(node.get_records()) == [[27550, 5001]]
+    parameters.bind([27550], {"vorlnr": 4052})
+    assert list(node.get_records()) == [[27550, 4052]]
+    parameters.bind([26120], {"vorlnr": 4052})
+    assert list(node.get_records()) == []
+
+
 def test_choose_optimal_index_seek():
     target_condition = ComparativeExpression(LiteralExpression(26120), ComparativeOperator.EQUAL,
                                              ColumnExpression("MatrNr"))
@@ -600,3 +689,267 @@ def test_choose_optimal_index_seek_mirror():
     assert len(index_seek.get_result()) == 1
     assert len(index_seek.get_result()) < len(table_service.retrieve_index("correctIndex", "MatrNr")[27550])
     assert index_seek.condition == target_condition
+
+
+def test_optimizer_select_hash_set_operators():
+    execution_plan = Projection(
+        Intersect(
+            Except(TableScan("vorlesungen"), TableScan("vorlesungen")),
+            TableScan("vorlesungen")),
+        [(None, ColumnExpression("VorlNr"))])
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    assert isinstance(execution_plan.node, HashIntersect)
+    assert not execution_plan.node.is_set_semantics
+    assert isinstance(execution_plan.node.left_node, HashExcept)
+    assert not execution_plan.node.left_node.is_set_semantics
+
+
+def test_optimizer_hash_set_operators_set_semantics_below_distinct():
+    execution_plan = HashDistinct(Projection(
+        Except(TableScan("vorlesungen"), TableScan("vorlesungen")),
+        [(None, ColumnExpression("VorlNr"))]))
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    assert isinstance(execution_plan.node.node, HashExcept)
+    assert execution_plan.node.node.is_set_semantics
+
+
+def test_optimizer_sort_distinct_for_sorted_input():
+    execution_plan = HashDistinct(Projection(
+        Ordering(TableScan("hoeren"), [ColumnExpression("VorlNr")]),
+        [(None, ColumnExpression("VorlNr"))]))
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    assert isinstance(execution_plan, SortDistinct)
+
+
+def test_optimizer_hash_distinct_for_partially_sorted_input():
+    execution_plan = HashDistinct(Projection(
+        Ordering(TableScan("hoeren"), [ColumnExpression("VorlNr")]),
+        [(None, ColumnExpression("MatrNr")), (None, ColumnExpression("VorlNr"))]))
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    assert isinstance(execution_plan, HashDistinct)
+
+
+def test_optimizer_select_hash_join_build_side():
+    condition = ComparativeExpression(ColumnExpression("hoeren.MatrNr"), ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    selection = Selection(TableScan("studenten"), ComparativeExpression(
+        ColumnExpression("Semester"), ComparativeOperator.GREATER, LiteralExpression(10)))
+
+    join = optimizer.optimize(NestedLoopsJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER,
+                                              condition, False))
+    assert isinstance(join, HashJoin) and join.build_right
+    join = optimizer.optimize(NestedLoopsJoin(selection, TableScan("hoeren"), JoinType.INNER, condition, False))
+    assert isinstance(join, HashJoin) and not join.build_right
+    assert join.estimated_cost is not None
+    assert f"cost={round(join.estimated_cost)}" in str(join)
+
+
+def test_optimizer_select_merge_join():
+    condition = ComparativeExpression(ColumnExpression("hoeren.MatrNr"), ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    join = NestedLoopsJoin(Ordering(TableScan("hoeren"), [ColumnExpression("hoeren.MatrNr")]),
+                           Ordering(TableScan("studenten"), [ColumnExpression("studenten.MatrNr")]),
+                           JoinType.INNER, condition, False)
+    expected = sorted(join.get_result().records)
+
+    join = optimizer.optimize(join)
+    assert isinstance(join, MergeJoin)
+    assert sorted(join.get_result().records) == expected
+
+
+def test_optimizer_keep_nested_loops_join_for_theta_condition():
+    condition = ComparativeExpression(ColumnExpression("studenten.Semester"), ComparativeOperator.SMALLER,
+                                      ColumnExpression("vorlesungen.SWS"))
+    join = optimizer.optimize(NestedLoopsJoin(TableScan("studenten"), TableScan("vorlesungen"), JoinType.INNER,
+                                              condition, False))
+    assert type(join) is NestedLoopsJoin
+    assert join.estimated_num_records is not None
+
+
+def _load_join_order_tables(tmp_path):
+    tables = {
+        "big1": "[Schema]\nA: int\nB: int\n\n[Data]\n" + "".join(f"{i};{i % 5}\n" for i in range(50)),
+        "big2": "[Schema]\nB: int\nC: int\n\n[Data]\n" + "".join(f"{i};{i}\n" for i in range(50)),
+        "tiny": "[Schema]\nC: int\nD: int\n\n[Data]\n3;1\n",
+    }
+    for table_name, content in tables.items():
+        table_file = tmp_path / f"{table_name}.table"
+        table_file.write_text(content)
+        table_service.load_from_file(str(table_file))
+
+
+def _build_join_chain():
+    return NestedLoopsJoin(
+        NestedLoopsJoin(TableScan("big1"), TableScan("big2"), JoinType.INNER, ComparativeExpression(
+            ColumnExpression("big1.B"), ComparativeOperator.EQUAL, ColumnExpression("big2.B")), False),
+        TableScan("tiny"), JoinType.INNER, ComparativeExpression(
+            ColumnExpression("big2.C"), ComparativeOperator.EQUAL, ColumnExpression("tiny.C")), False)
+
+
+def test_optimizer_reorder_joins(tmp_path):
+    _load_join_order_tables(tmp_path)
+    expected = _build_join_chain().get_result()
+
+    execution_plan = optimizer.optimize(_build_join_chain())
+
+    # big2 is joined with tiny first, which keeps the order of the columns
+    assert isinstance(execution_plan, HashJoin)
+    assert execution_plan.left_node.table_name == "big1"
+    assert isinstance(execution_plan.right_node, HashJoin)
+    assert execution_plan.right_node.left_node.table_name == "big2"
+    assert execution_plan.right_node.right_node.table_name == "tiny"
+    result = execution_plan.get_result()
+    assert result.schema.table_name == expected.schema.table_name
+    assert result.schema.column_names == expected.schema.column_names
+    assert sorted(result.records) == sorted(expected.records)
+
+
+def test_optimizer_reorder_joins_greedy(tmp_path, monkeypatch):
+    _load_join_order_tables(tmp_path)
+    monkeypatch.setattr(optimizer, "MAX_DYNAMIC_PROGRAMMING_RELATIONS", 2)
+
+    expected = _build_join_chain().get_result()
+
+    execution_plan = optimizer.optimize(_build_join_chain())
+
+    assert isinstance(execution_plan, HashJoin)
+    assert execution_plan.left_node.table_name == "big1"
+    assert execution_plan.right_node.right_node.table_name == "tiny"
+    assert sorted(execution_plan.get_result().records) == sorted(expected.records)
+
+
+def test_optimizer_reorder_joins_selection_over_cross_joins(tmp_path):
+    _load_join_order_tables(tmp_path)
+    selection = Selection(
+        NestedLoopsJoin(NestedLoopsJoin(TableScan("big1"), TableScan("big2"), JoinType.CROSS, None, False),
+                        TableScan("tiny"), JoinType.CROSS, None, False),
+        ConjunctiveExpression([
+            ComparativeExpression(ColumnExpression("big1.B"), ComparativeOperator.EQUAL, ColumnExpression("big2.B")),
+            ComparativeExpression(ColumnExpression("big2.C"), ComparativeOperator.EQUAL, ColumnExpression("tiny.C")),
+            ComparativeExpression(ColumnExpression("big1.A"), ComparativeOperator.GREATER, LiteralExpression(40))]))
+    expected = deepcopy(selection).get_result()
+
+    execution_plan = optimizer.optimize(selection)
+
+    # the conditions of the selection become join conditions, no projection is needed as the column order is kept
+    assert isinstance(execution_plan, HashJoin)
+    assert isinstance(execution_plan.left_node, Selection)
+    assert execution_plan.left_node.node.table_name == "big1"
+    assert isinstance(execution_plan.right_node, HashJoin)
+    result = execution_plan.get_result()
+    assert result.schema.column_names == expected.schema.column_names
+    assert sorted(result.records) == sorted(expected.records) == [[43, 3, 3, 3, 3, 1], [48, 3, 3, 3, 3, 1]]
+
+
+def test_optimizer_do_not_reorder_left_outer_join(tmp_path):
+    _load_join_order_tables(tmp_path)
+    join = NestedLoopsJoin(
+        NestedLoopsJoin(TableScan("big1"), TableScan("big2"), JoinType.LEFT_OUTER, ComparativeExpression(
+            ColumnExpression("big1.B"), ComparativeOperator.EQUAL, ColumnExpression("big2.B")), False),
+        TableScan("tiny"), JoinType.INNER, ComparativeExpression(
+            ColumnExpression("big2.C"), ComparativeOperator.EQUAL, ColumnExpression("tiny.C")), False)
+
+    execution_plan = optimizer.optimize(join)
+
+    assert isinstance(execution_plan, HashJoin)
+    assert execution_plan.left_node.join_type == JoinType.LEFT_OUTER
+    assert execution_plan.right_node.table_name == "tiny"
+
+
+def test_optimizer_prune_join_columns():
+    condition = ComparativeExpression(ColumnExpression("hoeren.MatrNr"), ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    execution_plan = Projection(NestedLoopsJoin(TableScan("hoeren"), TableScan("studenten"), JoinType.INNER,
+                                                condition, False), [(None, ColumnExpression("Name"))])
+    expected = deepcopy(execution_plan).get_result()
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    # the join only gets the join columns and the projected column of its inputs
+    join = execution_plan.node
+    assert isinstance(join.left_node, Projection)
+    assert join.left_node.get_schema().column_names == ["hoeren.MatrNr"]
+    assert isinstance(join.right_node, Projection)
+    assert join.right_node.get_schema().column_names == ["studenten.MatrNr", "studenten.Name"]
+    assert execution_plan.get_result().schema.column_names == expected.schema.column_names
+    assert len(expected.records) > 0
+    assert sorted(execution_plan.get_result().records) == sorted(expected.records)
+
+
+def test_optimizer_prune_columns_natural_join_below_aggregate():
+    execution_plan = HashAggregate(
+        NestedLoopsJoin(TableScan("studenten"), TableScan("hoeren"), JoinType.INNER, None, True),
+        [(None, ColumnExpression("Semester"))], [("c", AggregateFunction.COUNT, ColumnExpression("VorlNr"))])
+    expected = deepcopy(execution_plan).get_result()
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    assert execution_plan.node.left_node.get_schema().column_names == ["studenten.MatrNr", "studenten.Semester"]
+    assert isinstance(execution_plan.node.right_node, TableScan)
+    assert sorted(execution_plan.get_result().records) == sorted(expected.records)
+
+
+def test_optimizer_do_not_prune_columns_below_distinct():
+    execution_plan = HashDistinct(Projection(
+        Intersect(TableScan("studenten"), TableScan("studenten")), [(None, ColumnExpression("Semester"))]))
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    set_operator = execution_plan.node.node
+    assert isinstance(set_operator.left_node, TableScan)
+    assert isinstance(set_operator.right_node, TableScan)
+
+
+def test_optimizer_prune_merge_join_columns():
+    condition = ComparativeExpression(ColumnExpression("hoeren.MatrNr"), ComparativeOperator.EQUAL,
+                                      ColumnExpression("studenten.MatrNr"))
+    execution_plan = Projection(NestedLoopsJoin(
+        Ordering(TableScan("hoeren"), [ColumnExpression("hoeren.MatrNr")]),
+        Ordering(TableScan("studenten"), [ColumnExpression("studenten.MatrNr")]),
+        JoinType.INNER, condition, False), [(None, ColumnExpression("VorlNr")), (None, ColumnExpression("Name"))])
+    expected = deepcopy(execution_plan).get_result()
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    assert isinstance(execution_plan.node, MergeJoin)
+    assert execution_plan.node.right_node.get_schema().column_names == ["studenten.MatrNr", "studenten.Name"]
+    assert sorted(execution_plan.get_result().records) == sorted(expected.records)
+
+
+def test_optimizer_merge_renaming_projection():
+    renaming_projection = Projection(TableScan("studenten"), [
+        ("Nummer", ColumnExpression("MatrNr")), (None, ColumnExpression("Semester")),
+        (None, ColumnExpression("studenten.Name"))], "s")
+    execution_plan = Projection(renaming_projection, [
+        (None, ColumnExpression("Name")), (None, ColumnExpression("Nummer")),
+        ("Doppelt", ArithmeticExpression(ColumnExpression("Semester"), ArithmeticOperator.TIMES,
+                                         LiteralExpression(2)))])
+    expected = deepcopy(execution_plan).get_result()
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    # the records are only copied by one projection, which keeps the names of the renamed columns
+    assert isinstance(execution_plan, Projection)
+    assert isinstance(execution_plan.node, TableScan)
+    result = execution_plan.get_result()
+    assert result.schema.table_name == expected.schema.table_name == "s"
+    assert result.schema.column_names == expected.schema.column_names == ["studenten.Name", "Nummer", "Doppelt"]
+    assert result.records == expected.records
+
+
+def test_optimizer_do_not_merge_computing_projection():
+    execution_plan = Projection(Projection(TableScan("studenten"), [("Eins", LiteralExpression(1))]),
+                                [(None, ColumnExpression("Eins"))])
+
+    execution_plan = optimizer.optimize(execution_plan)
+
+    assert isinstance(execution_plan.node, Projection)
+    assert all(record == [1] for record in execution_plan.get_result().records)
@@ -38,7 +38,7 @@ def test_optimizer_selection_push_down_projection():
 def test_optimizer_selection_push_down_cross_join():
     query = "sigma Name = \"Sokrates\" (hoeren cross join studenten);"
     result = _execute_query(f"explain {query}")
-    assert result[0][0] == "-->NestedLoopsJoin(cross, natural=True, condition=None)"
+    assert result[0][0] == "-->NestedLoopsJoin(cross, natural=True, condition=None, estimated_records=10, cost=30)"
     assert result[1][0] == "---->TableScan(hoeren)"
     assert result[2][0] == "---->Selection(condition=(studenten.Name = \"Sokrates\"))"
     assert result[3][0] == "------>TableScan(studenten)"
@@ -75,12 +75,15 @@ def test_optimizer_selection_push_down_complex():
     assert result[1][0] == "---->Selection(condition=(test = \"test\"))"
     assert result[2][
                0] == "------>Projection(columns=[hoeren.MatrNr=hoeren.MatrNr, n=professoren.Name, vnr=hoeren.VorlNr, professoren.Raum=professoren.Raum, test=\"test\"])"
-    assert result[3][0] == "-------->NestedLoopsJoin(cross, natural=True, condition=None)"
+    assert result[3][0] == "-------->NestedLoopsJoin(cross, natural=True, condition=None, estimated_records=10, cost=30)"
     assert result[4][0] == "---------->Selection(condition=(hoeren.MatrNr > 26120))"
     assert result[5][0] == "------------>TableScan(hoeren)"
-    assert result[6][
-               0] == "---------->Selection(condition=((professoren.Raum != \"10\") AND (professoren.Name = \"Sokrates\")))"
-    assert result[7][0] == "------------>TableScan(professoren)"
+    # only the columns of professoren that are used by the projection are joined
+    assert result[6][0] == "---------->Projection(columns=[professoren.Name=professoren.Name, " \
+                           "professoren.Raum=professoren.Raum])"
+    assert result[7][
+               0] == "------------>Selection(condition=((professoren.Raum != \"10\") AND (professoren.Name = \"Sokrates\")))"
+    assert result[8][0] == "-------------->TableScan(professoren)"
 
     _check_query_result_same_optimization(query)
 
@@ -91,16 +94,22 @@ def test_optimizer_selection_push_through_projection_fqn():
     assert result[0][0] == "-->Projection(columns=[professoren.Name=professoren.Name])"
     assert result[1][
                0] == "---->Projection(columns=[professoren.Name=professoren.Name, professoren.Rang=professoren.Rang])"
-    assert result[2][0] == "------>NestedLoopsJoin(cross, natural=True, condition=None)"
-    assert result[3][0] == '-------->Selection(condition=(professoren.Name > "K"))'
-    assert result[4][0] == "---------->TableScan(professoren)"
-    assert result[5][0] == "-------->TableScan(assistenten)"
+    assert result[2][0] == "------>NestedLoopsJoin(cross, natural=True, condition=None, estimated_records=14, cost=42)"
+    assert result[3][
+               0] == "-------->Projection(columns=[professoren.Name=professoren.Name, professoren.Rang=professoren.Rang])"
+    assert result[4][0] == '---------->Selection(condition=(professoren.Name > "K"))'
+    assert result[5][0] == "------------>TableScan(professoren)"
+    # no column of assistenten is required, the projection keeps its first column
+    assert result[6][0] == "-------->Projection(columns=[assistenten.PersNr=assistenten.PersNr])"
+    assert result[7][0] == "---------->TableScan(assistenten)"
 
 
 def test_optimizer_replaces_nested_loop_join_with_hash_join():
     query = "hoeren join hoeren.MatrNr = studenten.MatrNr studenten;"
     result = _execute_query(f"explain {query}")
-    assert result[0][0] == "-->HashJoin(inner, natural=False, condition=(hoeren.MatrNr = studenten.MatrNr))"
+    # the hash table is built over the smaller relation
+    assert result[0][0] == "-->HashJoin(inner, natural=False, condition=(hoeren.MatrNr = studenten.MatrNr), build=right, " \
+                           "estimated_records=10, cost=36)"
     assert result[1][0] == "---->TableScan(hoeren)"
     assert result[2][0] == "---->TableScan(studenten)"
 
@@ -110,7 +119,8 @@ def test_optimizer_replaces_nested_loop_join_with_hash_join():
 def test_optimizer_hash_join_replace_not_allowed():
     query = "studenten join Semester < SWS vorlesungen;"
     result = _execute_query(f"explain {query}")
-    assert result[0][0] == "-->NestedLoopsJoin(inner, natural=False, condition=(studenten.Semester < vorlesungen.SWS))"
+    assert result[0][0] == "-->NestedLoopsJoin(inner, natural=False, condition=(studenten.Semester < vorlesungen.SWS), " \
+                           "estimated_records=27, cost=187)"
     assert result[1][0] == "---->TableScan(studenten)"
     assert result[2][0] == "---->TableScan(vorlesungen)"
 
@@ -55,3 +55,139 @@ def test_execute_query_file(optimized):
 def test_execute_bad_query_file(path):
     with pytest.raises(cli.CliErrorMessageException):
         query_executor.execute_query_file(path)
+
+
+@pytest.fixture
+def compiled_queries(monkeypatch):
+    compiled_queries = []
+    compile_query = query_executor.parser.compile_query
+
+    def counting_compile(query):
+        compiled_queries.append(query)
+        return compile_query(query)
+
+    monkeypatch.setattr(query_executor.parser, "compile_query", counting_compile)
+    return compiled_queries
+
+
+@pytest.mark.parametrize(
+    'optimized',
+    [False, True],
+)
+def test_execute_query_plan_cache(compiled_queries, optimized):
+    result = query_executor.execute_query('sigma Name = "Schopen  hauer" (pi Name studenten);', optimized)
+    cached_result = query_executor.execute_query('sigma  Name = "Schopen  hauer"\n(pi Name studenten) ;', optimized)
+
+    # the second query only differs in its formatting and reuses the execution plan
+    assert len(compiled_queries) == 1
+    assert cached_result[0][0].records == result[0][0].records
+
+    query_executor.execute_query('sigma Name = "Schopen hauer" (pi Name studenten);', optimized)
+    query_executor.execute_query('sigma Name = "Schopen  hauer" (pi Name studenten);', not optimized)
+    assert len(compiled_queries) == 3
+
+
+def test_execute_query_plan_cache_size(compiled_queries, monkeypatch):
+    monkeypatch.setattr(query_executor, "PLAN_CACHE_SIZE", 2)
+
+    for query in ["studenten;", "hoeren;", "studenten;", "vorlesungen;", "studenten;", "hoeren;"]:
+        query_executor.execute_query(query)
+
+    # the least recently used execution plan of hoeren is dropped for vorlesungen
+    assert compiled_queries == ["studenten", "hoeren", "vorlesungen", "hoeren"]
+
+
+def test_execute_query_plan_cache_invalidated_by_loading(compiled_queries, tmp_path):
+    query = "sigma MatrNr > 0 t;"
+    for num_records in (1, 2):
+        (tmp_path / "t.table").write_text("[Schema]\nMatrNr: int\n\n[Indices]\nMatrNr\n\n[Data]\n" +
+                                          "".join(f"{i + 1}\n" for i in range(num_records)))
+        table_service.load_tables_from_directory(str(tmp_path))
+
+        assert len(query_executor.execute_query(query, True)[0][0].records) == num_records
+
+    assert len(compiled_queries) == 2
+
+
+def _load_indexed_table(tmp_path, num_records):
+    (tmp_path / "t.table").write_text("[Schema]\nId: int\nGroupId: int\n\n[Indices]\nId\n\n[Data]\n" +
+                                      "".join(f"{i + 1};{i % 3}\n" for i in range(num_records)))
+    table_service.load_tables_from_directory(str(tmp_path))
+
+
+@pytest.mark.parametrize(
+    'optimized',
+    [False, True],
+)
+def test_prepare_query(compiled_queries, tmp_path, optimized):
+    _load_indexed_table(tmp_path, 10)
+    prepared_query = query_executor.prepare_query("sigma Id = ? t;", optimized)
+
+    for key in (1, 7, 11):
+        result, execution_time = prepared_query.execute(key)
+        assert result.records == ([[key, (key - 1) % 3]] if key <= 10 else [])
+        assert execution_time >= 0
+
+    # the query is only compiled once, the values are bound into its execution plan
+    assert len(compiled_queries) == 1
+
+    if optimized:
+        rows = []
+        prepared_query._execution_plan.explain(rows, 0)
+        assert rows == [[">IndexSeek(t_Id, condition=(t.Id = ?))"]]
+
+
+def test_prepare_query_same_text(tmp_path):
+    _load_indexed_table(tmp_path, 10)
+    first_query = query_executor.prepare_query("sigma Id = ? t", True)
+    second_query = query_executor.prepare_query("sigma Id = ? t", True)
+
+    # the records of the first query are produced while the second query is executed
+    first_query.execute(3)
+    first_records = first_query._execution_plan.get_records()
+    assert second_query.execute(5)[0].records == [[5, 1]]
+    assert list(first_records) == [[3, 2]]
+    assert first_query.execute(4)[0].records == [[4, 0]]
+    assert second_query.execute(6)[0].records == [[6, 2]]
+
+
+def test_prepare_query_named_parameters(tmp_path):
+    _load_indexed_table(tmp_path, 10)
+    prepared_query = query_executor.prepare_query("sigma GroupId = :group and Id > :id or Id = :id t", True)
+
+    assert prepared_query.execute(group=1, id=5)[0].records == [[5, 1], [8, 1]]
+    assert prepared_query.execute(group=0, id=2)[0].records == [[2, 1], [4, 0], [7, 0], [10, 0]]
+
+
+def test_prepare_query_reprepared_after_loading(compiled_queries, tmp_path):
+    _load_indexed_table(tmp_path, 10)
+    prepared_query = query_executor.prepare_query("sigma Id = ? t", True)
+    assert prepared_query.execute(12)[0].records == []
+
+    _load_indexed_table(tmp_path, 20)
+    assert prepared_query.execute(12)[0].records == [[12, 2]]
+    assert len(compiled_queries) == 2
+
+
+def test_prepare_query_errors(tmp_path):
+    _load_indexed_table(tmp_path, 10)
+    prepared_query = query_executor.prepare_query("sigma Id = ? and GroupId = :group t", True)
+
+    with pytest.raises(cli.CliErrorMessageException):
+        prepared_query.execute(group=1)
+    with pytest.raises(cli.CliErrorMessageException):
+        prepared_query.execute(1, 2, group=1)
+    with pytest.raises(cli.CliErrorMessageException):
+        prepared_query.execute(1)
+    with pytest.raises(cli.CliErrorMessageException):
+        prepared_query.execute(1, group=1, other=2)
+
+    with pytest.raises(cli.CliErrorMessageException):
+        query_executor.prepare_query("t; t;")
+    with pytest.raises(cli.CliErrorMessageException):
+        query_executor.prepare_query("pi Id as ? t")
+    with pytest.raises(cli.CliErrorMessageException, match="ordering columns"):
+        query_executor.prepare_query("tau Id, ? t")
+    # queries with parameters can only be executed as prepared queries
+    with pytest.raises(cli.CliErrorMessageException):
+        query_executor.execute_query("sigma Id = ? and GroupId = :group t;")
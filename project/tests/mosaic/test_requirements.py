@@ -88,9 +88,6 @@ def test_arithmetic_null_schema():
          ['studenten.MatrNr', 'studenten.Name', 'studenten.Semester', 'hoeren.MatrNr', 'hoeren.VorlNr'], 80),
         (
         'tau Rang professoren;', ['professoren.PersNr', 'professoren.Name', 'professoren.Rang', 'professoren.Raum'], 7),
-        (
-        'explain (pi studenten.MatrNr, Name, Semester, VorlNr sigma studenten.MatrNr = hoeren.MatrNr (studenten cross join hoeren));',
-        ['Operator'], 5),
         ('sigma studenten.MatrNr = hoeren.MatrNr (studenten cross join hoeren);',
          ['studenten.MatrNr', 'studenten.Name', 'studenten.Semester', 'hoeren.MatrNr', 'hoeren.VorlNr'], 10),
         (
@@ -106,6 +103,18 @@ def test_milestone_2_query(query, column_names, result_rows):
     _test_query(query, column_names, result_rows)
 
 
+def test_milestone_2_explain_query():
+    query = 'explain (pi studenten.MatrNr, Name, Semester, VorlNr sigma studenten.MatrNr = hoeren.MatrNr ' \
+            '(studenten cross join hoeren));'
+
+    # the optimizer replaces the selection and the cross join by one join
+    for optimize, result_rows in [(True, 4), (False, 5)]:
+        result, _ = query_executor.execute_query(query, optimize)[0]
+
+        assert result.schema.column_names == ['Operator']
+        assert len(result) == result_rows
+
+
 # Milestone 3 queries
 
 
@@ -156,7 +165,8 @@ def test_milestone_3_query(query, column_names, result_rows):
           ['---->NestedLoopsJoin(inner, natural=False, condition=(professoren.PersNr = vorlesungen.gelesenVon))'],
           ['------>TableScan(professoren)'],
           ['------>TableScan(vorlesungen)']],
-         [['-->HashJoin(inner, natural=False, condition=(professoren.PersNr = vorlesungen.gelesenVon))'],
+         [['-->HashJoin(inner, natural=False, condition=(professoren.PersNr = vorlesungen.gelesenVon), '
+           'estimated_records=0, cost=4)'],
           ['---->Selection(condition=((professoren.Rang = "C3") AND (professoren.Raum > "200")))'],
           ['------>TableScan(professoren)'],
           ['---->Selection(condition=(vorlesungen.SWS = 3))'],
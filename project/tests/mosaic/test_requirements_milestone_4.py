@@ -43,7 +43,8 @@ def _test_query(query, column_names, result_records):
           ['---->NestedLoopsJoin(inner, natural=False, condition=(professoren.PersNr = vorlesungen.gelesenVon))'],
           ['------>TableScan(professoren)'],
           ['------>TableScan(vorlesungen)']],
-         [['-->HashJoin(inner, natural=False, condition=(professoren.PersNr = vorlesungen.gelesenVon))'],
+         [['-->IndexNestedLoopsJoin(inner, natural=False, index=vorlesungen_gelesenVon, '
+           'condition=(professoren.PersNr = vorlesungen.gelesenVon), estimated_records=1, cost=3)'],
           ['---->IndexSeek(professoren_PersNr, condition=(professoren.PersNr = 2126))'],
           ['---->TableScan(vorlesungen)']]),
         ('explain sigma Name = "Fichte" (pi Name professoren union pi Name studenten);',
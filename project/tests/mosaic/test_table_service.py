@@ -8,9 +8,9 @@ def clean_loaded_tables():
 
 
 def test_load_from_file():
-    assert len(table_service._tables) == 3
-    table_service.load_from_file("./tests/testdata/studenten.table")
     assert len(table_service._tables) == 4
+    table_service.load_from_file("./tests/testdata/studenten.table")
+    assert len(table_service._tables) == 5
     table = table_service._tables["studenten"]
     assert table is not None
     assert table.table_name == "studenten"
@@ -22,15 +22,210 @@ def test_load_from_file():
 
 
 def test_load_tables_from_directory():
-    assert len(table_service._tables) == 3
+    assert len(table_service._tables) == 4
     not_loaded = table_service.load_tables_from_directory("./tests/testdata/")
-    # incl. #tables and #columns and #indices
-    assert len(table_service._tables) == 12
+    # incl. #tables and #columns and #indices and #statistics
+    assert len(table_service._tables) == 13
     assert len(not_loaded) == 17
     with pytest.raises(table_service.NoTableLoadedException):
         table_service.load_tables_from_directory("./")
 
 
+@pytest.mark.parametrize('columnar', [False, True])
+def test_load_tables_from_directory_in_parallel(monkeypatch, columnar):
+    not_loaded = table_service.load_tables_from_directory("./tests/testdata/", columnar)
+    tables = {name: list(table.records) for name, table in table_service._tables.items()}
+    indices = {name: {column: dict(index) for column, index in table_indices.items()}
+               for name, table_indices in table_service._indices.items()}
+
+    monkeypatch.setattr(table_service, "PARALLEL_LOADING_MIN_BYTES", 0)
+    table_service.initialize()
+    not_loaded_parallel = table_service.load_tables_from_directory("./tests/testdata/", columnar, max_workers=2)
+
+    assert not_loaded_parallel == not_loaded
+    assert {name: list(table.records) for name, table in table_service._tables.items()} == tables
+    assert {name: {column: dict(index) for column, index in table_indices.items()}
+            for name, table_indices in table_service._indices.items()} == indices
+
+
+def test_load_tables_from_directory_lazy():
+    not_loaded = table_service.load_tables_from_directory("./tests/testdata/")
+    tables = {name: list(table.records) for name, table in table_service._tables.items()}
+    table_names = list(table_service.retrieve_table("#tables").records)
+    indices = list(table_service.retrieve_table("#indices").records)
+
+    table_service.initialize()
+    not_loaded_lazy = table_service.load_tables_from_directory("./tests/testdata/", lazy=True)
+    studenten = table_service._tables["studenten"]
+
+    # errors in the data sections are found as soon as the tables are used
+    assert not_loaded_lazy == [file for file in not_loaded
+                               if file[0] not in ("badValue.table", "wrongNumberColumns.table")]
+    assert isinstance(studenten, table_service.LazyTable) and not studenten.is_loaded()
+    assert table_service.retrieve_schema("studenten") is studenten.schema
+    assert not studenten.is_loaded()
+    assert sorted(table_service.retrieve_table("#tables").records) == \
+           sorted(table_names + [["badValue"], ["wrongNumberColumns"]])
+    assert list(table_service.retrieve_table("#indices").records) == indices
+    assert table_service.index_exists("correctIndex", "MatrNr")
+    assert not table_service._tables["correctIndex"].is_loaded()
+
+    assert table_service.retrieve_index("correctIndex", "MatrNr")[28106] == [[28106, 5041], [28106, 5052],
+                                                                            [28106, 5216], [28106, 5259]]
+    assert list(table_service.retrieve_table("studenten").records) == tables["studenten"]
+    assert studenten.is_loaded()
+    with pytest.raises(table_service.TableParsingException):
+        table_service.retrieve_table("badValue")
+
+
+def test_load_tables_from_directory_lazy_memory_limit():
+    table_service.load_tables_from_directory("./tests/testdata/", columnar=True, lazy=True, memory_limit=0)
+    studenten = table_service.retrieve_table("studenten")
+    records = list(studenten.records)
+
+    table_service.retrieve_index("correctIndex", "MatrNr")
+
+    # the least recently used table gets unloaded, the most recently used one is kept
+    assert not studenten.is_loaded()
+    assert table_service._tables["correctIndex"].is_loaded()
+    assert list(table_service.retrieve_table("studenten").records) == records
+    assert not table_service._tables["correctIndex"].is_loaded()
+    assert len(table_service._indices["correctIndex"]["MatrNr"]) == 0
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_load_tables_from_directory_cached(monkeypatch, tmp_path, columnar):
+    data_directory = tmp_path / "data"
+    cache_directory = str(tmp_path / "cache")
+    data_directory.mkdir()
+    for file in ("studenten.table", "correctIndex.table"):
+        (data_directory / file).write_text(open(f"./tests/testdata/{file}").read())
+
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory)
+    records = list(table_service.retrieve_table("correctIndex").records)
+    parse_table_file = table_service._parse_table_file
+    parsed_files = []
+
+    def _parse_table_file_spy(path, columnar=False):
+        parsed_files.append(path.split("/")[-1])
+        return parse_table_file(path, columnar)
+
+    monkeypatch.setattr(table_service, "_parse_table_file", _parse_table_file_spy)
+    table_service.initialize()
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory)
+
+    assert parsed_files == []
+    assert list(table_service.retrieve_table("correctIndex").records) == records
+    assert table_service.retrieve_index("correctIndex", "MatrNr")[29120] == [[29120, 5001], [29120, 5041],
+                                                                            [29120, 5049]]
+
+    (data_directory / "studenten.table").write_text("[Schema]\nMatrNr: int\n\n[Data]\n1\n")
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory)
+    assert parsed_files == ["studenten.table"]
+    assert list(table_service.retrieve_table("studenten").records) == [[1]]
+
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory,
+                                             rebuild_cache=True)
+    assert sorted(parsed_files) == ["correctIndex.table", "studenten.table", "studenten.table"]
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_load_tables_from_directory_cached_appended(monkeypatch, tmp_path, columnar):
+    data_directory = tmp_path / "data"
+    cache_directory = str(tmp_path / "cache")
+    data_directory.mkdir()
+    table_file = data_directory / "correctIndex.table"
+    table_file.write_text(open("./tests/testdata/correctIndex.table").read())
+    (data_directory / "studenten.table").write_text(open("./tests/testdata/studenten.table").read())
+
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory)
+    records = list(table_service.retrieve_table("correctIndex").records)
+    parse_table_file = table_service._parse_table_file
+    parsed_files = []
+
+    def _parse_table_file_spy(path, columnar=False):
+        parsed_files.append(path.split("/")[-1])
+        return parse_table_file(path, columnar)
+
+    monkeypatch.setattr(table_service, "_parse_table_file", _parse_table_file_spy)
+
+    with open(table_file, "a") as f:
+        f.write("29120;5052\n30000;5001\n")
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory)
+
+    assert parsed_files == []
+    assert list(table_service.retrieve_table("correctIndex").records) == records + [[29120, 5052], [30000, 5001]]
+    assert list(table_service.retrieve_index("correctIndex", "MatrNr")[29120]) == [[29120, 5001], [29120, 5041],
+                                                                                  [29120, 5049], [29120, 5052]]
+    assert list(table_service.retrieve_index("correctIndex", "MatrNr")[30000]) == [[30000, 5001]]
+
+    # the extended snapshot is saved again
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory)
+    assert parsed_files == []
+    assert len(table_service.retrieve_table("correctIndex").records) == len(records) + 2
+
+    with open(table_file, "a") as f:
+        f.write("30001;x\n")
+    assert table_service.load_tables_from_directory(str(data_directory), columnar,
+                                                    cache_directory=cache_directory) == \
+           [("correctIndex.table", f"Parsing error in line {len(records) + 11} near \"x\"")]
+    assert parsed_files == ["correctIndex.table"]
+
+    table_file.write_text(open("./tests/testdata/correctIndex.table").read().replace("26120", "26121") + "1;2\n")
+    table_service.load_tables_from_directory(str(data_directory), columnar, cache_directory=cache_directory)
+    assert parsed_files == ["correctIndex.table", "correctIndex.table"]
+    assert list(table_service.retrieve_table("correctIndex").records)[0] == [26121, 5001]
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_retrieve_statistics(columnar):
+    table_service.load_tables_from_directory("./tests/testdata/", columnar)
+    statistics = table_service.retrieve_statistics("hoeren")
+
+    assert statistics.num_records == 10
+    matr_nr = statistics.get_column_statistics("hoeren.MatrNr")
+    assert (matr_nr.num_distinct, matr_nr.num_nulls, matr_nr.min_value, matr_nr.max_value) == (4, 0, 26120, 29120)
+    assert matr_nr.most_common_values == [(28106, 4), (29120, 3), (27550, 2)]
+    assert matr_nr.histogram_bounds == [26120, 27550, 28106, 29120]
+    assert matr_nr.estimate_equal_count(28106) == 4
+    assert matr_nr.estimate_equal_count(26120) == 1
+    assert matr_nr.estimate_equal_count(30000) == 0
+    assert matr_nr.estimate_equal_count(None) == 0
+    assert table_service.retrieve_statistics("hoeren") is statistics
+
+    table_service.load_from_file("./tests/testdata/hoeren.table")
+    assert table_service.retrieve_statistics("hoeren") is not statistics
+
+
+def test_compute_statistics_nulls_and_histogram():
+    schema = table_service.Schema("t", ["t.a", "t.b"], [table_service.SchemaType.INT, table_service.SchemaType.VARCHAR])
+    table = table_service.Table(schema, [[i, None] for i in range(100)] + [[None, "x"], [None, "y"], [5, "x"]])
+    statistics = table_service.compute_statistics(table)
+
+    a = statistics.get_column_statistics("a")
+    assert (a.num_distinct, a.num_nulls, a.min_value, a.max_value) == (100, 2, 0, 99)
+    assert a.most_common_values == [(5, 2)]
+    assert a.histogram_bounds == [0, 9, 19, 29, 39, 49, 59, 69, 79, 89, 99]
+    assert a.estimate_equal_count(50) == 1
+
+    b = statistics.get_column_statistics("t.b")
+    assert (b.num_distinct, b.num_nulls, b.min_value, b.max_value) == (2, 100, "x", "y")
+    assert b.most_common_values == [("x", 2)]
+    assert b.histogram_bounds == []
+
+
+def test_statistics_table():
+    table_service.load_tables_from_directory("./tests/testdata/")
+    table = table_service.retrieve_table("#statistics")
+
+    assert table.schema.column_names[:5] == ["#statistics.table_name", "#statistics.column_name",
+                                             "#statistics.num_records", "#statistics.num_distinct",
+                                             "#statistics.num_nulls"]
+    assert ["hoeren", "MatrNr", 10, 4, 0, "26120", "29120", "28106 (4), 29120 (3), 27550 (2)",
+            "26120, 27550, 28106, 29120"] in table.records
+    assert not any(record[0].startswith("#") for record in table.records)
+
+
 def test_retrieve():
     table_service.load_tables_from_directory("./tests/testdata/")
     assert table_service.retrieve_table("studenten") is not None
@@ -61,6 +256,34 @@ def test_table_get_column_index():
         table.get_column_index("notFoundIndex")
 
 
+def test_schema_column_lookup():
+    schema = table_service.Schema("t", ["t.a", "t.b", "c", "s.b"],
+                                  [table_service.SchemaType.INT] * 4)
+    assert schema.get_column_index("a") == 0
+    assert schema.get_column_index("t.b") == 1
+    assert schema.get_column_index("c") == 2
+    assert schema.get_fully_qualified_column_name("a") == "t.a"
+    assert schema.get_fully_qualified_column_name("d") == "t.d"
+    with pytest.raises(table_service.AmbiguousColumnException):
+        schema.get_column_index("b")
+    with pytest.raises(table_service.TableIndexException):
+        schema.get_column_index("t.c")
+
+
+def test_schema_column_lookup_invalidation():
+    schema = table_service.Schema("t", ["t.a", "b"], [table_service.SchemaType.INT] * 2)
+    assert schema.get_column_index("t.a") == 0
+
+    schema.rename("u")
+    assert schema.get_column_index("u.a") == 0
+    with pytest.raises(table_service.TableIndexException):
+        schema.get_column_index("t.a")
+
+    schema.column_names = ["u.a", "__left__.b"]
+    assert schema.get_column_index("__left__.b") == 1
+    assert schema.get_column_index("b") == 1
+
+
 def test_table_get_item():
     table = table_service.retrieve_table("#columns")
     assert table is not None
@@ -91,6 +314,165 @@ def test_index_created_on_table_file_loading():
     assert len(table_service.retrieve_index("correctIndex", "MatrNr")) == 4
 
 
+def test_load_from_file_columnar():
+    table_service.load_from_file("./tests/testdata/studenten.table")
+    row_table = table_service.retrieve_table("studenten")
+    table_service.load_from_file("./tests/testdata/studenten.table", columnar=True)
+    table = table_service.retrieve_table("studenten")
+
+    assert isinstance(table.records, table_service.ColumnarRecords)
+    assert table.records == row_table.records
+    assert list(table.records) == row_table.records
+    assert table[2] == row_table[2]
+    assert table[1:3] == row_table[1:3]
+    assert table[3, "Name"] == row_table[3, "Name"]
+    assert list(table.get_column("Semester")) == row_table.get_column("Semester")
+    assert isinstance(table.get_column("Name"), table_service.DictionaryColumn)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_load_from_file_sections_in_any_order(tmp_path, columnar):
+    table_file = tmp_path / "reordered.table"
+    table_file.write_text("[Data]\n26120;5001\n27550;4052\n\n[Indices]\nMatrNr\n\n[Schema]\nMatrNr: int\nVorlNr: int\n")
+
+    table_service.load_from_file(str(table_file), columnar)
+
+    assert list(table_service.retrieve_table("reordered").records) == [[26120, 5001], [27550, 4052]]
+    assert table_service.retrieve_index("reordered", "MatrNr")[27550] == [[27550, 4052]]
+
+
+def test_load_from_file_index_section_after_data_section(tmp_path):
+    table_file = tmp_path / "indexLast.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Data]\n26120;5001\n27550;x\n\n[Indices]\nVorl\n")
+
+    # errors in the index section are reported before errors in the data section
+    with pytest.raises(table_service.TableParsingException, match="Column \"Vorl\" in line 10 does not exist"):
+        table_service.load_from_file(str(table_file))
+
+
+def test_columnar_records_null_values():
+    records = table_service.ColumnarRecords(
+        [table_service.SchemaType.INT, table_service.SchemaType.FLOAT, table_service.SchemaType.VARCHAR],
+        [[1, 1.5, "a"], [None, 2.5, None], [3, None, "a"], [2 ** 70, 0.0, "b"]])
+
+    assert len(records) == 4
+    assert records[1] == [None, 2.5, None]
+    assert records[-2] == [3, None, "a"]
+    assert records[3][0] == 2 ** 70
+    assert records.columns[2].dictionary == ["a", "b"]
+
+
+def test_columnar_index():
+    table_service.load_from_file("./tests/testdata/correctIndex.table", columnar=True)
+    index = table_service.retrieve_index("correctIndex", "MatrNr")
+
+    assert len(index) == 4
+    assert 26120 in index
+    assert index[26120] == [[26120, 5001]]
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_binary_file_roundtrip(tmp_path, columnar):
+    table_service.load_from_file("./tests/testdata/correctIndex.table", columnar)
+    records = list(table_service.retrieve_table("correctIndex").records)
+    binary_file = str(tmp_path / "correctIndex.ctable")
+
+    table_service.write_to_binary_file("correctIndex", binary_file)
+    table_service.initialize()
+    table_service.load_from_binary_file(binary_file)
+    table = table_service.retrieve_table("correctIndex")
+
+    assert isinstance(table.records, table_service.ColumnarRecords)
+    assert isinstance(table.records.columns[0].values, memoryview)
+    assert table.schema.column_names == ["correctIndex.MatrNr", "correctIndex.VorlNr"]
+    assert list(table.records) == records
+    assert table.records.columns[0].to_list(1, 3) == [27550, 27550]
+    assert table_service.retrieve_index("correctIndex", "MatrNr")[28106] == [[28106, 5041], [28106, 5052],
+                                                                            [28106, 5216], [28106, 5259]]
+
+
+def test_binary_file_null_values_and_strings(tmp_path):
+    column_types = [table_service.SchemaType.INT, table_service.SchemaType.FLOAT, table_service.SchemaType.VARCHAR,
+                    table_service.SchemaType.NULL]
+    records = [[1, 1.5, "äb", None], [None, 2.5, None, None], [2 ** 70, None, "", None], [3, 0.0, "äb", None]]
+    schema = table_service.Schema("mixed", ["mixed.a", "mixed.b", "mixed.c", "mixed.d"], column_types)
+    table_service._tables["mixed"] = table_service.Table(schema, records)
+    binary_file = str(tmp_path / "mixed.ctable")
+
+    table_service.write_to_binary_file("mixed", binary_file)
+    table_service.load_from_binary_file(binary_file)
+
+    assert list(table_service.retrieve_table("mixed").records) == records
+    assert table_service.retrieve_table("mixed").schema.column_types == column_types
+
+
+def test_binary_file_loaded_from_directory(tmp_path):
+    table_service.load_from_file("./tests/testdata/studenten.table")
+    records = list(table_service.retrieve_table("studenten").records)
+    table_service.write_to_binary_file("studenten", str(tmp_path / "studenten.ctable"))
+    (tmp_path / "broken.ctable").write_bytes(b"no binary table")
+
+    not_loaded = table_service.load_tables_from_directory(str(tmp_path))
+
+    assert not_loaded == [("broken.ctable", "Not a binary table file")]
+    assert list(table_service.retrieve_table("studenten").records) == records
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_ordered_index(tmp_path, columnar):
+    table_file = tmp_path / "orderedIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Indices]\nMatrNr: ordered\nVorlNr: hash\n\n"
+                          "[Data]\n28106;5041\n26120;5001\n27550;5001\n27550;4052\n")
+    table_service.load_from_file(str(table_file), columnar)
+    index = table_service.retrieve_index("orderedIndex", "MatrNr")
+
+    assert table_service.ordered_index_exists("orderedIndex", "MatrNr")
+    assert not table_service.ordered_index_exists("orderedIndex", "VorlNr")
+    assert index[26120] == [[26120, 5001]]
+    assert index.get_range_keys(26120, False) == [27550, 28106]
+    assert list(index.get_range(upper=27550)) == [[26120, 5001], [27550, 5001], [27550, 4052]]
+    assert index.count_range(27550, True, 28106, False) == 2
+
+    binary_file = str(tmp_path / "orderedIndex.ctable")
+    table_service.write_to_binary_file("orderedIndex", binary_file)
+    table_service.load_from_binary_file(binary_file)
+    assert table_service.ordered_index_exists("orderedIndex", "MatrNr")
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_composite_index(tmp_path, columnar):
+    table_file = tmp_path / "compositeIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\nVorlNr: int\n\n[Indices]\nVorlNr, MatrNr: ordered\nMatrNr,VorlNr\n\n"
+                          "[Data]\n28106;5041\n26120;5001\n27550;5001\n27550;4052\n")
+    table_service.load_from_file(str(table_file), columnar)
+    table_service._create_indices_table()
+
+    assert table_service.retrieve_index("compositeIndex", "MatrNr,VorlNr")[(27550, 5001)] == [[27550, 5001]]
+    assert table_service.retrieve_index("compositeIndex", "VorlNr,MatrNr").get_prefix_keys((5001,)) == \
+           [(5001, 26120), (5001, 27550)]
+    assert list(table_service.retrieve_table("#indices").records) == [
+        ["compositeIndex_VorlNr_MatrNr", "compositeIndex", "VorlNr"],
+        ["compositeIndex_VorlNr_MatrNr", "compositeIndex", "MatrNr"],
+        ["compositeIndex_MatrNr_VorlNr", "compositeIndex", "MatrNr"],
+        ["compositeIndex_MatrNr_VorlNr", "compositeIndex", "VorlNr"]]
+
+
+def test_composite_index_column_does_not_exist(tmp_path):
+    table_file = tmp_path / "compositeIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\n\n[Indices]\nMatrNr,Vorl\n\n[Data]\n1\n")
+
+    with pytest.raises(table_service.TableParsingException, match="Column \"Vorl\" in line 5 does not exist"):
+        table_service.load_from_file(str(table_file))
+
+
+def test_unknown_index_type(tmp_path):
+    table_file = tmp_path / "unknownIndex.table"
+    table_file.write_text("[Schema]\nMatrNr: int\n\n[Indices]\nMatrNr: sorted\n\n[Data]\n1\n")
+
+    with pytest.raises(table_service.TableParsingException, match="Unknown index type in line 5"):
+        table_service.load_from_file(str(table_file))
+
+
 def test_retrieve_non_existing_index():
     table_service.load_from_file("./tests/testdata/correctIndex.table")
     assert len(table_service.retrieve_index("correctIndex", "MatrNr")) == 4